@@ -6,11 +6,15 @@ Canadian government text. Supports multiple backends (llama.cpp, vLLM) and
 maintains a local terminology cache.
 """
 
+from __future__ import annotations
+
 import os
 import re
+import sys
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List
 import sqlite3
 
 try:
@@ -20,23 +24,43 @@ except ImportError:
     pass  # python-dotenv not available, use system environment
 
 import aiosqlite  # type: ignore # pylint: disable=import-error
+import orjson  # type: ignore # pylint: disable=import-error
 import uvicorn  # type: ignore # pylint: disable=import-error
-from fastapi import (Depends,  # type: ignore # pylint: disable=import-error
-                     FastAPI, HTTPException)
+from fastapi import FastAPI, HTTPException  # type: ignore # pylint: disable=import-error
 from fastapi.middleware.cors import CORSMiddleware # type: ignore # pylint: disable=import-error
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse # type: ignore # pylint: disable=import-error
 from fastapi.staticfiles import StaticFiles # type: ignore # pylint: disable=import-error
 from pydantic import (BaseModel,  # type: ignore # pylint: disable=import-error
-                      Field)
+                      ConfigDict, Field, TypeAdapter)
+from aiosqlitepool import (PoolConnectionAcquireTimeoutError,  # type: ignore # pylint: disable=import-error
+                           SQLiteConnectionPool)
 
 from .backends.base import InferenceBackend
 from .backends.llama_cpp import LlamaCppBackend
 from .backends.vllm_backend import VLLMBackend
 from .backends.huggingface_backend import HuggingFaceBackend
 from .backends.lmstudio_backend import LMStudioBackend
-from .backends.groq_backend import GroqBackend
-from .prompts.schema import (AcronymResponse, ModelInfo,
+from .backends.groq_backend import GroqBackend, close_http_clients
+from .prompts.schema import (AcronymExpansion, AcronymResponse, ModelInfo,
                              SimplificationResponse, TranslationResponse)
 
+# Candidate acronyms: standalone runs of two or more capital letters
+ACRONYM_PATTERN = re.compile(r'\b[A-Z]{2,}\b')
+
+# Bounded LRU of acronym -> (expansion, definition, source_url), with None
+# recorded for tokens the database does not know. The terms database is only
+# written by tools/seed_terms.py, so restart the server after reseeding.
+ACRONYM_CACHE_SIZE = 1024
+_acronym_cache: OrderedDict[str, tuple[str, str, str] | None] = OrderedDict()
+
+
+def _remember_acronym(acronym: str, row: tuple[str, str, str] | None) -> None:
+    """Store an acronym lookup result, evicting the least recently used entry."""
+    _acronym_cache[acronym] = row
+    _acronym_cache.move_to_end(acronym)
+    if len(_acronym_cache) > ACRONYM_CACHE_SIZE:
+        _acronym_cache.popitem(last=False)
+
 
 def normalize_language_input(language_input: str) -> str:
     """
@@ -81,10 +105,22 @@ class Config:
     TERMS_DB = os.getenv("MAPLECLEAR_TERMS_DB", "data/terms.sqlite")
     HOST = os.getenv("MAPLECLEAR_HOST", "127.0.0.1")
     PORT = int(os.getenv("MAPLECLEAR_PORT", "11434"))
+    DEV = os.getenv("MAPLECLEAR_DEV") == "1"
+    WORKERS = int(os.getenv("MAPLECLEAR_WORKERS", "1"))
+    # Re-validate responses built from trusted local data (debugging aid)
+    VALIDATE_RESPONSES = os.getenv("MAPLECLEAR_VALIDATE_RESPONSES") == "1"
+
+
+# Backends that load model weights into the server process; every extra
+# worker would hold another full copy. Groq and LM Studio already run the
+# model in a separate shared process, so their workers stay lightweight.
+IN_PROCESS_BACKENDS = {"llama.cpp", "vllm", "huggingface"}
 
 
 class SimplifyRequest(BaseModel):
     """Request/Response Models"""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     text: str = Field(..., description="Text to simplify")
     target_grade: int = Field(
         7, description="Target reading grade level (6-8)")
@@ -96,6 +132,8 @@ class SimplifyRequest(BaseModel):
 
 class TranslateRequest(BaseModel):
     """Request model for translation."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     text: str = Field(..., description="Text to translate")
     target_language: str = Field(
         "French", description="Target language name (French, Inuktitut, etc.)")
@@ -107,17 +145,87 @@ class TranslateRequest(BaseModel):
 
 class AcronymRequest(BaseModel):
     """Request model for acronym expansion."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     text: str = Field(..., description="Text containing potential acronyms")
     context: str = Field("", description="Context to help with disambiguation")
 
 
 class HealthResponse(BaseModel):
     """Response model for health check."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     status: str
     model_info: ModelInfo
     local_mode: bool
     backend: str
-    adapters: List[str]
+    adapters: list[str]
+
+
+# Built once so /health serializes without re-resolving the schema per call
+HEALTH_ADAPTER = TypeAdapter(HealthResponse)
+
+
+def _model_response(model: BaseModel) -> Response:
+    """Serialize an already-validated model directly to a JSON response.
+
+    Returning a Response skips FastAPI's re-validation against response_model
+    and its jsonable_encoder pass; pydantic-core writes the JSON in one step.
+    """
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
+# Applied once per pooled connection: WAL lets readers run concurrently,
+# and a 20MB page cache plus 256MB mmap keep the lookup B-trees resident
+TERMS_DB_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+    PRAGMA mmap_size=268435456;
+"""
+
+
+async def _connect_terms_db() -> aiosqlite.Connection:
+    """Open a new, tuned connection to the terms database for the pool."""
+    conn = await aiosqlite.connect(Config.TERMS_DB)
+    await conn.executescript(TERMS_DB_PRAGMAS)
+    return conn
+
+
+async def _init_terms_schema() -> None:
+    """Create the terms database schema if it is missing (see tools/seed_terms.py)."""
+    db_path = Path(Config.TERMS_DB)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    async with aiosqlite.connect(db_path) as conn:
+        await conn.executescript("""
+            CREATE TABLE IF NOT EXISTS acronyms (
+                id INTEGER PRIMARY KEY,
+                acronym TEXT,
+                expansion TEXT,
+                definition TEXT,
+                source_url TEXT,
+                language TEXT DEFAULT 'en',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(acronym, language)
+            );
+            CREATE TABLE IF NOT EXISTS terms (
+                id INTEGER PRIMARY KEY,
+                term_en TEXT,
+                term_fr TEXT,
+                definition_en TEXT,
+                definition_fr TEXT,
+                category TEXT,
+                official BOOLEAN DEFAULT FALSE,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(term_en, term_fr)
+            );
+            CREATE INDEX IF NOT EXISTS idx_acronym ON acronyms(acronym);
+            -- Lets case-insensitive prefix matches (LIKE 'CR%') seek instead of scan
+            CREATE INDEX IF NOT EXISTS idx_acronym_nocase
+                ON acronyms(acronym COLLATE NOCASE);
+        """)
+        await conn.commit()
 
 
 @asynccontextmanager
@@ -158,6 +266,20 @@ async def lifespan(fastapi_app: FastAPI):
             raise ValueError(f"Unknown backend: {Config.BACKEND}")
 
         await fastapi_app.state.backend.initialize()
+        # Model metadata is fixed once the backend is initialized
+        fastapi_app.state.model_info = await fastapi_app.state.backend.get_model_info()
+
+        # Schema is bootstrapped once here so the request path only has to
+        # borrow a long-lived pooled connection with a warm page cache
+        try:
+            await _init_terms_schema()
+        except (sqlite3.Error, OSError) as db_error:
+            # No pool: acronym lookups degrade to empty results; the backend still serves
+            print(f"⚠️ Terms database unavailable: {db_error}")
+            fastapi_app.state.terms_pool = None
+        else:
+            fastapi_app.state.terms_pool = SQLiteConnectionPool(
+                _connect_terms_db)
         print(
             f"✅ MapleClear server ready on http://{Config.HOST}:{Config.PORT}")
 
@@ -169,14 +291,19 @@ async def lifespan(fastapi_app: FastAPI):
         yield
     finally:
         # Shutdown logic
+        if getattr(fastapi_app.state, 'terms_pool', None) is not None:
+            await fastapi_app.state.terms_pool.close()
         if hasattr(fastapi_app.state, 'backend') and fastapi_app.state.backend:
             await fastapi_app.state.backend.cleanup()
+        # Backstop for shared Groq clients left open by backends that never cleaned up
+        await close_http_clients()
 
 app = FastAPI(
     title="MapleClear Inference Server",
     description="Local AI inference for simplifying Canadian government text",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Cross-origin access is limited to browser-extension origins (the extension
@@ -192,42 +319,50 @@ app.add_middleware(
     CORSMiddleware,
     allow_origin_regex=ALLOWED_ORIGIN_REGEX,
     allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # The extension only issues GET/POST with a JSON body; explicit lists and
+    # a day-long max_age let browsers cache preflights instead of repeating them
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
+    max_age=86400,
 )
 
 
 def get_backend() -> InferenceBackend:
-    """Dependency to get the current backend instance."""
-    return app.state.backend
+    """Get the current backend instance, set once at startup."""
+    backend = getattr(app.state, "backend", None)
+    if backend is None:
+        raise HTTPException(status_code=503, detail="Backend not initialized")
+    return backend
 
 
-async def get_terms_db():
-    """Get database connection for terms."""
-    db_path = Path(Config.TERMS_DB)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    return await aiosqlite.connect(db_path)
+async def _sse_events(chunks: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """Frame text chunks as server-sent events, ending with a done event."""
+    try:
+        async for chunk in chunks:
+            yield b"data: " + orjson.dumps(chunk) + b"\n\n"
+        yield b"event: done\ndata: {}\n\n"
+    except Exception as e:  # pylint: disable=broad-except  # noqa: BLE001
+        # Headers are already sent, so any failure can only be reported in-band
+        yield b"event: error\ndata: " + orjson.dumps(str(e)) + b"\n\n"
 
 
 @app.get("/health", response_model=HealthResponse)
-async def health_check(backend: InferenceBackend = Depends(get_backend)):
+async def health_check():
     """Health check endpoint with model information."""
-    model_info = await backend.get_model_info()
-    return HealthResponse(
+    health = HealthResponse(
         status="healthy",
-        model_info=model_info,
+        model_info=app.state.model_info,
         local_mode=True,
         backend=Config.BACKEND,
         adapters=Config.ADAPTERS
     )
+    return Response(HEALTH_ADAPTER.dump_json(health), media_type="application/json")
 
 
 @app.post("/simplify", response_model=SimplificationResponse)
-async def simplify_text(
-    request: SimplifyRequest,
-    backend: InferenceBackend = Depends(get_backend)
-):
+async def simplify_text(request: SimplifyRequest):
     """Simplify text to plain language."""
+    backend = get_backend()
     try:
         response = await backend.simplify(
             text=request.text,
@@ -235,18 +370,29 @@ async def simplify_text(
             preserve_acronyms=request.preserve_acronyms,
             context=request.context
         )
-        return response
+        return _model_response(response)
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Simplification failed: {str(e)}") from e
 
 
+@app.post("/simplify/stream")
+async def simplify_text_stream(request: SimplifyRequest):
+    """Stream simplified text as server-sent events."""
+    backend = get_backend()
+    chunks = backend.simplify_stream(
+        text=request.text,
+        target_grade=request.target_grade,
+        preserve_acronyms=request.preserve_acronyms,
+        context=request.context
+    )
+    return StreamingResponse(_sse_events(chunks), media_type="text/event-stream")
+
+
 @app.post("/translate", response_model=TranslationResponse)
-async def translate_text(
-    request: TranslateRequest,
-    backend: InferenceBackend = Depends(get_backend)
-):
+async def translate_text(request: TranslateRequest):
     """Translate text to target language."""
+    backend = get_backend()
     try:
         # Normalize language input to full name
         normalized_language = normalize_language_input(request.target_language)
@@ -257,50 +403,83 @@ async def translate_text(
             preserve_terms=request.preserve_terms,
             experimental=request.experimental
         )
-        return response
+        return _model_response(response)
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Translation failed: {str(e)}") from e
 
 
+@app.post("/translate/stream")
+async def translate_text_stream(request: TranslateRequest):
+    """Stream translated text as server-sent events."""
+    backend = get_backend()
+    chunks = backend.translate_stream(
+        text=request.text,
+        target_language=normalize_language_input(request.target_language),
+        preserve_terms=request.preserve_terms,
+        experimental=request.experimental
+    )
+    return StreamingResponse(_sse_events(chunks), media_type="text/event-stream")
+
+
 @app.post("/expand-acronyms", response_model=AcronymResponse)
 async def expand_acronyms(request: AcronymRequest):
     """Find and expand acronyms in text."""
     try:
-        # Simple regex to find potential acronyms
-        potential_acronyms = re.findall(r'\b[A-Z]{2,}\b', request.text)
+        potential_acronyms = ACRONYM_PATTERN.findall(request.text)
 
         found_acronyms = []
 
-        # Try to connect to database
         try:
-            db_path = Path(Config.TERMS_DB)
-            db_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Use a simpler synchronous approach to avoid threading issues
-            with sqlite3.connect(db_path) as conn:
-                cursor = conn.cursor()
-
-                for acronym in set(potential_acronyms):
-                    cursor.execute(
-                        "SELECT expansion, definition, source_url FROM acronyms WHERE acronym = ?",
-                        (acronym,)
+            unique_acronyms = list(dict.fromkeys(potential_acronyms))
+            rows_by_acronym = {}
+            misses = []
+            for acronym in unique_acronyms:
+                if acronym in _acronym_cache:
+                    _acronym_cache.move_to_end(acronym)
+                    rows_by_acronym[acronym] = _acronym_cache[acronym]
+                else:
+                    misses.append(acronym)
+
+            terms_pool = getattr(app.state, "terms_pool", None)
+            if misses and terms_pool is not None:
+                # One IN-list query instead of a round-trip per acronym; NOCASE
+                # matches stored spellings like "Cra" and seeks idx_acronym_nocase
+                placeholders = ",".join("?" * len(misses))
+                fetched = {}
+                # Borrowed here, inside the try, so a locked or exhausted
+                # database degrades to an empty result instead of a 500
+                async with terms_pool.connection() as db:
+                    rows = await db.execute_fetchall(
+                        "SELECT acronym, expansion, definition, source_url FROM acronyms "
+                        f"WHERE acronym COLLATE NOCASE IN ({placeholders})",
+                        misses
                     )
-                    row = cursor.fetchone()
-                    if row:
-                        found_acronyms.append({
-                            "acronym": acronym,
-                            "expansion": row[0],
-                            "definition": row[1],
-                            "source_url": row[2],
-                            "confidence": 1.0,
-                            "source": "local_cache"
-                        })
-        except (sqlite3.Error, OSError) as db_error:
+                for row in rows:
+                    # Keep the first row when an acronym exists in both languages
+                    fetched.setdefault(row[0].upper(), tuple(row[1:]))
+                for acronym in misses:
+                    rows_by_acronym[acronym] = fetched.get(acronym)
+                    _remember_acronym(acronym, rows_by_acronym[acronym])
+
+            # Rows come from our own seeded database, so validation is skipped by default
+            build = AcronymExpansion if Config.VALIDATE_RESPONSES else AcronymExpansion.model_construct
+            for acronym in unique_acronyms:
+                row = rows_by_acronym.get(acronym)
+                if row:
+                    found_acronyms.append(build(
+                        acronym=acronym,
+                        expansion=row[0],
+                        definition=row[1],
+                        source_url=row[2],
+                        confidence=1.0,
+                        source="local_cache"
+                    ))
+        except (sqlite3.Error, OSError, PoolConnectionAcquireTimeoutError) as db_error:
             print(f"Database error: {db_error}")
             # If database fails, just return empty list
 
-        return AcronymResponse(acronyms=found_acronyms)
+        return _model_response(AcronymResponse.model_construct(acronyms=found_acronyms))
 
     except Exception as e:
         raise HTTPException(
@@ -312,9 +491,18 @@ if Path("demo").exists():
 
 
 if __name__ == "__main__":
+    workers = Config.WORKERS
+    if workers > 1 and Config.BACKEND in IN_PROCESS_BACKENDS:
+        print(f"⚠️ {Config.BACKEND} loads the model in-process; "
+              "point MAPLECLEAR_BACKEND at lmstudio to share one model across workers")
+        workers = 1
     uvicorn.run(
         "server.app:app",
         host=Config.HOST,
         port=Config.PORT,
-        reload=True
+        # uvloop and httptools ship with uvicorn[standard]; uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=workers,
+        reload=Config.DEV and workers == 1
     )
@@ -1,23 +1,140 @@
 """
 Base class for inference backends.
 """
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
+from pathlib import Path
+from typing import Any
 
 import textstat # type: ignore # pylint: disable=import-error
 
 from ..prompts.schema import (AcronymResponse, ModelInfo, # type: ignore #pylint: disable=no-name-in-module
                               SimplificationResponse, TranslationResponse) # type: ignore #pylint: disable=no-name-in-module
 
+# Finished responses kept per backend for repeated identical requests
+RESULT_CACHE_SIZE = 512
+
+# Readability grades kept per process; longer texts are graded uncached
+# so the cache can't pin large documents in memory
+READABILITY_CACHE_SIZE = 2048
+READABILITY_CACHE_MAX_CHARS = 8192
+
+# str.translate table deleting sentence-ending punctuation
+SENTENCE_TERMINATORS = str.maketrans("", "", ".!?")
+
+
+def text_digest(value: str) -> str:
+    """Short stable hash of a string, used for cache keys."""
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def drain_queue(queue: asyncio.Queue | None) -> list[Any]:
+    """Remove and return everything currently waiting in a queue."""
+    items = []
+    while queue is not None and not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+async def collect_batch(queue: asyncio.Queue, batch: list[Any], max_batch: int,
+                        max_wait: float) -> None:
+    """Wait for one queued item, then add more until max_batch or max_wait seconds pass.
+
+    Items go straight into the caller's list, so a worker cancelled mid-collection
+    still holds everything it dequeued and can fail it (see fail_batch).
+    """
+    batch.append(await queue.get())
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait
+    while len(batch) < max_batch:
+        if not queue.empty():
+            batch.append(queue.get_nowait())
+            continue
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return
+        getter = asyncio.ensure_future(queue.get())
+        try:
+            # asyncio.wait times out without raising, so this needn't care that
+            # asyncio.TimeoutError only became the builtin in Python 3.11
+            await asyncio.wait((getter,), timeout=remaining)
+        finally:
+            # A getter left pending would swallow a later request
+            if not getter.done():
+                getter.cancel()
+        if not getter.done():
+            return
+        batch.append(getter.result())
+
+
+def fail_batch(batch: Iterable[tuple[Any, asyncio.Future]]) -> None:
+    """Fail the still-pending futures of (prompt, future) micro-batch entries at shutdown."""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(RuntimeError("backend shut down"))
+
+
+@functools.lru_cache(maxsize=64)
+def _prompt_pieces(template: str, fields: tuple[tuple[str, Any], ...]) -> tuple[str, ...]:
+    """Render everything in a prompt template except the {text} slots."""
+    values = dict(fields)
+    return tuple(piece.format(**values) for piece in template.split("{text}"))
+
+
+def _readability(text: str) -> float:
+    """Calculate reading grade level using textstat."""
+    try:
+        return textstat.flesch_kincaid_grade(text)  # type: ignore[attr-defined]
+    except (ImportError, AttributeError):
+        # Fallback: simple heuristic based on sentence and word length.
+        # Counting terminators avoids materializing one string per sentence;
+        # deleting all three in one translate() pass is a single C-level scan,
+        # and map(len, ...) keeps the character total out of the interpreter.
+        sentence_count = len(text) - len(text.translate(SENTENCE_TERMINATORS)) + 1
+        words = text.split()
+
+        if not words:
+            return 0.0
+
+        avg_sentence_length = len(words) / sentence_count
+        avg_word_length = sum(map(len, words)) / len(words)
+
+        # Simplified Flesch-Kincaid approximation
+        return 0.39 * avg_sentence_length + 11.8 * avg_word_length - 15.59
+
+
+@functools.lru_cache(maxsize=READABILITY_CACHE_SIZE)
+def _cached_readability(text: str) -> float:
+    """Memoized _readability; the same original text is graded on every request for it."""
+    return _readability(text)
+
+
+@functools.lru_cache(maxsize=8)
+def read_prompt_file(task: str) -> str | None:
+    """Return the prompt override in server/prompts/<task>.txt, read once per process."""
+    template_path = Path(f"server/prompts/{task}.txt")
+    if template_path.exists():
+        return template_path.read_text(encoding="utf-8")
+    return None
+
 
 class InferenceBackend(ABC):
     """Abstract base class for AI inference backends."""
 
-    def __init__(self, model_path: str, adapters: Optional[List[str]] = None):
+    def __init__(self, model_path: str, adapters: list[str] | None = None):
         self.model_path = model_path
         self.adapters = adapters or []
         self.model = None
         self.tokenizer = None
+        # LRU of entry-point arguments -> finished response model
+        self._result_cache: OrderedDict[tuple, Any] = OrderedDict()
 
     @abstractmethod
     async def initialize(self) -> None:
@@ -56,6 +173,44 @@ class InferenceBackend(ABC):
         """TODO: Translate text to target language."""
         pass # pylint: disable=unnecessary-pass
 
+    async def simplify_stream(
+        self,
+        text: str,
+        target_grade: int = 7,
+        preserve_acronyms: bool = True,
+        context: str = ""
+    ) -> AsyncIterator[str]:
+        """Stream simplified text in chunks as it is generated.
+
+        Backends without incremental decoding yield the whole result once.
+        """
+        response = await self.simplify(
+            text=text,
+            target_grade=target_grade,
+            preserve_acronyms=preserve_acronyms,
+            context=context
+        )
+        yield response.plain
+
+    async def translate_stream(
+        self,
+        text: str,
+        target_language: str = "French",
+        preserve_terms: bool = True,
+        experimental: bool = False
+    ) -> AsyncIterator[str]:
+        """Stream translated text in chunks as it is generated.
+
+        Backends without incremental decoding yield the whole result once.
+        """
+        response = await self.translate(
+            text=text,
+            target_language=target_language,
+            preserve_terms=preserve_terms,
+            experimental=experimental
+        )
+        yield response.translated
+
     @abstractmethod
     async def expand_acronyms(
         self,
@@ -65,20 +220,57 @@ class InferenceBackend(ABC):
         """TODO: Find and expand acronyms in text."""
         pass # pylint: disable=unnecessary-pass
 
-    def _calculate_readability(self, text: str) -> float:
-        """Calculate reading grade level using textstat."""
-        try:
-            return textstat.flesch_kincaid_grade(text)  # type: ignore[attr-defined]
-        except (ImportError, AttributeError):
-            # Fallback: simple heuristic based on sentence and word length
-            sentences = text.split('.')
-            words = text.split()
+    async def process_all(
+        self,
+        text: str,
+        target_grade: int = 7,
+        target_language: str = "French",
+        context: str = ""
+    ) -> tuple[SimplificationResponse, TranslationResponse, AcronymResponse]:
+        """Simplify, translate and expand acronyms for one text concurrently.
+
+        The three requests overlap instead of running back-to-back.
+        """
+        simplified, translated, acronyms = await asyncio.gather(
+            self.simplify(text=text, target_grade=target_grade, context=context),
+            self.translate(text=text, target_language=target_language),
+            self.expand_acronyms(text=text, context=context)
+        )
+        return simplified, translated, acronyms
+
+    def _get_cached_result(self, key: tuple) -> Any:
+        """Return a previously built response for these arguments, if any."""
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+        return cached
 
-            if not sentences or not words:
-                return 0.0
+    def _cache_result(self, key: tuple | None, response: Any) -> Any:
+        """Remember a successful response and return it; a None key skips caching."""
+        if key is not None:
+            self._result_cache[key] = response
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return response
 
-            avg_sentence_length = len(words) / len(sentences)
-            avg_word_length = sum(len(word) for word in words) / len(words)
+    def _render_prompt(self, template: str, text: str, **fields: Any) -> str:
+        """Fill a prompt template, reusing the pre-rendered text around {text}.
 
-            # Simplified Flesch-Kincaid approximation
-            return 0.39 * avg_sentence_length + 11.8 * avg_word_length - 15.59
+        Identical settings always yield byte-identical prompt prefixes, which
+        also lets prefix-caching inference servers reuse their KV cache.
+        """
+        return text.join(_prompt_pieces(template, tuple(sorted(fields.items()))))
+
+    async def _readability_grades(self, simplified: str, original: str) -> tuple[float, float]:
+        """Grade both texts concurrently in worker threads, off the event loop."""
+        simplified_grade, original_grade = await asyncio.gather(
+            asyncio.to_thread(self._calculate_readability, simplified),
+            asyncio.to_thread(self._calculate_readability, original)
+        )
+        return simplified_grade, original_grade
+
+    def _calculate_readability(self, text: str) -> float:
+        """Calculate reading grade level, memoized for texts up to a size cap."""
+        if len(text) <= READABILITY_CACHE_MAX_CHARS:
+            return _cached_readability(text)
+        return _readability(text)
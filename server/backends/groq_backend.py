@@ -2,10 +2,22 @@
 Groq backend implementation for MapleClear.
 Uses Groq's fast inference API for gpt-oss models.
 """
+from __future__ import annotations
+
 import os
+import asyncio
 import json
+import logging
+import random
 import re
-from typing import Optional, List
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any, ClassVar
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply
+import orjson  # type: ignore # pylint: disable=import-error
 
 try:
     import httpx  # type: ignore
@@ -14,10 +26,19 @@ except ImportError:
     HTTPX_AVAILABLE = False
     httpx = None
 
-from .base import InferenceBackend
+try:
+    __import__('h2')
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from .base import InferenceBackend, text_digest
 from ..prompts.schema import (SimplificationResponse, TranslationResponse,
                               AcronymResponse, AcronymExpansion, ModelInfo)
 
+if TYPE_CHECKING:
+    from typing import Self
+
 
 class GroqError(Exception):
     """Custom exception for Groq backend errors."""
@@ -31,20 +52,393 @@ class GroqAPIError(GroqError):
     """Exception for Groq API errors."""
 
 
+logger = logging.getLogger(__name__)
+
 # Constants
 GROQ_API_BASE = "https://api.groq.com/openai/v1"
 DEFAULT_MODEL = "openai/gpt-oss-20b"
 DEMO_MODE_MESSAGE = "🚧 Running in demo mode"
+RESPONSE_CACHE_SIZE = 512
+# Transient statuses worth retrying; other 4xx errors will not succeed on retry
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+MAX_BACKOFF_SECONDS = 30.0
+MAX_COMPLETION_TOKENS = 2048
+# Time-to-headers above this (averaged over a full window of calls) counts as
+# overload; slowness alone never shrinks concurrency below LATENCY_MIN_INFLIGHT
+LATENCY_TARGET_SECONDS = float(os.getenv("GROQ_TARGET_LATENCY", "2.0"))
+LATENCY_WINDOW = 20
+LATENCY_MIN_INFLIGHT = 4
+# Consecutive transport/5xx failures that open the circuit, and for how long
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN = 15.0
+
+# Patterns used by GroqBackend._extract_clean_text to strip model reasoning
+WE_NEED_PATTERN = re.compile(r'^We need to.*?\. ', re.MULTILINE)
+I_NEED_PATTERN = re.compile(r'^I need to.*?\. ', re.MULTILINE)
+THE_IS_TO_PATTERN = re.compile(r'^The.*?is to.*?\. ', re.MULTILINE)
+PLAIN_SIMPLIFIED_PATTERN = re.compile(r'.*?with plain simplified text.*?\. ', re.DOTALL)
+PROVIDE_PATTERN = re.compile(r'.*?Provide.*?\. ', re.DOTALL)
+PLAIN_FIELD_PATTERN = re.compile(r'"plain"\s*:\s*"([^"]*)"', re.DOTALL)
+REASONING_PATTERN = re.compile('|'.join(map(re.escape, (
+    'we need to', 'i need to', 'the goal is to', 'let\'s', 'first,', 'second,',
+    'provide', 'ensure', 'make sure', 'it is important', 'we can', 'we should'
+))), re.IGNORECASE)
+# Groq reports rate-limit resets as durations like "2m59.56s" or "120ms"
+RESET_DURATION_PATTERN = re.compile(r'([\d.]+)(ms|h|m|s)')
+RESET_UNIT_SECONDS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+# Shared AsyncClients keyed by (base_url, api_key) so every backend instance
+# reuses the same warm connection pool; closed when the last user releases it.
+# A threading lock, because an asyncio.Lock made at import binds to whichever
+# event loop first uses it; it is never held across an await.
+_CLIENTS: dict[tuple, Any] = {}
+_CLIENT_REFS: dict[tuple, int] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+async def _acquire_client(api_key: str, pool_size: int):
+    """Return the shared AsyncClient for this API key, creating it on first use."""
+    key = (GROQ_API_BASE, api_key)
+    with _CLIENT_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = _CLIENTS[key] = httpx.AsyncClient(
+                base_url=GROQ_API_BASE,
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json"
+                },
+                # Fail fast on connect/pool waits; reads cover full generations
+                timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+                # Multiplex concurrent completions over one TLS connection
+                http2=HTTP2_AVAILABLE,
+                # Keep warm TLS connections around so bursts of calls skip the handshake
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                    keepalive_expiry=60.0
+                )
+            )
+        _CLIENT_REFS[key] = _CLIENT_REFS.get(key, 0) + 1
+        return client
+
+
+async def _release_client(api_key: str) -> None:
+    """Drop one reference to a shared client, closing it when unused."""
+    key = (GROQ_API_BASE, api_key)
+    with _CLIENT_LOCK:
+        refs = _CLIENT_REFS.get(key, 0) - 1
+        if refs > 0:
+            _CLIENT_REFS[key] = refs
+            return
+        _CLIENT_REFS.pop(key, None)
+        client = _CLIENTS.pop(key, None)
+    if client is not None:
+        await client.aclose()
+
+# Canned demo-mode responses, serialized once; checked in this order
+DEMO_PAYLOADS = {
+    "simplify": orjson.dumps({
+        "plain": "This is a simplified version of the text. Complex terms have been replaced with simpler alternatives.",  # pylint: disable=line-too-long
+        "rationale": ["Replaced technical jargon", "Shortened sentences", "Used common words"],  # pylint: disable=line-too-long
+        "cautions": ["Some nuance may be lost in simplification"],
+        "readability_grade": 7.2
+    }).decode(),
+    "translate": orjson.dumps({
+        "translated": "Ceci est une traduction du texte en français.",
+        "target_language": "French",
+        "preserved_terms": ["specific terminology"],
+        "confidence": 0.85,
+        "cautions": ["Some context may be lost in translation"]
+    }).decode(),
+    "acronym": orjson.dumps({
+        "expansions": [
+            {"acronym": "API", "expansion": "Application Programming Interface",
+                "confidence": 0.95},
+            {"acronym": "JSON", "expansion": "JavaScript Object Notation",
+                "confidence": 0.98}
+        ]
+    }).decode(),
+}
+# Parsed form of each payload, so demo-mode inference skips the JSON round trip
+DEMO_RESULTS = {payload: orjson.loads(payload) for payload in DEMO_PAYLOADS.values()}
+
+
+async def close_http_clients() -> None:
+    """Close every shared Groq client regardless of outstanding references."""
+    with _CLIENT_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+        _CLIENT_REFS.clear()
+    for client in clients:
+        await client.aclose()
+
+
+
+def _parse_reset_duration(value: str | None) -> float:
+    """Convert a Groq rate-limit reset duration header into seconds."""
+    if not value:
+        return 0.0
+    return sum(float(amount) * RESET_UNIT_SECONDS[unit]
+               for amount, unit in RESET_DURATION_PATTERN.findall(value))
+
+
+class AIMDLimiter:
+    """Concurrency limit with additive increase and multiplicative decrease.
+
+    Each success raises the limit by a fixed step; each overload response
+    (429/5xx) halves it, so concurrency settles just under what the API accepts.
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1,
+                 increase: float = 0.5, decrease: float = 0.5):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(maximum)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> Self:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """Additively grow the limit after a successful call."""
+        self.limit = min(float(self.maximum), self.limit + self.increase)
+
+    def record_overload(self, floor: int = 0) -> None:
+        """Multiplicatively shrink the limit, to no less than `floor` (or the minimum)."""
+        self.limit = max(float(self.minimum), float(floor), self.limit * self.decrease)
+
+
+class SlidingWindowLimiter:
+    """Admit at most `capacity` units of weight in any `window`-second span.
+
+    A capacity of 0 disables the limiter. acquire() returns a reservation
+    that settle() can later correct to the weight actually used.
+    """
+
+    def __init__(self, capacity: int, window: float = 60.0):
+        self.capacity = capacity
+        self.window = window
+        self._events: deque[list] = deque()
+        self._used = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, weight: int = 1) -> list | None:
+        """Wait until `weight` more units fit in the current window."""
+        if self.capacity <= 0:
+            return None
+        weight = min(weight, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._events and now - self._events[0][0] >= self.window:
+                    self._used -= self._events.popleft()[1]
+                if self._used + weight <= self.capacity:
+                    reservation = [now, weight]
+                    self._events.append(reservation)
+                    self._used += weight
+                    return reservation
+                await asyncio.sleep(self._events[0][0] + self.window - now)
+
+    def settle(self, reservation: list | None, weight: int) -> None:
+        """Replace a reservation's weight with the amount actually used."""
+        # Expired reservations no longer count (or are about to be dropped)
+        if reservation is None or time.monotonic() - reservation[0] >= self.window:
+            return
+        weight = min(weight, self.capacity)
+        self._used += weight - reservation[1]
+        reservation[1] = weight
+
+
+class StreamingFieldDecoder:
+    """Incrementally decode one JSON string field from streamed model output.
+
+    feed() takes raw text chunks of a JSON object as they arrive and returns
+    whatever new characters of the field's value can be decoded so far, so
+    the value can be forwarded before the object is complete.
+    """
+
+    def __init__(self, field: str):
+        self._marker = re.compile(r'"' + re.escape(field) + r'"\s*:\s*"')
+        self._buffer = ""
+        self._emitted = -1
+        self.started = False
+        self.finished = False
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk and return the newly decodable part of the field value."""
+        if self.finished:
+            return ""
+        self._buffer += chunk
+        if not self.started:
+            match = self._marker.search(self._buffer)
+            if not match:
+                return ""
+            self.started = True
+            self._emitted = match.end()
+
+        buffer = self._buffer
+        i = self._emitted
+        safe_end = i
+        while i < len(buffer):
+            char = buffer[i]
+            if char == '"':
+                self.finished = True
+                safe_end = i
+                break
+            if char == '\\':
+                # Only decode complete escapes; \uXXXX may need its low surrogate too
+                if i + 1 >= len(buffer):
+                    break
+                width = 2
+                if buffer[i + 1] == 'u':
+                    width = 6
+                    if buffer[i + 2:i + 4].lower() in ('d8', 'd9', 'da', 'db'):
+                        width = 12
+                if i + width > len(buffer):
+                    break
+                i += width
+            else:
+                i += 1
+            safe_end = i
+
+        raw = buffer[self._emitted:safe_end]
+        self._emitted = safe_end
+        if not raw:
+            return ""
+        # stdlib json here: orjson rejects the lone surrogates a model may emit.
+        # strict=False accepts the raw newlines and tabs models put in strings;
+        # anything still undecodable (e.g. a bad escape like \x) passes through
+        # as-is rather than aborting the stream.
+        try:
+            return json.loads(f'"{raw}"', strict=False)
+        except ValueError:
+            return raw
+
+
+def _find_first_json_object(content: str) -> str | None:
+    """Return the first balanced {...} span in content, ignoring braces in strings."""
+    start = content.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(content)):
+        char = content[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return content[start:i + 1]
+    return None
 
 
 class GroqBackend(InferenceBackend):
     """Backend using Groq's API for fast gpt-oss inference."""
 
-    def __init__(self, model_path: str = "", adapters: Optional[List[str]] = None):
+    PROMPT_TEMPLATES: ClassVar[dict[str, str]] = {
+        # pylint: disable=line-too-long
+        "simplify": """You are a helpful assistant that simplifies Canadian government text. 
+
+IMPORTANT: Respond with ONLY valid JSON. Do not include any explanation, reasoning, or other text.
+
+Task: Simplify this text to Grade {target_grade} reading level while preserving accuracy and acronyms.
+
+Text: {text}
+
+Response format (JSON only):
+{{
+    "plain": "your simplified text here",
+    "rationale": ["briefly explain major changes"],
+    "cautions": ["any important warnings"],
+    "readability_grade": 7.0
+}}""",
+        "translate": """You are a helpful translator for Canadian government content.
+
+IMPORTANT: Respond with ONLY the translated text. Do not include any explanations or reasoning.
+
+Translate this text to {target_language}:
+
+{text}
+
+TRANSLATED TEXT:""",
+        "acronym": """Find and expand all acronyms in this text. Respond with ONLY valid JSON.
+
+{text}
+
+Response format (JSON only):
+{{
+    "expansions": [
+        {{
+            "acronym": "acronym",
+            "expansion": "full expansion", 
+            "confidence": 0.9
+        }}
+    ]
+}}"""
+    }
+    # Literal text each rendered prompt starts with, used to recognise the task
+    PROMPT_HEADS: ClassVar[dict[str, str]] = {
+        task: template.split("{", 1)[0] for task, template in PROMPT_TEMPLATES.items()
+    }
+
+    def __init__(self, model_path: str = "", adapters: list[str] | None = None):
         super().__init__(model_path or DEFAULT_MODEL, adapters or [])
         self.api_key = None
         self.client = None
         self.demo_mode = False
+        # True once a client is connected and not in demo mode; the single
+        # guard checked on the request path
+        self._live = False
+        max_inflight = int(os.getenv("GROQ_MAX_INFLIGHT", "16"))
+        # Keep at least one pooled connection per in-flight call so concurrent
+        # requests never wait on the pool (over HTTP/2 they share a connection)
+        self.pool_size = max(int(os.getenv("GROQ_POOL_SIZE", "64")), max_inflight)
+        # Caps in-flight Groq calls so bursts queue here instead of overflowing
+        # the pool, backing off when Groq signals overload
+        self._inflight = AIMDLimiter(max_inflight)
+        # Monotonic time before which no new request is sent (rate-limit reset)
+        self._paused_until = 0.0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
+        self.max_retries = int(os.getenv("GROQ_MAX_RETRIES", "3"))
+        # Client-side request/token budgets matching the account's Groq limits,
+        # so bursts wait here instead of being rejected with 429s (0 = off)
+        self._rpm_limiter = SlidingWindowLimiter(int(os.getenv("GROQ_MAX_RPM", "0")))
+        self._tpm_limiter = SlidingWindowLimiter(int(os.getenv("GROQ_MAX_TPM", "0")))
+        # Constant completion fields encoded once, without the closing brace
+        self._request_prefix = orjson.dumps({
+            "model": self.model_path,
+            "max_tokens": MAX_COMPLETION_TOKENS,
+            "temperature": 0.1,
+            "stream": True
+        })[:-1]
+        # Exact-match LRU of prompt digest -> extracted response content
+        self._response_cache: OrderedDict[str, dict[str, Any] | str] = OrderedDict()
 
     async def initialize(self) -> None:
         """Initialize Groq backend."""
@@ -59,15 +453,8 @@ class GroqBackend(InferenceBackend):
             self.demo_mode = True
             return
 
-        if HTTPX_AVAILABLE and httpx is not None:
-            self.client = httpx.AsyncClient(
-                base_url=GROQ_API_BASE,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                timeout=30.0
-            )
+        self.client = await _acquire_client(self.api_key, self.pool_size)
+        self._live = True
 
         try:
             await self._check_api_status()
@@ -75,16 +462,24 @@ class GroqBackend(InferenceBackend):
         except (GroqConnectionError, GroqAPIError) as e:
             print(f"Groq API not accessible ({e}), running in demo mode...")
             self.demo_mode = True
+            self._live = False
 
     async def _check_api_status(self) -> None:
         """Check if Groq API is accessible."""
-        if self.demo_mode or not self.client or not HTTPX_AVAILABLE or httpx is None:
+        if not self._live:
             return
 
         try:
-            response = await self.client.get("/models")
+            # HEAD checks reachability and auth without downloading the model list.
+            # Any other 4xx may just mean HEAD isn't routed, so confirm with GET;
+            # only 401/403 are authoritative answers about the key.
+            response = await self.client.head("/models")
+            if 400 <= response.status_code < 500 and response.status_code not in (401, 403):
+                response = await self.client.get("/models")
             response.raise_for_status()
-        except (httpx.ConnectError, httpx.RequestError, httpx.TimeoutException) as e:
+            logger.info("Groq API reachable over %s", response.http_version)
+        except httpx.RequestError as e:
+            # Covers connect, timeout and other transport failures
             raise GroqConnectionError(
                 f"Failed to connect to Groq API: {e}") from e
         except httpx.HTTPStatusError as e:
@@ -92,14 +487,13 @@ class GroqBackend(InferenceBackend):
             response_text = e.response.text
             raise GroqAPIError(
                 f"Groq API error: {status_code} - {response_text}") from e
-        except httpx.HTTPError as e:
-            raise GroqAPIError(f"Groq API error: {e}") from e
 
     async def cleanup(self) -> None:
         """Cleanup Groq backend."""
         if self.client:
-            await self.client.aclose()
+            self._live = False
             self.client = None
+            await _release_client(self.api_key)
 
     async def get_model_info(self) -> ModelInfo:
         """Get information about the current model."""
@@ -113,146 +507,310 @@ class GroqBackend(InferenceBackend):
             quantization="FP16"
         )
 
-    async def _run_inference(self, prompt: str) -> str:
-        """Run inference using Groq API."""
-        if self.demo_mode:
-            return self._get_demo_response(prompt)
-
-        if not self.client:
-            raise GroqError("Groq client not initialized")
-
-        data = None # Initialize to avoid unbound variable issues
+    async def _run_inference(self, prompt: str) -> tuple[dict[str, Any] | str, bool]:
+        """Run inference using Groq API.
+
+        Returns the parsed JSON object when the model produced one, otherwise
+        the raw content string, and whether it is a fallback (demo output or
+        the model's reasoning in place of an answer) that must not be cached.
+        """
+        if not self._live:
+            payload = self._get_demo_response(prompt)
+            result = DEMO_RESULTS.get(payload)
+            if result is None:
+                result = self._extract_json_or_return_content(payload)
+            return result, True
+
+        cache_key = text_digest(f"{self.model_path}|{prompt}")
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return cached, False
 
         try:
-            # Use OpenAI-compatible chat completions endpoint
-            request_data = {
-                "model": self.model_path,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": 2048,
-                "temperature": 0.1,
-                "stream": False
-            }
-
-            print(
-                f"Sending request to Groq API with model: {self.model_path}")
-
-            response = await self.client.post(
-                "/chat/completions",
-                json=request_data
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            print(
-                f"✅ Received response from Groq API: {len(str(data))} characters")
-            print(f"Full response data: {json.dumps(data, indent=2)}")
-
-            if "choices" not in data or not data["choices"]:
-                print(
-                    f"❌ No choices in API response. Keys: {list(data.keys())}")
-                raise GroqAPIError("No choices in API response")
-
-            choice = data["choices"][0]
-            message = choice.get("message", {})
-
-            # Try to get content from either content or reasoning field
-            content = message.get("content", "")
-            reasoning = message.get("reasoning", "")
+            logger.debug("Sending request to Groq API with model: %s", self.model_path)
+
+            # Assemble streamed tokens as they arrive instead of waiting for
+            # the whole completion body
+            content_parts = []
+            reasoning_parts = []
+            async for delta in self._stream_deltas(prompt):
+                token = delta.get("content")
+                if token:
+                    content_parts.append(token)
+                token = delta.get("reasoning")
+                if token:
+                    reasoning_parts.append(token)
+
+            content = "".join(content_parts)
+            reasoning = "".join(reasoning_parts)
+            logger.debug("Received response from Groq API: %d characters",
+                         len(content) + len(reasoning))
 
             # Use reasoning if content is empty (happens when model hits token limit)
+            fallback = False
             if not content.strip() and reasoning.strip():
-                print("Content field empty, using reasoning field instead")
+                logger.info("Content field empty, using reasoning field instead")
                 content = reasoning
+                fallback = True
             elif not content.strip():
-                print("❌ Both content and reasoning fields are empty")
+                logger.warning("Both content and reasoning fields are empty")
                 raise GroqAPIError("No content in API response")
 
-            print(
-                f"Content extracted ({len(content)} chars): {repr(content[:500])}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Content extracted (%d chars): %r",
+                             len(content), content[:500])
 
             # Extract JSON if present, otherwise return content
-            return self._extract_json_or_return_content(content)
+            result = self._extract_json_or_return_content(content)
+            if not fallback:
+                self._response_cache[cache_key] = result
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+            return result, fallback
 
         except (ConnectionError, TimeoutError) as e:
-            print(f"Connection error: {e}")
+            logger.warning("Connection error: %s", e)
             raise GroqConnectionError(
                 f"Failed to connect to Groq API: {e}") from e
         except (KeyError, json.JSONDecodeError) as e:
-            print(f"Parse error: {e}")
-            if data:
-                print(f"Raw response data: {data}")
-            else:
-                print("No response data available")
+            logger.warning("Parse error: %s", e)
             raise GroqAPIError(f"Failed to parse Groq response: {e}") from e
+        except GroqError:
+            raise
         except Exception as e:  # pylint: disable=broad-except
-            print(f"Unexpected error: {type(e).__name__}: {e}")
+            logger.error("Unexpected error: %s: %s", type(e).__name__, e)
             # Handle any other errors as API errors
             raise GroqAPIError(f"Groq API error: {e}") from e
 
-    def _extract_json_or_return_content(self, content: str) -> str:
-        """Extract JSON from response content or return the content as-is."""
-        print(
-            f"Extracting JSON from content ({len(content)} chars): {repr(content[:200])}")
+    async def _stream_deltas(self, prompt: str) -> AsyncIterator[dict[str, Any]]:
+        """Stream a chat completion over SSE, yielding each choice delta as it arrives."""
+        if not self._live:
+            raise GroqError("Groq client not initialized")
+
+        # Only the prompt varies, so splice it into the pre-encoded fields
+        body = (self._request_prefix + b',"messages":[{"role":"user","content":'
+                + orjson.dumps(prompt) + b'}]}')
+
+        attempt = 0
+        yielded = False
+        while True:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+            if time.monotonic() < self._circuit_open_until:
+                raise GroqConnectionError(
+                    "Groq API circuit open after repeated failures")
+
+            await self._rpm_limiter.acquire()
+            # Budget the prompt (~4 chars per token) plus the full completion
+            # allowance, then settle to the usage Groq reports at the end
+            reservation = await self._tpm_limiter.acquire(
+                len(prompt) // 4 + MAX_COMPLETION_TOKENS)
+
+            try:
+                async with self._inflight:
+                    started = time.perf_counter()
+                    async with self.client.stream(
+                        "POST", "/chat/completions", content=body
+                    ) as response:
+                        self._observe_rate_limits(
+                            response, time.perf_counter() - started)
+                        if response.status_code >= 400:
+                            # Rejected requests generate nothing; free their budget
+                            self._tpm_limiter.settle(reservation, 0)
+                        if (response.status_code not in RETRYABLE_STATUS_CODES
+                                or attempt >= self.max_retries):
+                            response.raise_for_status()
+                            async for line in response.aiter_lines():
+                                if not line.startswith("data: "):
+                                    continue
+                                payload = line[6:]
+                                if payload == "[DONE]":
+                                    return
+                                chunk = orjson.loads(payload)
+                                # Groq reports usage on the final chunk under x_groq
+                                usage = (chunk.get("usage")
+                                         or (chunk.get("x_groq") or {}).get("usage"))
+                                if usage and "total_tokens" in usage:
+                                    self._tpm_limiter.settle(reservation, usage["total_tokens"])
+                                choices = chunk.get("choices")
+                                if choices:
+                                    yielded = True
+                                    yield choices[0].get("delta") or {}
+                            return
+            except httpx.HTTPStatusError as e:
+                raise GroqAPIError(
+                    f"Groq API error: {e.response.status_code}") from e
+            except httpx.TransportError as e:
+                self._inflight.record_overload()
+                self._record_failure()
+                # Once output has been forwarded a retry would duplicate it
+                if yielded or attempt >= self.max_retries:
+                    raise GroqConnectionError(
+                        f"Failed to connect to Groq API: {e}") from e
+
+            await asyncio.sleep(min(MAX_BACKOFF_SECONDS, 2 ** attempt + random.random()))
+            attempt += 1
+
+    async def simplify_stream(
+        self,
+        text: str,
+        target_grade: int = 7,
+        preserve_acronyms: bool = True,
+        context: str = ""
+    ) -> AsyncIterator[str]:
+        """Stream the simplified text, decoding the "plain" field as tokens arrive."""
+        if not self._live:
+            async for chunk in super().simplify_stream(
+                    text, target_grade, preserve_acronyms, context):
+                yield chunk
+            return
+
+        prompt = self._render_prompt(
+            self._load_prompt_template("simplify"),
+            text,
+            target_grade=target_grade,
+            preserve_acronyms=preserve_acronyms,
+            context=context
+        )
+        decoder = StreamingFieldDecoder("plain")
+        content = []
+        async for delta in self._stream_deltas(prompt):
+            token = delta.get("content")
+            if not token:
+                continue
+            content.append(token)
+            plain = decoder.feed(token)
+            if plain:
+                yield plain
+
+        if not decoder.started:
+            # The model ignored the JSON format; fall back to cleaned-up text
+            yield self._extract_clean_text("".join(content))
+
+    async def translate_stream(
+        self,
+        text: str,
+        target_language: str = "French",
+        preserve_terms: bool = True,
+        experimental: bool = False
+    ) -> AsyncIterator[str]:
+        """Stream translated text tokens as Groq generates them."""
+        if not self._live:
+            async for chunk in super().translate_stream(
+                    text, target_language, preserve_terms, experimental):
+                yield chunk
+            return
+
+        prompt = self._render_prompt(
+            self._load_prompt_template("translate"),
+            text,
+            target_language=target_language,
+            preserve_terms=preserve_terms,
+            experimental=experimental
+        )
+        async for delta in self._stream_deltas(prompt):
+            token = delta.get("content")
+            if token:
+                yield token
+
+    def _record_failure(self) -> None:
+        """Count a transport/5xx failure, opening the circuit after a run of them."""
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= CIRCUIT_BREAKER_THRESHOLD:
+            logger.warning("Groq API failing repeatedly, pausing calls for %.0fs",
+                           CIRCUIT_BREAKER_COOLDOWN)
+            self._circuit_open_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN
+            # Half-open once the cooldown passes: one more failure reopens the
+            # circuit straight away, while a success closes it
+            self._consecutive_failures = CIRCUIT_BREAKER_THRESHOLD - 1
+
+    def _observe_rate_limits(self, response, latency: float = 0.0) -> None:
+        """Adapt concurrency and pacing to Groq's status codes, latency and rate-limit headers."""
+        headers = response.headers
+        delay = 0.0
+        if response.status_code == 429 or response.status_code >= 500:
+            self._inflight.record_overload()
+            if response.status_code >= 500:
+                self._record_failure()
+            if response.status_code == 429:
+                try:
+                    delay = float(headers.get("retry-after", 0))
+                except ValueError:
+                    delay = 0.0
+        else:
+            self._consecutive_failures = 0
+            self._latencies.append(latency)
+            if sum(self._latencies) / len(self._latencies) <= LATENCY_TARGET_SECONDS:
+                self._inflight.record_success()
+            elif len(self._latencies) == LATENCY_WINDOW:
+                # Slow but succeeding: back off once per full window of slow
+                # calls, and never down to the floor reserved for 429/5xx
+                self._inflight.record_overload(floor=LATENCY_MIN_INFLIGHT)
+                self._latencies.clear()
+
+        # Pause proactively once fewer than 10% of the window's requests remain
+        try:
+            remaining = int(headers.get("x-ratelimit-remaining-requests", ""))
+            limit = int(headers.get("x-ratelimit-limit-requests", ""))
+        except ValueError:
+            remaining = limit = 0
+        if limit and remaining < limit * 0.1:
+            delay = max(delay, _parse_reset_duration(
+                headers.get("x-ratelimit-reset-requests")))
+
+        if delay > 0:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def _extract_json_or_return_content(self, content: str) -> dict[str, Any] | str:
+        """Parse the JSON object in response content or return the content as-is."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracting JSON from content (%d chars): %r",
+                         len(content), content[:200])
 
         if not content or not content.strip():
-            print("❌ Content is empty or whitespace only")
+            logger.warning("Content is empty or whitespace only")
             return content
 
-        # Try to find JSON in the response
-        json_match = re.search(r'\{.*\}', content, re.DOTALL)
-        if json_match:
-            json_str = json_match.group()
+        # Common case: the whole content is the JSON object, so parse it directly
+        if content.lstrip().startswith('{'):
+            try:
+                parsed = orjson.loads(content)
+                if isinstance(parsed, dict):
+                    logger.debug("Content is valid JSON with keys: %s", list(parsed))
+                    return parsed
+            except json.JSONDecodeError:
+                pass
+
+        # Otherwise look for a JSON object embedded in the response
+        json_str = _find_first_json_object(content)
+        if json_str:
             try:
-                # Validate that it's proper JSON
-                parsed = json.loads(json_str)
-                print(f"Found valid JSON with keys: {list(parsed.keys())}")
-                return json_str
+                parsed = orjson.loads(json_str)
+                if isinstance(parsed, dict):
+                    logger.debug("Found valid JSON with keys: %s", list(parsed))
+                    return parsed
             except json.JSONDecodeError as e:
-                print(f"Invalid JSON found: {e}")
+                logger.debug("Invalid JSON found: %s", e)
 
-        # If the entire content looks like JSON, try parsing it directly
-        try:
-            parsed = json.loads(content)
-            print(f"Content is valid JSON with keys: {list(parsed.keys())}")
-            return content
-        except json.JSONDecodeError:
-            print(
-                f"Content is not valid JSON, returning as-is: {repr(content[:100])}")
+        logger.debug("Content is not valid JSON, returning as-is: %r", content[:100])
 
         # Return content as-is if no valid JSON found
         return content
 
     def _get_demo_response(self, prompt: str) -> str:
         """Return demo responses for testing without API."""
-        if "simplify" in prompt.lower():
-            return json.dumps({
-                "plain": "This is a simplified version of the text. Complex terms have been replaced with simpler alternatives.",  # pylint: disable=line-too-long
-                "rationale": ["Replaced technical jargon", "Shortened sentences", "Used common words"],  # pylint: disable=line-too-long
-                "cautions": ["Some nuance may be lost in simplification"],
-                "readability_grade": 7.2
-            })
-        if "translate" in prompt.lower():
-            return json.dumps({
-                "translated": "Ceci est une traduction du texte en français.",
-                "target_language": "French",
-                "preserved_terms": ["specific terminology"],
-                "confidence": 0.85,
-                "cautions": ["Some context may be lost in translation"]
-            })
-        if "acronym" in prompt.lower():
-            return json.dumps({
-                "expansions": [
-                    {"acronym": "API", "expansion": "Application Programming Interface",
-                        "confidence": 0.95},
-                    {"acronym": "JSON", "expansion": "JavaScript Object Notation",
-                        "confidence": 0.98}
-                ]
-            })
+        # Prompts from our templates are identified from their fixed opening
+        for task, head in self.PROMPT_HEADS.items():
+            if prompt.startswith(head):
+                return DEMO_PAYLOADS[task]
+
+        lowered = prompt.lower()
+        for task, payload in DEMO_PAYLOADS.items():
+            if task in lowered:
+                return payload
         return f"{DEMO_MODE_MESSAGE}: Demo response for: {prompt[:50]}..."
 
     async def simplify(
@@ -263,38 +821,45 @@ class GroqBackend(InferenceBackend):
         context: str = ""
     ) -> SimplificationResponse:
         """Simplify text to target reading grade level."""
+        cache_key = ("simplify", text_digest(text), target_grade,
+                     preserve_acronyms, text_digest(context))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             prompt_template = self._load_prompt_template("simplify")
-            prompt = prompt_template.format(
-                text=text,
+            prompt = self._render_prompt(
+                prompt_template,
+                text,
                 target_grade=target_grade,
                 preserve_acronyms=preserve_acronyms,
                 context=context
             )
 
-            result = await self._run_inference(prompt)
-            print(f"Simplify result: {result[:200]}...")
+            result, fallback = await self._run_inference(prompt)
+            if fallback:
+                # Demo output or reasoning in place of an answer; don't pin it in the cache
+                cache_key = None
 
-            try:
-                response_data = json.loads(result)
-                print("✅ Successfully parsed JSON response for simplification")
-                return SimplificationResponse(**response_data)
-            except (json.JSONDecodeError, KeyError) as e:
-                print(
-                    f"❌ Failed to parse simplification response as JSON: {e}")
-                print(f"Raw result: {result}")
-
-                # Try to extract just the text content if JSON parsing fails
-                cleaned_result = self._extract_clean_text(result)
-
-                return SimplificationResponse(
-                    plain=cleaned_result,
-                    rationale=["Response was not in expected JSON format"],
-                    cautions=[
-                        "AI response required cleanup - please verify accuracy"]
-                )
+            if isinstance(result, dict):
+                logger.debug("Parsed JSON response for simplification")
+                return self._cache_result(cache_key, SimplificationResponse(**result))
+
+            logger.warning("Simplification response was not valid JSON")
+            logger.debug("Raw result: %s", result)
+
+            # Try to extract just the text content if JSON parsing fails
+            cleaned_result = self._extract_clean_text(result)
+
+            return SimplificationResponse(
+                plain=cleaned_result,
+                rationale=["Response was not in expected JSON format"],
+                cautions=[
+                    "AI response required cleanup - please verify accuracy"]
+            )
         except (GroqConnectionError, GroqAPIError) as e:
-            print(f"❌ Simplification failed with Groq error: {e}")
+            logger.error("Simplification failed with Groq error: %s", e)
             return SimplificationResponse(
                 plain="Simplification failed",
                 rationale=[f"Groq API error: {str(e)}"],
@@ -309,29 +874,38 @@ class GroqBackend(InferenceBackend):
         experimental: bool = False
     ) -> TranslationResponse:
         """Translate text to target language."""
+        cache_key = ("translate", text_digest(text), target_language,
+                     preserve_terms, experimental)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("translate")
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             target_language=target_language,
             preserve_terms=preserve_terms,
             experimental=experimental
         )
 
-        result = await self._run_inference(prompt)
+        result, fallback = await self._run_inference(prompt)
+        if fallback:
+            # Demo output or reasoning in place of an answer; don't pin it in the cache
+            cache_key = None
 
-        # Try JSON first in case the model ignores our instructions
-        try:
-            response_data = json.loads(result)
-            return TranslationResponse(**response_data)
-        except (json.JSONDecodeError, KeyError):
-            # Use the result directly as translated text (expected path)
-            return TranslationResponse(
-                translated=result.strip(),
-                target_language=target_language,
-                preserved_terms=[],
-                confidence=0.8,
-                cautions=[]
-            )
+        # JSON only comes back when the model ignores our instructions
+        if isinstance(result, dict):
+            return self._cache_result(cache_key, TranslationResponse(**result))
+
+        # Use the result directly as translated text (expected path)
+        return self._cache_result(cache_key, TranslationResponse(
+            translated=result.strip(),
+            target_language=target_language,
+            preserved_terms=[],
+            confidence=0.8,
+            cautions=[]
+        ))
 
     async def expand_acronyms(
         self,
@@ -339,20 +913,31 @@ class GroqBackend(InferenceBackend):
         context: str = ""
     ) -> AcronymResponse:
         """Expand acronyms found in text."""
+        cache_key = ("acronym", text_digest(text), text_digest(context))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("acronym")
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             context=context
         )
 
-        result = await self._run_inference(prompt)
+        result, fallback = await self._run_inference(prompt)
+        if fallback:
+            # Demo output or reasoning in place of an answer; don't pin it in the cache
+            cache_key = None
+        if not isinstance(result, dict):
+            logger.warning("Acronym response was not valid JSON")
+            return AcronymResponse(acronyms=[])
 
         try:
-            response_data = json.loads(result)
             # The model may answer with either "acronyms" or "expansions";
             # treat null/non-list payloads as empty rather than authoritative
-            items = (response_data.get("acronyms")
-                     or response_data.get("expansions") or [])
+            items = (result.get("acronyms")
+                     or result.get("expansions") or [])
             if not isinstance(items, list):
                 items = []
             expansions = []
@@ -371,57 +956,14 @@ class GroqBackend(InferenceBackend):
                     source=item.get("source", "ai_inference"),
                     source_url=item.get("source_url")
                 ))
-            return AcronymResponse(acronyms=expansions)
-        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
-            # Fallback for non-JSON responses
-            print(f"Failed to parse acronym response: {e}")
+            return self._cache_result(cache_key, AcronymResponse(acronyms=expansions))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Failed to parse acronym response: %s", e)
             return AcronymResponse(acronyms=[])
 
     def _load_prompt_template(self, task: str) -> str:
         """Load prompt template for the given task."""
-        templates = {
-            # pylint: disable=line-too-long
-            "simplify": """You are a helpful assistant that simplifies Canadian government text. 
-
-IMPORTANT: Respond with ONLY valid JSON. Do not include any explanation, reasoning, or other text.
-
-Task: Simplify this text to Grade {target_grade} reading level while preserving accuracy and acronyms.
-
-Text: {text}
-
-Response format (JSON only):
-{{
-    "plain": "your simplified text here",
-    "rationale": ["briefly explain major changes"],
-    "cautions": ["any important warnings"],
-    "readability_grade": 7.0
-}}""",
-            "translate": """You are a helpful translator for Canadian government content.
-
-IMPORTANT: Respond with ONLY the translated text. Do not include any explanations or reasoning.
-
-Translate this text to {target_language}:
-
-{text}
-
-TRANSLATED TEXT:""",
-            "acronym": """Find and expand all acronyms in this text. Respond with ONLY valid JSON.
-
-{text}
-
-Response format (JSON only):
-{{
-    "expansions": [
-        {{
-            "acronym": "acronym",
-            "expansion": "full expansion", 
-            "confidence": 0.9
-        }}
-    ]
-}}"""
-        }
-
-        return templates.get(task, "Process this text: {text}")
+        return self.PROMPT_TEMPLATES.get(task, "Process this text: {text}")
 
     def _extract_clean_text(self, raw_result: str) -> str:
         """Extract clean text from a malformed AI response."""
@@ -432,21 +974,18 @@ Response format (JSON only):
         cleaned = raw_result
 
         # Remove "We need to..." type reasoning
-        cleaned = re.sub(r'^We need to.*?\. ', '', cleaned, flags=re.MULTILINE)
-        cleaned = re.sub(r'^I need to.*?\. ', '', cleaned, flags=re.MULTILINE)
-        cleaned = re.sub(r'^The.*?is to.*?\. ', '',
-                         cleaned, flags=re.MULTILINE)
+        cleaned = WE_NEED_PATTERN.sub('', cleaned)
+        cleaned = I_NEED_PATTERN.sub('', cleaned)
+        cleaned = THE_IS_TO_PATTERN.sub('', cleaned)
 
         # Remove JSON-related text
-        cleaned = re.sub(r'.*?with plain simplified text.*?\. ',
-                         '', cleaned, flags=re.DOTALL)
-        cleaned = re.sub(r'.*?Provide.*?\. ', '', cleaned, flags=re.DOTALL)
+        cleaned = PLAIN_SIMPLIFIED_PATTERN.sub('', cleaned)
+        cleaned = PROVIDE_PATTERN.sub('', cleaned)
 
         # If it looks like JSON but is malformed, try to extract content
         if '{' in cleaned and '}' in cleaned:
             # Try to find content between quotes after "plain":
-            plain_match = re.search(
-                r'"plain"\s*:\s*"([^"]*)"', cleaned, re.DOTALL)
+            plain_match = PLAIN_FIELD_PATTERN.search(cleaned)
             if plain_match:
                 return plain_match.group(1)
 
@@ -460,10 +999,7 @@ Response format (JSON only):
                 continue
 
             # Skip lines that look like reasoning
-            if any(phrase in line.lower() for phrase in [
-                'we need to', 'i need to', 'the goal is to', 'let\'s', 'first,', 'second,',
-                'provide', 'ensure', 'make sure', 'it is important', 'we can', 'we should'
-            ]):
+            if REASONING_PATTERN.search(line):
                 continue
 
             content_lines.append(line)
@@ -4,44 +4,118 @@ Uses open-weight gpt-oss models via transformers library.
 This is just a sample implementation and should not be used in production
 """
 
+from __future__ import annotations
+
+import asyncio
 import json
+import os
 import re
-import traceback
-import signal
-from typing import Optional, List
-from pathlib import Path
-from .base import InferenceBackend
+import logging
+import time
+from typing import ClassVar
+import orjson  # type: ignore # pylint: disable=import-error
+from .base import (InferenceBackend, collect_batch, drain_queue, fail_batch,
+                   read_prompt_file, text_digest)
 from ..prompts.schema import SimplificationResponse, TranslationResponse, AcronymResponse, ModelInfo
-
-try:
-    import torch  # type: ignore
-    from transformers import AutoTokenizer, AutoModelForCausalLM  # type: ignore
+from ..prompts.templates import DETAILED_TEMPLATES
+
+# torch/transformers take seconds to import, so they are loaded on first
+# initialize() instead of whenever the backends package is imported
+torch = None
+AutoTokenizer = None
+AutoModelForCausalLM = None
+StoppingCriteriaList = None
+BitsAndBytesConfig = None
+TRANSFORMERS_AVAILABLE = False
+BITSANDBYTES_AVAILABLE = False
+
+
+def _import_transformers() -> bool:
+    """Import torch, transformers and bitsandbytes once; return availability."""
+    # pylint: disable=global-statement,import-outside-toplevel
+    global torch, AutoTokenizer, AutoModelForCausalLM, StoppingCriteriaList
+    global BitsAndBytesConfig, TRANSFORMERS_AVAILABLE, BITSANDBYTES_AVAILABLE
+    if TRANSFORMERS_AVAILABLE:
+        return True
+
+    try:
+        import torch as _torch  # type: ignore
+        from transformers import (AutoTokenizer as _AutoTokenizer,  # type: ignore
+                                  AutoModelForCausalLM as _AutoModelForCausalLM,
+                                  StoppingCriteriaList as _StoppingCriteriaList)
+    except ImportError:
+        return False
+    torch = _torch
+    AutoTokenizer = _AutoTokenizer
+    AutoModelForCausalLM = _AutoModelForCausalLM
+    StoppingCriteriaList = _StoppingCriteriaList
     TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
-    torch = None
-    AutoTokenizer = None
-    AutoModelForCausalLM = None
 
-try:
-    __import__('bitsandbytes')
-    BITSANDBYTES_AVAILABLE = True
-except ImportError:
-    BITSANDBYTES_AVAILABLE = False
+    try:
+        from transformers import BitsAndBytesConfig as _BitsAndBytesConfig  # type: ignore
+        BitsAndBytesConfig = _BitsAndBytesConfig
+    except ImportError:
+        pass
+
+    try:
+        __import__('bitsandbytes')
+        BITSANDBYTES_AVAILABLE = True
+    except ImportError:
+        pass
+    return True
+
+logger = logging.getLogger(__name__)
+
+ACRONYM_PATTERN = re.compile(r'\b[A-Z]{2,}\b')
+# Upper bound on one generate() call for large model inference
+GENERATION_TIMEOUT_SECONDS = 300
+# Prompt token budget; over-long requests shorten their text, never the instructions
+MAX_PROMPT_TOKENS = 512
+JSON_DECODER = json.JSONDecoder()
+
+
+class DeadlineCriteria:
+    """Stop generation once a wall-clock deadline passes.
+
+    Checked between decode steps, so it works from any thread, unlike SIGALRM.
+    Duck-types transformers' StoppingCriteria so defining it needs no import.
+    """
+
+    def __init__(self, timeout: float):
+        self.deadline = time.monotonic() + timeout
+        self.expired = False
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        self.expired = time.monotonic() > self.deadline
+        return self.expired
 
 
 class HuggingFaceBackend(InferenceBackend):
     """Backend using Hugging Face transformers for local inference with gpt-oss models."""
 
-    def __init__(self, model_path: str, adapters: Optional[List[str]] = None):
+    PROMPT_TEMPLATES: ClassVar[dict[str, str]] = DETAILED_TEMPLATES
+
+    def __init__(self, model_path: str, adapters: list[str] | None = None):
         super().__init__(model_path, adapters or [])
         self.model = None
         self.tokenizer = None
         self.generator = None
+        # Resolved once the model is loaded instead of probed on every request
+        self._device = None
+        self._dtype = None
+        self._eos_id = None
+        # Optional small draft model for assisted (speculative) decoding
+        self.draft_model_name = os.getenv("MAPLECLEAR_DRAFT_MODEL", "")
+        self.assistant = None
+        # Concurrent requests arriving within max_batch_wait share one generate()
+        self.max_batch = int(os.getenv("MAPLECLEAR_MAX_BATCH", "8"))
+        self.max_batch_wait = int(os.getenv("MAPLECLEAR_BATCH_WAIT_MS", "10")) / 1000
+        self._batch_queue: asyncio.Queue | None = None
+        self._batch_worker: asyncio.Task | None = None
 
     async def initialize(self) -> None:
         """Initialize Hugging Face backend."""
-        if not TRANSFORMERS_AVAILABLE or AutoTokenizer is None or AutoModelForCausalLM is None:
+        if not _import_transformers() or AutoTokenizer is None or AutoModelForCausalLM is None:
             print(
                 "⚠️  Transformers not available. Install with: pip install transformers torch")
             print("Running in demo mode...")
@@ -53,6 +127,8 @@ class HuggingFaceBackend(InferenceBackend):
             device, dtype = self._setup_device_and_dtype()
             model_kwargs = self._prepare_model_kwargs(device, dtype)
             self._load_model(model_name, model_kwargs, device)
+            if self.draft_model_name:
+                self._load_draft_model(self.draft_model_name, dtype)
             print("✅ Hugging Face backend initialized successfully")
 
         except (ImportError, RuntimeError, OSError, ValueError) as e:
@@ -79,6 +155,9 @@ class HuggingFaceBackend(InferenceBackend):
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
         if self.tokenizer.pad_token is None:
             self.tokenizer.pad_token = self.tokenizer.eos_token
+        self._eos_id = self.tokenizer.eos_token_id
+        # Decoder-only models continue from the right edge, so pad batches on the left
+        self.tokenizer.padding_side = "left"
 
     def _setup_device_and_dtype(self) -> tuple:
         """Setup device and data type for the model."""
@@ -105,13 +184,28 @@ class HuggingFaceBackend(InferenceBackend):
         """Prepare model loading arguments."""
         model_kwargs = {
             "torch_dtype": dtype,
-            "device_map": None,
+            # Stream weights straight onto the target device while loading
+            "device_map": {"": device},
             "low_cpu_mem_usage": True,
+            # Fused scaled-dot-product attention (flash/mem-efficient kernels)
+            "attn_implementation": "sdpa",
         }
 
-        # Add quantization for large models
-        if BITSANDBYTES_AVAILABLE and device == "cuda":
+        # Add quantization for large models; bnb spreads quantized weights
+        # across available GPUs itself
+        if BITSANDBYTES_AVAILABLE and device == "cuda" and BitsAndBytesConfig is not None:
+            # NF4 keeps weights 4-bit during compute, halving decode bandwidth vs int8
+            model_kwargs["quantization_config"] = BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=dtype,
+                bnb_4bit_use_double_quant=True
+            )
+            model_kwargs["device_map"] = "auto"
+            print("Using 4-bit NF4 quantization to reduce memory usage...")
+        elif BITSANDBYTES_AVAILABLE and device == "cuda":
             model_kwargs["load_in_8bit"] = True
+            model_kwargs["device_map"] = "auto"
             print("Using 8-bit quantization to reduce memory usage...")
         else:
             print("Install bitsandbytes for quantization: pip install bitsandbytes")
@@ -119,17 +213,76 @@ class HuggingFaceBackend(InferenceBackend):
         return model_kwargs
 
     def _load_model(self, model_name: str, model_kwargs: dict, device: str) -> None:
-        """Load the model and move it to the specified device."""
+        """Load the model directly onto the specified device."""
         if AutoModelForCausalLM is None:
             raise RuntimeError("AutoModelForCausalLM not available")
-        self.model = AutoModelForCausalLM.from_pretrained(
-            model_name, **model_kwargs)
-        # Move model to the selected device
-        self.model = self.model.to(device)
-        print(f"Model moved to {device}")
+        try:
+            self.model = AutoModelForCausalLM.from_pretrained(
+                model_name, **model_kwargs)
+        except ValueError as e:
+            # Some architectures do not implement SDPA; use their default attention
+            if "attn_implementation" not in model_kwargs:
+                raise
+            print(f"SDPA attention unavailable ({e}), using default attention")
+            model_kwargs = {key: value for key, value in model_kwargs.items()
+                            if key != "attn_implementation"}
+            self.model = AutoModelForCausalLM.from_pretrained(
+                model_name, **model_kwargs)
+        print(f"Model loaded on {device}")
+
+        first_param = next(self.model.parameters())
+        self._device = first_param.device
+        self._dtype = first_param.dtype
+
+        if device == "cuda":
+            # Preallocated KV cache keeps decode-step shapes fixed, so compiled
+            # decoding can replay captured CUDA graphs instead of re-dispatching
+            self.model.generation_config.cache_implementation = "static"
+
+            quantized = "quantization_config" in model_kwargs or "load_in_8bit" in model_kwargs
+            if (os.getenv("MAPLECLEAR_TORCH_COMPILE", "1") == "1" and not quantized
+                    and hasattr(torch, "compile")):
+                try:
+                    # Compiled lazily on the first generate (~1 min); set
+                    # TORCHINDUCTOR_CACHE_DIR to reuse kernels across restarts
+                    self.model.forward = torch.compile(
+                        self.model.forward, mode="reduce-overhead", fullgraph=False)
+                    print("Compiled model forward with torch.compile (reduce-overhead)")
+                except RuntimeError as e:
+                    print(f"torch.compile unavailable ({e}), using eager mode")
+
+    def _load_draft_model(self, draft_name: str, dtype) -> None:
+        """Load the draft model used for assisted decoding.
+
+        The draft must share the main model's tokenizer so its proposed
+        token ids can be verified directly.
+        """
+        try:
+            self.assistant = AutoModelForCausalLM.from_pretrained(
+                draft_name, torch_dtype=dtype, device_map={"": self._device},
+                low_cpu_mem_usage=True)
+        except (OSError, ValueError) as e:
+            print(f"Draft model {draft_name} unavailable ({e}), decoding without it")
+            return
+        if self.assistant.config.vocab_size != self.model.config.vocab_size:
+            print(f"Draft model {draft_name} does not share the model vocabulary, ignoring it")
+            self.assistant = None
+            return
+        # Assisted decoding manages its own dynamic caches
+        self.model.generation_config.cache_implementation = None
+        print(f"Assisted decoding enabled with draft model: {draft_name}")
 
     async def cleanup(self) -> None:
         """Clean up resources."""
+        if self._batch_worker:
+            # The worker fails its in-flight batch as it is cancelled; requests
+            # still queued behind it would otherwise wait forever
+            self._batch_worker.cancel()
+            self._batch_worker = None
+            fail_batch(drain_queue(self._batch_queue))
+        if self.assistant:
+            del self.assistant
+            self.assistant = None
         if self.model:
             del self.model
             self.model = None
@@ -157,53 +310,106 @@ class HuggingFaceBackend(InferenceBackend):
                 model_name).lower() else "unknown"
         )
 
-    def _run_inference(self, prompt: str) -> str:
+    async def _infer(self, prompt: str) -> tuple[str, bool]:
+        """Queue a prompt for the next micro-batch and wait for its response.
+
+        Returns the response text and whether it is a demo/error fallback.
+        """
+        if not self.model or not self.tokenizer:
+            return self._run_inference(prompt)
+
+        if self._batch_worker is None or self._batch_worker.done():
+            self._batch_queue = asyncio.Queue()
+            self._batch_worker = asyncio.create_task(self._batch_loop())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((prompt, future))
+        return await future
+
+    async def _batch_loop(self) -> None:
+        """Collect queued prompts into batches of up to max_batch and run them."""
+        batch: list = []
+        try:
+            while True:
+                batch = []
+                await collect_batch(self._batch_queue, batch, self.max_batch,
+                                    self.max_batch_wait)
+
+                try:
+                    # Generate off the event loop so other requests keep being served
+                    results, fallback = await asyncio.to_thread(
+                        self._run_batch_inference, [prompt for prompt, _ in batch])
+                # Deliberately broad: whatever the batch raised belongs to the callers
+                # awaiting it, and the worker must survive to serve later batches
+                except Exception as e:  # pylint: disable=broad-except  # noqa: BLE001
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result((result, fallback))
+        except asyncio.CancelledError:
+            fail_batch(batch)
+            raise
+
+    def _run_inference(self, prompt: str) -> tuple[str, bool]:
         """Run inference using Hugging Face transformers."""
+        results, fallback = self._run_batch_inference([prompt])
+        return results[0], fallback
+
+    def _run_batch_inference(self, prompts: list[str]) -> tuple[list[str], bool]:
+        """Run inference on a batch of prompts in a single generate() call.
+
+        The flag is True when the texts are demo/error fallbacks rather than
+        model output, so callers know not to cache them.
+        """
         if not self.model or not self.tokenizer:
-            print("Model or tokenizer not available, using demo response...")
-            return self._get_demo_response(prompt)
+            logger.debug("Model or tokenizer not available, using demo response")
+            return [self._get_demo_response(prompt) for prompt in prompts], True
 
         try:
-            return self._perform_model_inference(prompt)
+            return self._perform_model_inference(prompts), False
         except (RuntimeError, ValueError, TypeError, TimeoutError) as e:
-            print(f"❌ Inference error: {e}")
-            print(f"Error type: {type(e)}")
-            print(f"Traceback: {traceback.format_exc()}")
-            return self._get_demo_response(prompt)
+            # exc_info only walks the traceback when DEBUG output is enabled
+            logger.warning("Inference error (%s): %s", type(e).__name__, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
+            return [self._get_demo_response(prompt) for prompt in prompts], True
 
-    def _perform_model_inference(self, prompt: str) -> str:
+    def _perform_model_inference(self, prompts: list[str]) -> list[str]:
         """Perform the actual model inference."""
-        print(f"Running inference with prompt length: {len(prompt)}...")
+        logger.debug("Running inference on %d prompt(s)", len(prompts))
 
         # Prepare inputs
-        inputs = self._prepare_inputs(prompt)
+        inputs = self._prepare_inputs(prompts)
 
         # Generate response
         outputs = self._generate_response(inputs)
 
-        # Process and return the response
-        return self._process_response(outputs, prompt)
+        # generate() echoes the (left-padded) prompt; decode only the new tokens
+        input_len = inputs['input_ids'].shape[1]
+        return [self._process_response(output[input_len:]) for output in outputs]
 
-    def _prepare_inputs(self, prompt: str):
+    def _prepare_inputs(self, prompts: list[str]):
         """Prepare inputs for model inference."""
         if not self.model or not self.tokenizer:
             raise RuntimeError("Model or tokenizer not available")
 
-        # Truncate prompt to reduce computation time
-        max_prompt_length = 128  # Even smaller for faster inference
+        # Prompts already fit MAX_PROMPT_TOKENS (see _render_prompt), so no truncation here.
+        # A lone prompt needs no padding, and an all-ones mask only slows attention
+        batched = len(prompts) > 1
         inputs = self.tokenizer(
-            prompt, return_tensors="pt", padding=True, truncation=True, max_length=max_prompt_length) # pylint: disable=line-too-long
+            prompts, return_tensors="pt", padding=batched, return_attention_mask=batched)
 
-        device = next(self.model.parameters()).device
-        model_dtype = next(self.model.parameters()).dtype
-        print(f"Model device: {device}, dtype: {model_dtype}")
+        device = self._device
+        logger.debug("Model device: %s, dtype: %s", device, self._dtype)
 
         # Move inputs to device - don't convert dtype for input_ids (they should stay as int64)
         for key in inputs:
             if hasattr(inputs[key], 'to'):
                 inputs[key] = inputs[key].to(device=device)
-                print(
-                    f"Input {key}: shape={inputs[key].shape}, dtype={inputs[key].dtype}")
+                logger.debug("Input %s: shape=%s, dtype=%s",
+                             key, inputs[key].shape, inputs[key].dtype)
 
         return inputs
 
@@ -214,79 +420,67 @@ class HuggingFaceBackend(InferenceBackend):
         if not self.model or not self.tokenizer:
             raise RuntimeError("Model or tokenizer not available")
 
-        print("Starting model generation...")
-
-        model_dtype = next(self.model.parameters()).dtype
+        logger.debug("Starting model generation")
 
-        with torch.no_grad():
-            # Convert inputs to match model dtype for embedding layer
-            if hasattr(inputs, 'get') and inputs.get('attention_mask') is not None:
-                # attention_mask should be float and match model dtype
-                attention_mask = inputs['attention_mask'].to(
-                    dtype=model_dtype)
-            else:
-                attention_mask = None
+        # inference_mode also skips autograd version-counter bookkeeping
+        with torch.inference_mode():
+            # Padded batches carry an int64 mask; single prompts use the causal mask
+            attention_mask = inputs.get('attention_mask')
 
             # Add timeout for generation to prevent infinite hangs
-            def timeout_handler(signum, frame):
-                raise TimeoutError(
-                    "Model generation timed out - using intelligent fallback for performance")
+            deadline = DeadlineCriteria(GENERATION_TIMEOUT_SECONDS)
+
+            # transformers only supports assisted generation for a single sequence
+            assisted = {}
+            if self.assistant is not None and inputs['input_ids'].shape[0] == 1:
+                assisted = {"assistant_model": self.assistant, "num_assistant_tokens": 5}
+
+            outputs = self.model.generate(
+                input_ids=inputs['input_ids'],  # Keep as int64
+                attention_mask=attention_mask,
+                max_new_tokens=12,  # Reasonable for meaningful responses
+                do_sample=False,  # Use greedy decoding for speed
+                pad_token_id=self._eos_id,
+                eos_token_id=self._eos_id,
+                use_cache=True,  # Enable KV cache for speed
+                num_beams=1,  # No beam search for speed
+                temperature=1.0,  # Simplify sampling
+                top_p=1.0,  # Disable nucleus sampling for speed
+                repetition_penalty=1.0,  # Disable repetition penalty for speed
+                stopping_criteria=StoppingCriteriaList([deadline]),
+                **assisted
+            )
 
-            signal.signal(signal.SIGALRM, timeout_handler)
-            # Increase to 5 minutes for large model inference
-            signal.alarm(300)
+        if deadline.expired:
+            raise TimeoutError(
+                "Model generation timed out - using intelligent fallback for performance")
 
-            try:
-                outputs = self.model.generate(
-                    input_ids=inputs['input_ids'],  # Keep as int64
-                    attention_mask=attention_mask,  # Convert to model dtype
-                    max_new_tokens=12,  # Reasonable for meaningful responses
-                    do_sample=False,  # Use greedy decoding for speed
-                    pad_token_id=self.tokenizer.eos_token_id,
-                    eos_token_id=self.tokenizer.eos_token_id,
-                    use_cache=True,  # Enable KV cache for speed
-                    num_beams=1,  # No beam search for speed
-                    temperature=1.0,  # Simplify sampling
-                    top_p=1.0,  # Disable nucleus sampling for speed
-                    repetition_penalty=1.0  # Disable repetition penalty for speed
-                )
-            finally:
-                signal.alarm(0)  # Cancel the alarm
-
-        print("✅ Model generation completed")
+        logger.debug("Model generation completed")
         return outputs
 
-    def _process_response(self, outputs, prompt: str) -> str:
-        """Process the model outputs into a readable response."""
+    def _process_response(self, new_tokens) -> str:
+        """Process the generated tokens into a readable response."""
         if not self.tokenizer:
             raise RuntimeError("Tokenizer not available")
 
         # Decode response
-        print("Decoding response...")
-        full_response = self.tokenizer.decode(
-            outputs[0], skip_special_tokens=True)
-
-        # Remove the input prompt from the response
-        if full_response.startswith(prompt):
-            response = full_response[len(prompt):].strip()
-        else:
-            response = full_response.strip()
+        logger.debug("Decoding response")
+        response = self.tokenizer.decode(
+            new_tokens, skip_special_tokens=True).strip()
 
-        print(f"Generated response length: {len(response)}")
-        print(f"Response preview: {response[:100]}...")
+        logger.debug("Generated response length: %d, preview: %r",
+                     len(response), response[:100])
 
-        # Try to extract JSON if present
-        if '{' in response and '}' in response:
-            start = response.find('{')
-            end = response.rfind('}') + 1
-            json_part = response[start:end]
+        # Try to extract JSON if present; raw_decode validates the first
+        # object in one pass and stops at its end, ignoring trailing text
+        start = response.find('{')
+        if start >= 0:
             try:
-                # Validate JSON
-                json.loads(json_part)
-                print("✅ Valid JSON response extracted")
-                return json_part
+                _, end = JSON_DECODER.raw_decode(response, start)
+                logger.debug("Valid JSON response extracted")
+                return response[start:end]
             except json.JSONDecodeError:
-                print("⚠️  Invalid JSON in response, returning raw text")
+                logger.debug("Invalid JSON in response, returning raw text")
 
         return response
 
@@ -333,28 +527,38 @@ class HuggingFaceBackend(InferenceBackend):
         context: str = ""
     ) -> SimplificationResponse:
         """Simplify text to plain language."""
+        cache_key = ("simplify", text_digest(text), target_grade,
+                     preserve_acronyms, text_digest(context))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("simplify")
 
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             target_grade=target_grade,
             preserve_acronyms=preserve_acronyms,
             context=context
         )
 
-        response_text = self._run_inference(prompt)
+        response_text, fallback = await self._infer(prompt)
+        if fallback:
+            # Demo output or an inference-error fallback; don't pin it in the cache
+            cache_key = None
 
         try:
-            response_data = json.loads(response_text)
-            return SimplificationResponse(
+            response_data = orjson.loads(response_text)
+            return self._cache_result(cache_key, SimplificationResponse(
                 plain=response_data.get("plain", text),
                 rationale=response_data.get("rationale", []),
                 cautions=response_data.get("cautions", []),
                 readability_grade=self._calculate_readability(
                     response_data.get("plain", text)),
                 original_grade=self._calculate_readability(text)
-            )
-        except json.JSONDecodeError as e:
+            ))
+        except orjson.JSONDecodeError as e:
             # Fallback if JSON parsing fails
             return SimplificationResponse(
                 plain=response_text[:500] +
@@ -373,28 +577,38 @@ class HuggingFaceBackend(InferenceBackend):
         experimental: bool = False
     ) -> TranslationResponse:
         """Translate text to target language."""
+        cache_key = ("translate", text_digest(text), target_language,
+                     preserve_terms, experimental)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("translate")
 
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             target_language=target_language,
             preserve_terms=preserve_terms,
             experimental=experimental
         )
 
-        response_text = self._run_inference(prompt)
+        response_text, fallback = await self._infer(prompt)
+        if fallback:
+            # Demo output or an inference-error fallback; don't pin it in the cache
+            cache_key = None
 
         try:
-            response_data = json.loads(response_text)
-            return TranslationResponse(
+            response_data = orjson.loads(response_text)
+            return self._cache_result(cache_key, TranslationResponse(
                 translated=response_data.get("translated", text),
                 target_language=target_language,
                 preserved_terms=response_data.get("preserved_terms", []),
                 confidence=response_data.get("confidence", 0.8),
                 experimental=experimental,
                 cautions=response_data.get("cautions", [])
-            )
-        except json.JSONDecodeError as e:
+            ))
+        except orjson.JSONDecodeError as e:
             # Fallback if JSON parsing fails
             return TranslationResponse(
                 translated=response_text[:500] +
@@ -412,23 +626,32 @@ class HuggingFaceBackend(InferenceBackend):
         context: str = ""
     ) -> AcronymResponse:
         """Find and expand acronyms in text."""
+        cache_key = ("acronyms", text_digest(text), text_digest(context))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("acronyms")
 
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             context=context
         )
 
-        response_text = self._run_inference(prompt)
+        response_text, fallback = await self._infer(prompt)
+        if fallback:
+            # Demo output or an inference-error fallback; don't pin it in the cache
+            cache_key = None
 
         try:
-            response_data = json.loads(response_text)
-            return AcronymResponse(acronyms=response_data.get("acronyms", []))
-        except json.JSONDecodeError:
+            response_data = orjson.loads(response_text)
+            return self._cache_result(cache_key, AcronymResponse(acronyms=response_data.get("acronyms", [])))
+        except orjson.JSONDecodeError:
             # Fallback: simple acronym detection
             acronyms = []
-            acronym_pattern = r'\b[A-Z]{2,}\b'
-            found_acronyms = re.findall(acronym_pattern, text)
+            # One entry per distinct acronym, in order of first appearance
+            found_acronyms = dict.fromkeys(ACRONYM_PATTERN.findall(text))
 
             for acronym in found_acronyms:
                 acronyms.append({
@@ -441,82 +664,27 @@ class HuggingFaceBackend(InferenceBackend):
 
             return AcronymResponse(acronyms=acronyms)
 
+    def _render_prompt(self, template: str, text: str, **fields) -> str:
+        """Fill a prompt template, shortening only the request text to fit MAX_PROMPT_TOKENS.
+
+        Cutting the whole prompt would drop either the instructions or the
+        closing quote and format reminder after {text}.
+        """
+        prompt = super()._render_prompt(template, text, **fields)
+        if self.tokenizer is None:
+            return prompt
+        overflow = len(self.tokenizer(prompt)["input_ids"]) - MAX_PROMPT_TOKENS
+        if overflow <= 0:
+            return prompt
+        text_ids = self.tokenizer(text, add_special_tokens=False)["input_ids"]
+        # Every {text} slot repeats the text, so each copy gives up its share
+        slots = max(1, template.count("{text}"))
+        keep = max(0, len(text_ids) - (overflow + slots - 1) // slots)
+        logger.debug("Prompt over budget by %d tokens; keeping %d of %d text tokens",
+                     overflow, keep, len(text_ids))
+        return super()._render_prompt(
+            template, self.tokenizer.decode(text_ids[:keep]), **fields)
+
     def _load_prompt_template(self, task: str) -> str:
         """Load prompt template for a specific task."""
-        template_path = Path(f"server/prompts/{task}.txt")
-        if template_path.exists():
-            return template_path.read_text(encoding="utf-8")
-
-        templates = {
-            # pylint: disable=line-too-long
-            "simplify": """You are a plain language expert specializing in simplifying Canadian government text.
-
-Task: Simplify the following text to grade {target_grade} reading level while preserving meaning and official terms.
-
-Original text: "{text}"
-
-Requirements:
-- Target reading level: Grade {target_grade}
-- Use shorter sentences (15-20 words max)
-- Replace jargon with everyday words
-- Use active voice
-- Keep the same essential meaning
-- Preserve acronyms: {preserve_acronyms}
-- Context: {context}
-
-Respond ONLY with valid JSON in this exact format:
-{{
-  "plain": "simplified text here",
-  "rationale": ["specific change 1", "specific change 2"],
-  "cautions": ["any important warnings or limitations"]
-}}""",
-
-            "translate": """You are a Canadian government translation expert.
-
-Task: Translate the following text to {target_language} while maintaining official tone and preserving government terminology.
-
-Text to translate: "{text}"
-
-Requirements:
-- Target language: {target_language}
-- Preserve official terms and department names: {preserve_terms}
-- Maintain formal government tone
-- Experimental features enabled: {experimental}
-- Ensure accuracy for government communications
-
-Respond ONLY with valid JSON in this exact format:
-{{
-  "translated": "translated text here",
-  "preserved_terms": ["term1", "term2"],
-  "confidence": 0.95,
-  "cautions": ["any translation notes or warnings"]
-}}""",
-
-            "acronyms": """You are an expert in Canadian government terminology and acronyms.
-
-Task: Identify and expand all acronyms in the following text, providing clear definitions suitable for public understanding.
-
-Text: "{text}"
-Context: "{context}"
-
-Requirements:
-- Focus on government, legal, and administrative acronyms
-- Provide clear, public-friendly definitions
-- Include confidence scores based on certainty
-- Note the source of information
-
-Respond ONLY with valid JSON in this exact format:
-{{
-  "acronyms": [
-    {{
-      "acronym": "CRA",
-      "expansion": "Canada Revenue Agency",
-      "definition": "Federal agency responsible for tax collection and benefits administration",
-      "confidence": 0.95,
-      "source": "ai_inference"
-    }}
-  ]
-}}"""
-        }
-
-        return templates.get(task, "Process this text: {text}")
+        return read_prompt_file(task) or self.PROMPT_TEMPLATES.get(task, "Process this text: {text}")
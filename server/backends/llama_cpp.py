@@ -3,66 +3,83 @@ llama.cpp backend implementation for MapleClear.
 This is just a sample implementation and should not be used in production
 """
 
-import json
-import subprocess
+from __future__ import annotations
+
 import asyncio
-from typing import Optional, List
+import os
+import re
 from pathlib import Path
+from typing import ClassVar
+
+import orjson  # type: ignore # pylint: disable=import-error
 
-from .base import InferenceBackend
+try:
+    from llama_cpp import Llama  # type: ignore # pylint: disable=import-error
+    LLAMA_CPP_AVAILABLE = True
+except ImportError:
+    LLAMA_CPP_AVAILABLE = False
+    Llama = None
+
+from .base import InferenceBackend, read_prompt_file, text_digest
 from ..prompts.schema import SimplificationResponse, TranslationResponse, AcronymResponse, ModelInfo
+from ..prompts.templates import COMPACT_TEMPLATES
+
+# GGUF quantization tags as they appear in model file names, e.g. "...Q4_K_M.gguf"
+GGUF_QUANT_PATTERN = re.compile(r'(q\d_k(?:_[sml])?|q\d_\d|f16|bf16)', re.IGNORECASE)
 
 
 class LlamaCppBackend(InferenceBackend):
     """Backend using llama.cpp for local inference."""
 
-    def __init__(self, model_path: str, adapters: Optional[List[str]] = None):
+    PROMPT_TEMPLATES: ClassVar[dict[str, str]] = COMPACT_TEMPLATES
+
+    def __init__(self, model_path: str, adapters: list[str] | None = None):
         super().__init__(model_path, adapters)
-        self.llama_cpp_path = None
+        self.llm = None
         self.model_loaded = False
+        # A Llama instance is not thread-safe; run one completion at a time
+        self._lock = asyncio.Lock()
 
     async def initialize(self) -> None:
         """Initialize llama.cpp backend."""
-        cpp_path = Path("server/backends/llama.cpp/main")
-        if not cpp_path.exists():
-            try:
-                process = await asyncio.create_subprocess_exec(
-                    "make", "-C", "server/backends/llama.cpp",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                _, stderr = await process.communicate()
-                if process.returncode != 0:
-                    raise subprocess.CalledProcessError(
-                        process.returncode or 1, ["make"], stderr)
-            except subprocess.CalledProcessError as e:
-                print(f"❌ Failed to build llama.cpp: {e}")
-                raise
-
-        self.llama_cpp_path = cpp_path
-
         model_path = Path(self.model_path).expanduser()
-        if not model_path.exists():
+        if not LLAMA_CPP_AVAILABLE or Llama is None:
+            print("llama-cpp-python not available. Install with: pip install llama-cpp-python")
+            print("Running in demo mode without real model...")
+        elif not model_path.exists():
             print(f"Model file not found: {model_path}")
             print("Please download a model or set MAPLECLEAR_MODEL_PATH")
             # For demo purposes: to be removed
             print("Running in demo mode without real model...")
+        else:
+            # Load the GGUF weights once and keep them resident for every request
+            self.llm = await asyncio.to_thread(
+                Llama,
+                model_path=str(model_path),
+                n_ctx=2048,
+                n_gpu_layers=-1,
+                n_threads=os.cpu_count(),
+                # Larger prompt-eval batches suit the block-quantized (Q4) matmul kernels
+                n_batch=512,
+                verbose=False
+            )
 
         self.model_loaded = True
         print("✅ llama.cpp backend initialized")
 
     async def cleanup(self) -> None:
         """Clean up resources."""
+        self.llm = None
         self.model_loaded = False
 
     async def get_model_info(self) -> ModelInfo:
         """Get model information."""
         model_path = Path(self.model_path).expanduser()
+        quant_match = GGUF_QUANT_PATTERN.search(model_path.name)
         return ModelInfo(
             name=model_path.name if model_path.exists() else "demo-model",
             size="20B" if "20b" in str(model_path).lower() else "unknown",
-            quantization="Q5_K_M" if "q5_k_m" in str(
-                model_path).lower() else None,
+            quantization=quant_match.group(1).upper() if quant_match else None,
             backend="llama.cpp",
             adapters=self.adapters,
             memory_usage="~12GB" if "20b" in str(
@@ -74,36 +91,14 @@ class LlamaCppBackend(InferenceBackend):
         if not self.model_loaded:
             raise RuntimeError("Model not loaded")
 
-        model_path = Path(self.model_path).expanduser()
-        if not model_path.exists():
+        if self.llm is None:
             return self._get_demo_response(prompt)
 
         try:
-            cmd = [
-                str(self.llama_cpp_path),
-                "-m", str(model_path),
-                "-p", prompt,
-                "-n", str(max_tokens),
-                "--temp", "0.7",
-            ]
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=60
-                )
-            except asyncio.TimeoutError as exc:
-                process.kill()
-                await process.wait()
-                raise RuntimeError("Inference timeout") from exc
-
-            if process.returncode != 0:
-                raise RuntimeError(f"llama.cpp failed: {stderr.decode()}")
-            return stdout.decode().strip()
+            async with self._lock:
+                output = await asyncio.to_thread(
+                    self.llm, prompt, max_tokens=max_tokens, temperature=0.7)
+            return output["choices"][0]["text"].strip()
 
         except Exception as e:
             raise RuntimeError(f"Inference failed: {e}") from e
@@ -150,10 +145,17 @@ class LlamaCppBackend(InferenceBackend):
         context: str = ""
     ) -> SimplificationResponse:
         """Simplify text to plain language."""
+        cache_key = ("simplify", text_digest(text), target_grade,
+                     preserve_acronyms, text_digest(context))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("simplify")
 
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             target_grade=target_grade,
             preserve_acronyms=preserve_acronyms,
             context=context
@@ -162,16 +164,16 @@ class LlamaCppBackend(InferenceBackend):
         response_text = await self._run_inference(prompt)
 
         try:
-            response_data = json.loads(response_text)
-            return SimplificationResponse(
+            response_data = orjson.loads(response_text)
+            return self._cache_result(cache_key, SimplificationResponse(
                 plain=response_data["plain"],
                 rationale=response_data.get("rationale", []),
                 cautions=response_data.get("cautions", []),
                 readability_grade=self._calculate_readability(
                     response_data["plain"]),
                 original_grade=self._calculate_readability(text)
-            )
-        except json.JSONDecodeError as e:
+            ))
+        except orjson.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse response: {e}") from e
 
     async def translate(
@@ -182,10 +184,17 @@ class LlamaCppBackend(InferenceBackend):
         experimental: bool = False
     ) -> TranslationResponse:
         """Translate text to target language."""
+        cache_key = ("translate", text_digest(text), target_language,
+                     preserve_terms, experimental)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("translate")
 
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             target_language=target_language,
             preserve_terms=preserve_terms,
             experimental=experimental
@@ -194,16 +203,16 @@ class LlamaCppBackend(InferenceBackend):
         response_text = await self._run_inference(prompt)
 
         try:
-            response_data = json.loads(response_text)
-            return TranslationResponse(
+            response_data = orjson.loads(response_text)
+            return self._cache_result(cache_key, TranslationResponse(
                 translated=response_data["translated"],
                 target_language=target_language,
                 preserved_terms=response_data.get("preserved_terms", []),
                 confidence=response_data.get("confidence", 0.8),
                 experimental=experimental,
                 cautions=response_data.get("cautions", [])
-            )
-        except json.JSONDecodeError as e:
+            ))
+        except orjson.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse response: {e}") from e
 
     async def expand_acronyms(
@@ -212,80 +221,27 @@ class LlamaCppBackend(InferenceBackend):
         context: str = ""
     ) -> AcronymResponse:
         """Find and expand acronyms in text."""
+        cache_key = ("acronyms", text_digest(text), text_digest(context))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("acronyms")
 
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             context=context
         )
 
         response_text = await self._run_inference(prompt)
 
         try:
-            response_data = json.loads(response_text)
-            return AcronymResponse(acronyms=response_data["acronyms"])
-        except json.JSONDecodeError as e:
+            response_data = orjson.loads(response_text)
+            return self._cache_result(cache_key, AcronymResponse(acronyms=response_data["acronyms"]))
+        except orjson.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse response: {e}") from e
 
     def _load_prompt_template(self, task: str) -> str:
         """Load prompt template for a specific task."""
-        template_path = Path(f"server/prompts/{task}.txt")
-        if template_path.exists():
-            return template_path.read_text(encoding='utf-8')
-
-        templates = {
-            "simplify": """You are a plain language expert. 
-            Simplify the following text to grade {target_grade} reading level. 
-
-Original text: {text}
-
-Instructions:
-- Use shorter sentences
-- Replace jargon with simple words
-- Keep the same meaning
-- Preserve acronyms if {preserve_acronyms}
-- Context: {context}
-
-Return JSON format:
-{{
-  "plain": "simplified text here",
-  "rationale": ["change 1", "change 2"],
-  "cautions": ["any warnings"]
-}}""",
-
-            "translate": """Translate the following text to {target_language}.
-
-Text: {text}
-
-Instructions:
-- Preserve official terms if {preserve_terms}
-- Maintain formal government tone
-- Experimental features: {experimental}
-
-Return JSON format:
-{{
-  "translated": "translated text",
-  "preserved_terms": ["term1", "term2"],
-  "confidence": 0.85,
-  "cautions": ["warnings"]
-}}""",
-
-            "acronyms": """Find and expand acronyms in the following text.
-
-Text: {text}
-Context: {context}
-
-Return JSON format:
-{{
-  "acronyms": [
-    {{
-      "acronym": "CRA",
-      "expansion": "Canada Revenue Agency",
-      "definition": "Federal tax agency",
-      "confidence": 0.95,
-      "source": "ai_inference"
-    }}
-  ]
-}}"""
-        }
-        return templates.get(task, "Process this text: {text}")
+        return read_prompt_file(task) or self.PROMPT_TEMPLATES.get(task, "Process this text: {text}")
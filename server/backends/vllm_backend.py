@@ -3,10 +3,16 @@ vLLM backend implementation for MapleClear.
 This is just a sample implementation and should not be used in production
 """
 
-import json
-from typing import Optional, List
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+from typing import ClassVar
 from pathlib import Path
 
+import orjson  # type: ignore # pylint: disable=import-error
+
 try:
     from vllm import LLM, SamplingParams # type: ignore # pylint: disable=import-error
     VLLM_AVAILABLE = True
@@ -15,19 +21,67 @@ except ImportError:
     LLM = None
     SamplingParams = None
 
-from .base import InferenceBackend
+from .base import (InferenceBackend, collect_batch, drain_queue, fail_batch,
+                   read_prompt_file, text_digest)
 from ..prompts.schema import SimplificationResponse, TranslationResponse, AcronymResponse, ModelInfo
+from ..prompts.templates import COMPACT_TEMPLATES
 
 DEMO_MODE_MESSAGE = "Running in demo mode..."
+# Canned vLLM responses used when no model is available
+DEMO_RESPONSES = {
+    "simplify": """{
+  "plain": "This is simplified text that's easier to read. We removed jargon and used shorter sentences.",
+  "rationale": [
+    "Replaced 'utilize' with 'use'",
+    "Split long sentence into two shorter ones",
+    "Removed unnecessary technical terms"
+  ],
+  "cautions": ["This is a demo response from vLLM backend"]
+}""",
+    "translate": """{
+  "translated": "Ceci est le texte traduit en français.",
+  "target_language": "French",
+  "preserved_terms": ["Canada Revenue Agency"],
+  "confidence": 0.85,
+  "cautions": ["This is a demo response from vLLM backend"]
+}""",
+    "acronyms": """{
+  "acronyms": [
+    {
+      "acronym": "CRA",
+      "expansion": "Canada Revenue Agency",
+      "definition": "Federal agency responsible for tax collection",
+      "confidence": 0.95,
+      "source": "ai_inference"
+    }
+  ]
+}""",
+    "default": '{"result": "Demo response for development"}',
+}
+# The first task keyword in the prompt picks the demo response
+DEMO_TASK_PATTERN = re.compile(
+    r"(?P<simplify>simplify|plain language)|(?P<translate>translate|french)|(?P<acronyms>acronym)",
+    re.IGNORECASE)
 
 
 class VLLMBackend(InferenceBackend):
     """Backend using vLLM for local inference."""
 
-    def __init__(self, model_path: str, adapters: Optional[List[str]] = None):
+    PROMPT_TEMPLATES: ClassVar[dict[str, str]] = COMPACT_TEMPLATES
+
+    def __init__(self, model_path: str, adapters: list[str] | None = None):
         super().__init__(model_path, adapters or [])
         self.llm = None
         self.sampling_params = None
+        # Resolved once; the info endpoint reuses the same ModelInfo afterwards
+        self._model_path = Path(self.model_path).expanduser()
+        self._model_info: ModelInfo | None = None
+        # Concurrent requests arriving within max_batch_wait share one generate();
+        # the single batch worker also keeps the non-re-entrant engine serialized
+        self.max_batch = int(os.getenv("MAPLECLEAR_MAX_BATCH", "8"))
+        self.max_batch_wait = int(os.getenv("MAPLECLEAR_BATCH_WAIT_MS", "10")) / 1000
+        self._batch_queue: asyncio.Queue | None = None
+        self._batch_worker: asyncio.Task | None = None
 
     async def initialize(self) -> None:
         """Initialize vLLM backend."""
@@ -48,7 +102,7 @@ class VLLMBackend(InferenceBackend):
                 max_tokens=512,
                 stop=["</s>", "<|endoftext|>"]
             )
-            model_path = Path(self.model_path).expanduser()
+            model_path = self._model_path
             if not model_path.exists():
                 print(f"Model not found: {model_path}")
                 print(DEMO_MODE_MESSAGE)
@@ -62,7 +116,9 @@ class VLLMBackend(InferenceBackend):
             self.llm = LLM(
                 model=str(model_path),
                 tensor_parallel_size=1,
-                gpu_memory_utilization=0.9
+                gpu_memory_utilization=0.9,
+                # Requests for a task share their template prefix; reuse its KV blocks
+                enable_prefix_caching=True
             )
         except ImportError:
             print("❌ vLLM not installed. Install with: pip install vllm")
@@ -73,67 +129,92 @@ class VLLMBackend(InferenceBackend):
 
     async def cleanup(self) -> None:
         """Clean up resources."""
+        if self._batch_worker:
+            # The worker fails its in-flight batch as it is cancelled; requests
+            # still queued behind it would otherwise wait forever
+            self._batch_worker.cancel()
+            self._batch_worker = None
+            fail_batch(drain_queue(self._batch_queue))
         if self.llm:
             del self.llm
             self.llm = None
 
     async def get_model_info(self) -> ModelInfo:
         """Get model information."""
-        model_path = Path(self.model_path).expanduser()
-        return ModelInfo(
-            name=model_path.name if model_path.exists() else "demo-model",
-            size="20B" if "20b" in str(model_path).lower() else "unknown",
-            backend="vLLM",
-            adapters=self.adapters,
-            memory_usage="~16GB" if "20b" in str(
-                model_path).lower() else "unknown"
-        )
+        if self._model_info is None:
+            model_path = self._model_path
+            is_20b = "20b" in str(model_path).lower()
+            self._model_info = ModelInfo(
+                name=model_path.name if model_path.exists() else "demo-model",
+                size="20B" if is_20b else "unknown",
+                backend="vLLM",
+                adapters=self.adapters,
+                memory_usage="~16GB" if is_20b else "unknown"
+            )
+        return self._model_info
+
+    async def _infer(self, prompt: str) -> str:
+        """Queue a prompt for the next micro-batch and wait for its response."""
+        if not self.llm:
+            # Demo mode returns immediately without a thread hop
+            return self._get_demo_response(prompt)
+
+        if self._batch_worker is None or self._batch_worker.done():
+            self._batch_queue = asyncio.Queue()
+            self._batch_worker = asyncio.create_task(self._batch_loop())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((prompt, future))
+        return await future
+
+    async def _batch_loop(self) -> None:
+        """Collect queued prompts into batches of up to max_batch and run them."""
+        batch: list = []
+        try:
+            while True:
+                batch = []
+                await collect_batch(self._batch_queue, batch, self.max_batch,
+                                    self.max_batch_wait)
+
+                try:
+                    # Generate off the event loop so other requests keep being served
+                    results = await asyncio.to_thread(
+                        self._run_batch_inference, [prompt for prompt, _ in batch])
+                # Deliberately broad: whatever the batch raised belongs to the callers
+                # awaiting it, and the worker must survive to serve later batches
+                except Exception as e:  # pylint: disable=broad-except  # noqa: BLE001
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+        except asyncio.CancelledError:
+            fail_batch(batch)
+            raise
 
     def _run_inference(self, prompt: str) -> str:
         """Run inference using vLLM."""
+        return self._run_batch_inference([prompt])[0]
+
+    def _run_batch_inference(self, prompts: list[str]) -> list[str]:
+        """Generate for a batch of prompts in one vLLM generate() call."""
         if not self.llm:
             # Return demo response for development
-            return self._get_demo_response(prompt)
+            return [self._get_demo_response(prompt) for prompt in prompts]
 
         try:
-            outputs = self.llm.generate([prompt], self.sampling_params)
-            return outputs[0].outputs[0].text.strip()
+            # vLLM schedules the whole list together and returns outputs in input order
+            outputs = self.llm.generate(prompts, self.sampling_params)
+            return [output.outputs[0].text.strip() for output in outputs]
         except Exception as e:
             raise RuntimeError(f"vLLM inference failed: {e}") from e
 
     def _get_demo_response(self, prompt: str) -> str:
         """Return demo responses for development without a real model."""
-        if "simplify" in prompt.lower() or "plain language" in prompt.lower():
-            return """{
-  "plain": "This is simplified text that's easier to read. We removed jargon and used shorter sentences.",
-  "rationale": [
-    "Replaced 'utilize' with 'use'",
-    "Split long sentence into two shorter ones",
-    "Removed unnecessary technical terms"
-  ],
-  "cautions": ["This is a demo response from vLLM backend"]
-}"""
-        if "translate" in prompt.lower() or "french" in prompt.lower():
-            return """{
-  "translated": "Ceci est le texte traduit en français.",
-  "target_language": "French",
-  "preserved_terms": ["Canada Revenue Agency"],
-  "confidence": 0.85,
-  "cautions": ["This is a demo response from vLLM backend"]
-}"""
-        if "acronym" in prompt.lower():
-            return """{
-  "acronyms": [
-    {
-      "acronym": "CRA",
-      "expansion": "Canada Revenue Agency",
-      "definition": "Federal agency responsible for tax collection",
-      "confidence": 0.95,
-      "source": "ai_inference"
-    }
-  ]
-}"""
-        return '{"result": "Demo response for development"}'
+        match = DEMO_TASK_PATTERN.search(prompt)
+        return DEMO_RESPONSES[match.lastgroup if match else "default"]
 
     async def simplify(
         self,
@@ -143,31 +224,42 @@ class VLLMBackend(InferenceBackend):
         context: str = ""
     ) -> SimplificationResponse:
         """Simplify text to plain language."""
+        cache_key = ("simplify", text_digest(text), target_grade,
+                     preserve_acronyms, text_digest(context))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("simplify")
 
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             target_grade=target_grade,
             preserve_acronyms=preserve_acronyms,
             context=context
         )
 
-        # For demo mode, return immediately without trying to run inference
-        response_text = self._get_demo_response(prompt)
+        response_text = await self._infer(prompt)
+        if not self.llm:
+            # Demo output; don't pin it in the cache
+            cache_key = None
 
         try:
-            response_data = json.loads(response_text)
-            return SimplificationResponse(
-                plain=response_data["plain"],
-                rationale=response_data.get("rationale", []),
-                cautions=response_data.get("cautions", []),
-                readability_grade=self._calculate_readability(
-                    response_data["plain"]),
-                original_grade=self._calculate_readability(text)
-            )
-        except json.JSONDecodeError as e:
+            response_data = orjson.loads(response_text)
+        except orjson.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse response: {e}") from e
 
+        readability_grade, original_grade = await self._readability_grades(
+            response_data["plain"], text)
+        return self._cache_result(cache_key, SimplificationResponse(
+            plain=response_data["plain"],
+            rationale=response_data.get("rationale", []),
+            cautions=response_data.get("cautions", []),
+            readability_grade=readability_grade,
+            original_grade=original_grade
+        ))
+
     async def translate(
         self,
         text: str,
@@ -176,29 +268,38 @@ class VLLMBackend(InferenceBackend):
         experimental: bool = False
     ) -> TranslationResponse:
         """Translate text to target language."""
+        cache_key = ("translate", text_digest(text), target_language,
+                     preserve_terms, experimental)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("translate")
 
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             target_language=target_language,
             preserve_terms=preserve_terms,
             experimental=experimental
         )
 
-        # For demo mode, return immediately without trying to run inference
-        response_text = self._get_demo_response(prompt)
+        response_text = await self._infer(prompt)
+        if not self.llm:
+            # Demo output; don't pin it in the cache
+            cache_key = None
 
         try:
-            response_data = json.loads(response_text)
-            return TranslationResponse(
+            response_data = orjson.loads(response_text)
+            return self._cache_result(cache_key, TranslationResponse(
                 translated=response_data["translated"],
                 target_language=target_language,
                 preserved_terms=response_data.get("preserved_terms", []),
                 confidence=response_data.get("confidence", 0.8),
                 experimental=experimental,
                 cautions=response_data.get("cautions", [])
-            )
-        except json.JSONDecodeError as e:
+            ))
+        except orjson.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse response: {e}") from e
 
     async def expand_acronyms(
@@ -207,82 +308,30 @@ class VLLMBackend(InferenceBackend):
         context: str = ""
     ) -> AcronymResponse:
         """Find and expand acronyms in text."""
+        cache_key = ("acronyms", text_digest(text), text_digest(context))
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         prompt_template = self._load_prompt_template("acronyms")
 
-        prompt = prompt_template.format(
-            text=text,
+        prompt = self._render_prompt(
+            prompt_template,
+            text,
             context=context
         )
 
-        # For demo mode, return immediately without trying to run inference
-        response_text = self._get_demo_response(prompt)
+        response_text = await self._infer(prompt)
+        if not self.llm:
+            # Demo output; don't pin it in the cache
+            cache_key = None
 
         try:
-            response_data = json.loads(response_text)
-            return AcronymResponse(acronyms=response_data["acronyms"])
-        except json.JSONDecodeError as e:
+            response_data = orjson.loads(response_text)
+            return self._cache_result(cache_key, AcronymResponse(acronyms=response_data["acronyms"]))
+        except orjson.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse response: {e}") from e
 
     def _load_prompt_template(self, task: str) -> str:
         """Load prompt template for a specific task."""
-        template_path = Path(f"server/prompts/{task}.txt")
-        if template_path.exists():
-            return template_path.read_text(encoding="utf-8")
-
-        templates = {
-            "simplify": """You are a plain language expert. 
-            Simplify the following text to grade {target_grade} reading level.
-
-Original text: {text}
-
-Instructions:
-- Use shorter sentences
-- Replace jargon with simple words
-- Keep the same meaning
-- Preserve acronyms if {preserve_acronyms}
-- Context: {context}
-
-Return JSON format:
-{{
-  "plain": "simplified text here",
-  "rationale": ["change 1", "change 2"],
-  "cautions": ["any warnings"]
-}}""",
-
-            "translate": """Translate the following text to {target_language}.
-
-Text: {text}
-
-Instructions:
-- Preserve official terms if {preserve_terms}
-- Maintain formal government tone
-- Experimental features: {experimental}
-
-Return JSON format:
-{{
-  "translated": "translated text",
-  "preserved_terms": ["term1", "term2"],
-  "confidence": 0.85,
-  "cautions": ["warnings"]
-}}""",
-
-            "acronyms": """Find and expand acronyms in the following text.
-
-Text: {text}
-Context: {context}
-
-Return JSON format:
-{{
-  "acronyms": [
-    {{
-      "acronym": "CRA",
-      "expansion": "Canada Revenue Agency",
-      "definition": "Federal tax agency",
-      "confidence": 0.95,
-      "source": "ai_inference"
-    }}
-  ]
-}}"""
-        }
-
-        return templates.get(task, "Process this text: {text}")
+        return read_prompt_file(task) or self.PROMPT_TEMPLATES.get(task, "Process this text: {text}")
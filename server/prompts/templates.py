@@ -0,0 +1,147 @@
+"""
+Default prompt templates shared by the local inference backends.
+
+A server/prompts/<task>.txt file overrides the template for its task.
+
+Each template opens with its fixed instructions and puts the per-request
+fields last, with {text} at the very end. Every request for a task then
+shares the same leading tokens, which prefix-caching servers (LM Studio,
+vLLM) reuse instead of re-evaluating.
+"""
+
+# Detailed instructions for larger models (Hugging Face, LM Studio)
+DETAILED_TEMPLATES: dict[str, str] = {
+    # pylint: disable=line-too-long
+    "simplify": """You are a plain language expert specializing in simplifying Canadian government text.
+
+Task: Simplify the text below to the target reading level while preserving meaning and official terms.
+
+Requirements:
+- Use shorter sentences (15-20 words max)
+- Replace jargon with everyday words
+- Use active voice
+- Keep the same essential meaning
+
+Respond ONLY with valid JSON in this exact format:
+{{
+  "plain": "simplified text here",
+  "rationale": ["specific change 1", "specific change 2"],
+  "cautions": ["any important warnings or limitations"]
+}}
+
+Target reading level: Grade {target_grade}
+Preserve acronyms: {preserve_acronyms}
+Context: {context}
+
+Original text: "{text}\"""",
+
+    "translate": """You are a Canadian government translation expert.
+
+Task: Translate the text below to the target language while maintaining official tone and preserving government terminology.
+
+Requirements:
+- Maintain formal government tone
+- Ensure accuracy for government communications
+
+Respond ONLY with valid JSON in this exact format:
+{{
+  "translated": "translated text here",
+  "preserved_terms": ["term1", "term2"],
+  "confidence": 0.95,
+  "cautions": ["any translation notes or warnings"]
+}}
+
+Target language: {target_language}
+Preserve official terms and department names: {preserve_terms}
+Experimental features enabled: {experimental}
+
+Text to translate: "{text}\"""",
+
+    "acronyms": """You are an expert in Canadian government terminology and acronyms.
+
+Task: Identify and expand all acronyms in the text below, providing clear definitions suitable for public understanding.
+
+Requirements:
+- Focus on government, legal, and administrative acronyms
+- Provide clear, public-friendly definitions
+- Include confidence scores based on certainty
+- Note the source of information
+
+Respond ONLY with valid JSON in this exact format:
+{{
+  "acronyms": [
+    {{
+      "acronym": "CRA",
+      "expansion": "Canada Revenue Agency",
+      "definition": "Federal agency responsible for tax collection and benefits administration",
+      "confidence": 0.95,
+      "source": "ai_inference"
+    }}
+  ]
+}}
+
+Context: "{context}"
+
+Text: "{text}\"""",
+}
+
+# Compact instructions for the llama.cpp and vLLM backends
+COMPACT_TEMPLATES: dict[str, str] = {
+    "simplify": """You are a plain language expert. Simplify the text below to the requested reading level.
+
+Instructions:
+- Use shorter sentences
+- Replace jargon with simple words
+- Keep the same meaning
+
+Return JSON format:
+{{
+  "plain": "simplified text here",
+  "rationale": ["change 1", "change 2"],
+  "cautions": ["any warnings"]
+}}
+
+Reading level: grade {target_grade}
+Preserve acronyms: {preserve_acronyms}
+Context: {context}
+
+Original text: {text}""",
+
+    "translate": """Translate the text below to the requested language.
+
+Instructions:
+- Maintain formal government tone
+
+Return JSON format:
+{{
+  "translated": "translated text",
+  "preserved_terms": ["term1", "term2"],
+  "confidence": 0.85,
+  "cautions": ["warnings"]
+}}
+
+Target language: {target_language}
+Preserve official terms: {preserve_terms}
+Experimental features: {experimental}
+
+Text: {text}""",
+
+    "acronyms": """Find and expand acronyms in the text below.
+
+Return JSON format:
+{{
+  "acronyms": [
+    {{
+      "acronym": "CRA",
+      "expansion": "Canada Revenue Agency",
+      "definition": "Federal tax agency",
+      "confidence": 0.95,
+      "source": "ai_inference"
+    }}
+  ]
+}}
+
+Context: {context}
+
+Text: {text}""",
+}
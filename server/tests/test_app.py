@@ -0,0 +1,102 @@
+"""Tests for the FastAPI acronym lookup endpoint."""
+
+import sqlite3
+from collections import OrderedDict
+
+import httpx
+import pytest
+from aiosqlitepool import SQLiteConnectionPool
+
+from server import app as app_module
+from server.app import (
+    Config,
+    _connect_terms_db,
+    _init_terms_schema,
+    _remember_acronym,
+    app,
+)
+
+ACRONYMS = [
+    ("CRA", "Canada Revenue Agency", "Federal tax administrator", "https://canada.ca/cra"),
+    ("Esdc", "Employment and Social Development Canada", "Federal department",
+     "https://canada.ca/esdc"),
+]
+
+
+async def expand(text):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app),
+                                 base_url="http://test") as client:
+        return await client.post("/expand-acronyms", json={"text": text})
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(app_module, "_acronym_cache", OrderedDict())
+    monkeypatch.setattr(app.state, "terms_pool", None, raising=False)
+
+
+@pytest.mark.asyncio
+async def test_expand_acronyms_without_terms_database_returns_empty():
+    response = await expand("The CRA and ESDC")
+
+    assert response.status_code == 200
+    assert response.json()["acronyms"] == []
+
+
+async def seeded_pool(db_path, rows):
+    Config.TERMS_DB = str(db_path)
+    await _init_terms_schema()
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany("INSERT INTO acronyms (acronym, expansion, definition, source_url) "
+                         "VALUES (?, ?, ?, ?)", rows)
+    return SQLiteConnectionPool(_connect_terms_db)
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "TERMS_DB", Config.TERMS_DB)
+    return tmp_path / "terms.sqlite"
+
+
+@pytest.mark.asyncio
+async def test_expand_acronyms_matches_several_acronyms_case_insensitively(db_path):
+    app.state.terms_pool = await seeded_pool(db_path, ACRONYMS)
+    try:
+        response = await expand("Ask the CRA, then ESDC, then XYZ, then the CRA again")
+    finally:
+        await app.state.terms_pool.close()
+
+    assert response.status_code == 200
+    assert [(item["acronym"], item["expansion"]) for item in response.json()["acronyms"]] == [
+        ("CRA", "Canada Revenue Agency"),
+        ("ESDC", "Employment and Social Development Canada"),
+    ]
+    assert app_module._acronym_cache["XYZ"] is None
+
+
+@pytest.mark.asyncio
+async def test_expand_acronyms_remembers_unknown_acronyms(db_path):
+    app.state.terms_pool = await seeded_pool(db_path, ACRONYMS)
+    try:
+        await expand("CRA and XYZ")
+        # The database is only written by the seeding tool, so a miss is
+        # remembered until restart even if the acronym appears later
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("INSERT INTO acronyms (acronym, expansion) VALUES ('XYZ', 'Late entry')")
+        response = await expand("XYZ and CRA")
+    finally:
+        await app.state.terms_pool.close()
+
+    assert [item["acronym"] for item in response.json()["acronyms"]] == ["CRA"]
+
+
+def test_acronym_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(app_module, "ACRONYM_CACHE_SIZE", 2)
+    row = ("Canada Revenue Agency", "", "")
+
+    _remember_acronym("CRA", row)
+    _remember_acronym("XYZ", None)
+    app_module._acronym_cache.move_to_end("CRA")
+    _remember_acronym("GST", row)
+
+    assert list(app_module._acronym_cache) == ["CRA", "GST"]
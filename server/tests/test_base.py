@@ -0,0 +1,106 @@
+"""Tests for the prompt rendering and micro-batching helpers shared by every backend."""
+
+import asyncio
+
+import pytest
+
+from server.backends.base import _prompt_pieces, collect_batch
+from server.backends.groq_backend import GroqBackend
+
+
+def render(template, text, **fields):
+    return GroqBackend()._render_prompt(template, text, **fields)
+
+
+def test_render_matches_str_format():
+    template = GroqBackend.PROMPT_TEMPLATES["simplify"]
+    fields = {"target_grade": 6, "preserve_acronyms": True, "context": ""}
+
+    assert render(template, "Plain text.", **fields) == template.format(
+        text="Plain text.", **fields)
+
+
+def test_render_keeps_escaped_template_braces_literal():
+    rendered = render('Grade {target_grade}: {text}\n{{"plain": "..."}}',
+                      "Hello", target_grade=7)
+
+    assert rendered == 'Grade 7: Hello\n{"plain": "..."}'
+
+
+def test_render_inserts_text_with_braces_verbatim():
+    text = 'Fill in {target_grade} and {{name}} or {"json": 1} or {'
+
+    rendered = render("Grade {target_grade}: {text}", text, target_grade=7)
+
+    assert rendered == "Grade 7: " + text
+
+
+def test_render_fills_every_text_slot():
+    assert render("{text} / {text}", "{x}") == "{x} / {x}"
+
+
+def test_prompt_pieces_are_cached_per_template_and_fields():
+    _prompt_pieces.cache_clear()
+
+    render("Grade {target_grade}: {text}", "one", target_grade=7)
+    render("Grade {target_grade}: {text}", "two", target_grade=7)
+    render("Grade {target_grade}: {text}", "three", target_grade=8)
+
+    info = _prompt_pieces.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_collect_batch_takes_queued_items_up_to_max_batch():
+    queue = asyncio.Queue()
+    for item in range(5):
+        queue.put_nowait(item)
+    batch = []
+
+    await collect_batch(queue, batch, max_batch=3, max_wait=10.0)
+
+    assert batch == [0, 1, 2]
+    assert queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_collect_batch_waits_for_late_items_until_deadline():
+    queue = asyncio.Queue()
+    queue.put_nowait("first")
+    asyncio.get_running_loop().call_later(0.01, queue.put_nowait, "late")
+    batch = []
+
+    await collect_batch(queue, batch, max_batch=8, max_wait=0.2)
+
+    assert batch == ["first", "late"]
+
+
+@pytest.mark.asyncio
+async def test_collect_batch_leaves_no_getter_behind_after_timeout():
+    queue = asyncio.Queue()
+    queue.put_nowait("first")
+    batch = []
+
+    await collect_batch(queue, batch, max_batch=8, max_wait=0.01)
+    await asyncio.sleep(0)
+    queue.put_nowait("next")
+
+    assert batch == ["first"]
+    assert queue.get_nowait() == "next"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_collect_batch_keeps_dequeued_items():
+    queue = asyncio.Queue()
+    queue.put_nowait("first")
+    batch = []
+    task = asyncio.create_task(collect_batch(queue, batch, max_batch=8, max_wait=10.0))
+    await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    queue.put_nowait("next")
+
+    assert batch == ["first"]
+    assert queue.get_nowait() == "next"
@@ -0,0 +1,327 @@
+"""Tests for the Groq backend's response parsing and flow-control helpers."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from server.backends import groq_backend
+from server.backends.groq_backend import (
+    CIRCUIT_BREAKER_THRESHOLD,
+    LATENCY_MIN_INFLIGHT,
+    LATENCY_TARGET_SECONDS,
+    LATENCY_WINDOW,
+    MAX_COMPLETION_TOKENS,
+    AIMDLimiter,
+    GroqAPIError,
+    GroqBackend,
+    GroqConnectionError,
+    SlidingWindowLimiter,
+    StreamingFieldDecoder,
+    _find_first_json_object,
+)
+
+COMPLETIONS_REQUEST = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+
+
+class FakeClient:
+    """Stand-in for the shared httpx client, replaying canned responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    @asynccontextmanager
+    async def stream(self, method, url, content=None):
+        self.calls += 1
+        yield self.responses.pop(0)
+
+
+def completion(status_code, content=""):
+    body = f'data: {{"choices": [{{"delta": {{"content": "{content}"}}}}]}}\n\ndata: [DONE]\n'
+    return httpx.Response(status_code, text=body, request=COMPLETIONS_REQUEST)
+
+
+def live_backend(responses):
+    backend = GroqBackend()
+    backend.client = FakeClient(responses)
+    backend._live = True
+    backend.max_retries = 0
+    return backend
+
+
+class FakeClock:
+    """Monotonic clock whose sleeps advance time instantly."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.slept.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(groq_backend.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(groq_backend.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+async def collect(backend):
+    return [delta async for delta in backend._stream_deltas("prompt")]
+
+
+def feed_all(decoder, chunks):
+    return [decoder.feed(chunk) for chunk in chunks]
+
+
+def test_decoder_waits_for_marker_split_across_chunks():
+    decoder = StreamingFieldDecoder("plain")
+
+    assert feed_all(decoder, ['{"rationale": [], "pla', 'in"', ' : "Hel', 'lo"}']) == [
+        "", "", "Hel", "lo"]
+    assert decoder.started
+    assert decoder.finished
+
+
+def test_decoder_holds_back_escape_split_across_chunks():
+    decoder = StreamingFieldDecoder("plain")
+
+    assert feed_all(decoder, ['{"plain": "a\\', 'n b"}']) == ["a", "\n b"]
+
+
+def test_decoder_handles_escaped_quotes():
+    decoder = StreamingFieldDecoder("plain")
+
+    assert feed_all(decoder, ['{"plain": "say \\', '"hi\\"', '" done"}']) == [
+        "say ", '"hi"', ""]
+    assert decoder.finished
+
+
+def test_decoder_waits_for_complete_unicode_escapes():
+    decoder = StreamingFieldDecoder("plain")
+
+    assert feed_all(decoder, ['{"plain": "caf\\u00', 'e9 ', '\\ud83d', '\\ude00"}']) == [
+        "caf", "é ", "", "\U0001F600"]
+
+
+def test_decoder_ignores_chunks_after_field_ends():
+    decoder = StreamingFieldDecoder("plain")
+
+    assert feed_all(decoder, ['{"plain": "done", ', '"cautions": ["x"]}']) == ["done", ""]
+
+
+def test_decoder_passes_through_raw_control_characters_and_bad_escapes():
+    decoder = StreamingFieldDecoder("plain")
+
+    assert feed_all(decoder, ['{"plain": "line one\nline two ', '\\x"}']) == [
+        "line one\nline two ", "\\x"]
+
+
+def test_decoder_never_starts_without_field():
+    decoder = StreamingFieldDecoder("plain")
+
+    assert feed_all(decoder, ['{"translated": ', '"plain text"}']) == ["", ""]
+    assert not decoder.started
+
+
+def test_find_first_json_object_ignores_braces_in_strings():
+    content = 'Sure: {"plain": "use {x} and \\"}\\" here", "n": {"a": 1}} trailing }'
+
+    assert _find_first_json_object(content) == (
+        '{"plain": "use {x} and \\"}\\" here", "n": {"a": 1}}')
+
+
+def test_find_first_json_object_returns_none_when_unbalanced():
+    assert _find_first_json_object('no json here') is None
+    assert _find_first_json_object('{"plain": "cut off {') is None
+
+
+def test_aimd_increases_additively_up_to_maximum():
+    limiter = AIMDLimiter(maximum=4)
+    limiter.limit = 2.0
+
+    limiter.record_success()
+    assert limiter.limit == 2.5
+    for _ in range(10):
+        limiter.record_success()
+    assert limiter.limit == 4.0
+
+
+def test_aimd_decreases_multiplicatively_down_to_floor():
+    limiter = AIMDLimiter(maximum=16, minimum=2)
+
+    limiter.record_overload()
+    assert limiter.limit == 8.0
+    for _ in range(10):
+        limiter.record_overload()
+    assert limiter.limit == 2.0
+
+
+@pytest.mark.asyncio
+async def test_aimd_admits_only_limit_callers():
+    limiter = AIMDLimiter(maximum=2)
+    limiter.record_overload()
+    entered = []
+
+    async def call(name):
+        async with limiter:
+            entered.append(name)
+            await asyncio.sleep(0.01)
+
+    first = asyncio.create_task(call("first"))
+    second = asyncio.create_task(call("second"))
+    await asyncio.sleep(0)
+    assert entered == ["first"]
+    await asyncio.gather(first, second)
+    assert entered == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_consecutive_server_errors():
+    backend = live_backend([completion(503)] * CIRCUIT_BREAKER_THRESHOLD)
+
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        with pytest.raises(GroqAPIError):
+            await collect(backend)
+    with pytest.raises(GroqConnectionError, match="circuit open"):
+        await collect(backend)
+    assert backend.client.calls == CIRCUIT_BREAKER_THRESHOLD
+
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_reopens_on_first_failure():
+    backend = live_backend([completion(503)] * (CIRCUIT_BREAKER_THRESHOLD + 1))
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        with pytest.raises(GroqAPIError):
+            await collect(backend)
+
+    backend._circuit_open_until = time.monotonic()
+    with pytest.raises(GroqAPIError):
+        await collect(backend)
+    with pytest.raises(GroqConnectionError, match="circuit open"):
+        await collect(backend)
+
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_closes_on_success():
+    backend = live_backend([completion(503)] * CIRCUIT_BREAKER_THRESHOLD
+                           + [completion(200, "ok"), completion(503), completion(200, "ok")])
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        with pytest.raises(GroqAPIError):
+            await collect(backend)
+
+    backend._circuit_open_until = time.monotonic()
+    assert await collect(backend) == [{"content": "ok"}]
+    with pytest.raises(GroqAPIError):
+        await collect(backend)
+    assert await collect(backend) == [{"content": "ok"}]
+
+
+def test_slow_responses_back_off_once_per_window_above_floor():
+    backend = GroqBackend()
+    backend._inflight = AIMDLimiter(maximum=64)
+    slow = LATENCY_TARGET_SECONDS * 2
+
+    for _ in range(LATENCY_WINDOW - 1):
+        backend._observe_rate_limits(completion(200), slow)
+    assert backend._inflight.limit == 64.0
+    backend._observe_rate_limits(completion(200), slow)
+    assert backend._inflight.limit == 32.0
+
+    for _ in range(LATENCY_WINDOW * 10):
+        backend._observe_rate_limits(completion(200), slow)
+    assert backend._inflight.limit == LATENCY_MIN_INFLIGHT
+
+    backend._observe_rate_limits(completion(503))
+    assert backend._inflight.limit == LATENCY_MIN_INFLIGHT / 2
+
+
+@pytest.mark.asyncio
+async def test_rpm_window_waits_for_oldest_request_to_expire(clock):
+    limiter = SlidingWindowLimiter(2, window=60.0)
+
+    await limiter.acquire()
+    clock.now += 10
+    await limiter.acquire()
+    assert clock.slept == []
+
+    await limiter.acquire()
+    assert clock.slept == [50.0]
+    clock.now += 10
+    await limiter.acquire()
+    assert clock.slept == [50.0]
+    await limiter.acquire()
+    assert clock.slept == [50.0, 50.0]
+
+
+@pytest.mark.asyncio
+async def test_tpm_window_waits_until_enough_weight_expires(clock):
+    limiter = SlidingWindowLimiter(1000, window=60.0)
+
+    await limiter.acquire(600)
+    clock.now += 20
+    await limiter.acquire(300)
+    await limiter.acquire(300)
+    assert clock.slept == [40.0]
+    # Oversized requests are capped at the capacity rather than waiting forever
+    await limiter.acquire(5000)
+    assert clock.slept == [40.0, 20.0, 40.0]
+
+
+@pytest.mark.asyncio
+async def test_settle_returns_unused_budget(clock):
+    limiter = SlidingWindowLimiter(1000, window=60.0)
+
+    reservation = await limiter.acquire(900)
+    limiter.settle(reservation, 200)
+    await limiter.acquire(800)
+    assert clock.slept == []
+
+
+@pytest.mark.asyncio
+async def test_disabled_limiter_never_waits(clock):
+    limiter = SlidingWindowLimiter(0)
+
+    for _ in range(100):
+        assert await limiter.acquire(10_000) is None
+    assert clock.slept == []
+
+
+@pytest.mark.asyncio
+async def test_stream_settles_token_budget_to_reported_usage():
+    body = ('data: {"choices": [{"delta": {"content": "ok"}}]}\n\n'
+            'data: {"choices": [], "x_groq": {"usage": {"total_tokens": 42}}}\n\n'
+            'data: [DONE]\n')
+    backend = live_backend([httpx.Response(200, text=body, request=COMPLETIONS_REQUEST),
+                            completion(400)])
+    backend._tpm_limiter = SlidingWindowLimiter(10 * MAX_COMPLETION_TOKENS)
+
+    assert await collect(backend) == [{"content": "ok"}]
+    assert backend._tpm_limiter._used == 42
+    with pytest.raises(GroqAPIError):
+        await collect(backend)
+    assert backend._tpm_limiter._used == 42
+
+
+@pytest.mark.asyncio
+async def test_reasoning_only_translation_is_not_cached():
+    body = ('data: {"choices": [{"delta": {"reasoning": "We need to translate."}}]}\n\n'
+            'data: [DONE]\n')
+    backend = live_backend([httpx.Response(200, text=body, request=COMPLETIONS_REQUEST),
+                            completion(200, "Bonjour")])
+
+    first = await backend.translate("Hello")
+    second = await backend.translate("Hello")
+
+    assert first.translated == "We need to translate."
+    assert second.translated == "Bonjour"
+    assert backend.client.calls == 2
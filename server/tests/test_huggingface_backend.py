@@ -0,0 +1,56 @@
+"""Tests for the Hugging Face backend's prompt budgeting."""
+
+from server.backends.huggingface_backend import MAX_PROMPT_TOKENS, HuggingFaceBackend
+
+
+class WordTokenizer:
+    """Tokenizer stand-in with one token per whitespace-separated word."""
+
+    def __call__(self, text, add_special_tokens=True):
+        return {"input_ids": text.split()}
+
+    def decode(self, ids):
+        return " ".join(ids)
+
+
+def backend_with_tokenizer():
+    backend = HuggingFaceBackend(model_path="test-model")
+    backend.tokenizer = WordTokenizer()
+    return backend
+
+
+def test_short_prompt_is_rendered_unchanged():
+    backend = backend_with_tokenizer()
+    template = backend.PROMPT_TEMPLATES["simplify"]
+
+    prompt = backend._render_prompt(template, "A short text.", target_grade=7,
+                                    preserve_acronyms=True, context="")
+
+    assert prompt == template.format(text="A short text.", target_grade=7,
+                                     preserve_acronyms=True, context="")
+
+
+def test_long_text_is_cut_but_instructions_are_kept():
+    backend = backend_with_tokenizer()
+    template = backend.PROMPT_TEMPLATES["simplify"]
+    text = " ".join(f"word{i}" for i in range(MAX_PROMPT_TOKENS * 2))
+
+    prompt = backend._render_prompt(template, text, target_grade=7,
+                                    preserve_acronyms=True, context="")
+
+    assert len(prompt.split()) == MAX_PROMPT_TOKENS
+    assert prompt.startswith(template.split("{", 1)[0])
+    assert "Target reading level: Grade 7" in prompt
+    assert 'Original text: "word0 word1 ' in prompt
+    assert prompt.endswith('"')
+
+
+def test_text_repeated_in_several_slots_shares_the_cut():
+    backend = backend_with_tokenizer()
+    text = " ".join(["word"] * MAX_PROMPT_TOKENS)
+
+    prompt = backend._render_prompt("Instructions here. A: {text} B: {text}", text)
+
+    assert len(prompt.split()) <= MAX_PROMPT_TOKENS
+    assert prompt.startswith("Instructions here. A: word")
+    assert " B: word" in prompt
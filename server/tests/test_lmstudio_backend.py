@@ -0,0 +1,66 @@
+"""Tests for the LM Studio backend's streamed completion handling."""
+
+import orjson
+import pytest
+
+from server.backends.lmstudio_backend import LMStudioBackend
+
+
+class FakeStreamResponse:
+    """Stand-in for an aiohttp response whose body is an SSE stream."""
+
+    def __init__(self, tokens):
+        self.lines = [b"data: " + orjson.dumps({"choices": [{"text": token}]}) + b"\n"
+                      for token in tokens]
+        self.lines.append(b"data: [DONE]\n")
+        self.consumed = 0
+
+    @property
+    def content(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for line in self.lines:
+            self.consumed += 1
+            yield line
+
+
+@pytest.fixture
+def backend():
+    return LMStudioBackend(model_path="test-model")
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_after_first_complete_object(backend):
+    response = FakeStreamResponse(
+        ['{"plain": "Use ', 'a {brace}', ' here."', '}', '\n\nExtra chatter', ' {"more": 1}'])
+
+    content = await backend._read_completion_stream(response)
+
+    assert content == '{"plain": "Use a {brace} here."}'
+    # Stopped right after the token that closed the object
+    assert response.consumed == 4
+
+
+@pytest.mark.asyncio
+async def test_stream_reads_to_done_without_complete_object(backend):
+    response = FakeStreamResponse(['{"plain": ', '"unfinished'])
+
+    content = await backend._read_completion_stream(response)
+
+    assert content == '{"plain": "unfinished'
+    assert response.consumed == len(response.lines)
+
+
+@pytest.mark.asyncio
+async def test_stream_skips_keepalives_and_empty_choices(backend):
+    response = FakeStreamResponse(['{"a": 1}'])
+    response.lines[:0] = [b": keep-alive\n", b"data: " + orjson.dumps({"choices": []}) + b"\n"]
+
+    assert await backend._read_completion_stream(response) == '{"a": 1}'
+
+
+def test_has_complete_object_ignores_braces_in_strings():
+    assert not LMStudioBackend._has_complete_object('{"plain": "}"')
+    assert LMStudioBackend._has_complete_object('noise {"plain": "}"} tail')
+    assert not LMStudioBackend._has_complete_object("no object")
@@ -0,0 +1,63 @@
+"""Tests for tools/seed_terms.py, which builds the database the server reads."""
+
+import sqlite3
+import sys
+from contextlib import closing
+
+import orjson
+import pytest
+
+from tools import seed_terms
+
+
+def row_counts(db_path):
+    with closing(sqlite3.connect(db_path)) as conn:
+        return {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("acronyms", "terms")}
+
+
+def run_seeder(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["seed_terms.py", *map(str, args)])
+    seed_terms.main()
+
+
+@pytest.fixture
+def custom_acronyms(tmp_path):
+    path = tmp_path / "acronyms.json"
+    path.write_bytes(orjson.dumps([{
+        "acronym": "MAPLE", "expansion": "Test expansion", "definition": "",
+        "source_url": "", "language": "en"
+    }]))
+    return path
+
+
+def test_reseeding_keeps_row_counts_stable(tmp_path, monkeypatch, custom_acronyms):
+    db_path = tmp_path / "terms.sqlite"
+
+    run_seeder(monkeypatch, "--out", db_path, "--custom-acronyms", custom_acronyms)
+    first = row_counts(db_path)
+    run_seeder(monkeypatch, "--out", db_path, "--custom-acronyms", custom_acronyms)
+
+    assert row_counts(db_path) == first
+    assert first == {
+        "acronyms": len(seed_terms.GOVERNMENT_ACRONYMS) + 1,
+        "terms": len(seed_terms.GOVERNMENT_TERMS),
+    }
+
+
+def test_reseeding_updates_rows_in_place(tmp_path, monkeypatch):
+    db_path = tmp_path / "terms.sqlite"
+    run_seeder(monkeypatch, "--out", db_path)
+    term_en, term_fr = seed_terms.GOVERNMENT_TERMS[0][:2]
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.execute("UPDATE terms SET definition_en = 'stale' WHERE term_en = ? AND term_fr = ?",
+                     (term_en, term_fr))
+
+    run_seeder(monkeypatch, "--out", db_path)
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        definition = conn.execute(
+            "SELECT definition_en FROM terms WHERE term_en = ? AND term_fr = ?",
+            (term_en, term_fr)).fetchone()[0]
+    assert definition == seed_terms.GOVERNMENT_TERMS[0][2]
+    assert row_counts(db_path)["terms"] == len(seed_terms.GOVERNMENT_TERMS)
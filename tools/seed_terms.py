@@ -10,832 +10,915 @@ PLEASE DO NOT EDIT THIS FILE UNLESS YOU ARE UPDATING THE ACRONYM OR TERM LISTS.
 This file is maintained manually and should not be auto-generated.
 """
 
+from __future__ import annotations
+
 import argparse
+import json
 import sqlite3
+import sys
+from collections.abc import Iterator, Sequence
+from contextlib import closing, contextmanager
 from pathlib import Path
-from typing import List, Dict, Any
-import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore # pylint: disable=import-error
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Common Canadian government acronyms, one row per ACRONYM_COLUMNS entry
+ACRONYM_COLUMNS = ("acronym", "expansion", "definition", "source_url", "language")
+GOVERNMENT_ACRONYMS: tuple[tuple[str, str, str, str, str], ...] = (
+    (
+        "CRA",
+        "Canada Revenue Agency",
+        "Federal agency responsible for tax collection and benefits administration",
+        "https://www.canada.ca/en/revenue-agency.html",
+        "en"
+    ),
+    (
+        "ARC",
+        "Agence du revenu du Canada",
+        "Agence fédérale responsable de la perception des impôts et de l'administration des prestations",  # pylint: disable=line-too-long
+        "https://www.canada.ca/fr/agence-revenu.html",
+        "fr"
+    ),
+    (
+        "EI",
+        "Employment Insurance",
+        "Government program providing temporary income support for unemployed workers",
+        "https://www.canada.ca/en/services/benefits/ei.html",
+        "en"
+    ),
+    (
+        "AE",
+        "Assurance-emploi",
+        "Programme gouvernemental offrant un soutien temporaire du revenu aux travailleurs sans emploi",  # pylint: disable=line-too-long
+        "https://www.canada.ca/fr/services/prestations/ae.html",
+        "fr"
+    ),
+    (
+        "CPP",
+        "Canada Pension Plan",
+        "Government pension program for Canadian workers",
+        "https://www.canada.ca/en/services/benefits/publicpensions/cpp.html",
+        "en"
+    ),
+    (
+        "RPC",
+        "Régime de pensions du Canada",
+        "Programme de pension gouvernemental pour les travailleurs canadiens",
+        "https://www.canada.ca/fr/services/prestations/pensionspubliques/rpc.html",
+        "fr"
+    ),
+    (
+        "GST",
+        "Goods and Services Tax",
+        "Federal value-added tax on most goods and services",
+        "https://www.canada.ca/en/revenue-agency/services/tax/businesses/topics/gst-hst-businesses.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "TPS",
+        "Taxe sur les produits et services",
+        "Taxe fédérale sur la valeur ajoutée sur la plupart des biens et services",
+        "https://www.canada.ca/fr/agence-revenu/services/impot/entreprises/sujets/tps-tvh-entreprises.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "HST",
+        "Harmonized Sales Tax",
+        "Combined federal and provincial sales tax in participating provinces",
+        "https://www.canada.ca/en/revenue-agency/services/tax/businesses/topics/gst-hst-businesses.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "SIN",
+        "Social Insurance Number",
+        "Nine-digit number needed to work in Canada or access government programs",
+        "https://www.canada.ca/en/employment-social-development/services/sin.html",
+        "en"
+    ),
+    (
+        "NAS",
+        "Numéro d'assurance sociale",
+        "Numéro à neuf chiffres nécessaire pour travailler au Canada ou accéder aux programmes gouvernementaux",  # pylint: disable=line-too-long
+        "https://www.canada.ca/fr/emploi-developpement-social/services/nas.html",
+        "fr"
+    ),
+    (
+        "IRCC",
+        "Immigration, Refugees and Citizenship Canada",
+        "Federal department responsible for immigration and citizenship services",
+        "https://www.canada.ca/en/immigration-refugees-citizenship.html",
+        "en"
+    ),
+    (
+        "ESDC",
+        "Employment and Social Development Canada",
+        "Federal department responsible for employment and social programs",
+        "https://www.canada.ca/en/employment-social-development.html",
+        "en"
+    ),
+    (
+        "PHAC",
+        "Public Health Agency of Canada",
+        "Federal agency responsible for public health protection and promotion",
+        "https://www.canada.ca/en/public-health.html",
+        "en"
+    ),
+    (
+        "ASPC",
+        "Agence de la santé publique du Canada",
+        "Agence fédérale responsable de la protection et de la promotion de la santé publique",
+        "https://www.canada.ca/fr/sante-publique.html",
+        "fr"
+    ),
+    (
+        "HC",
+        "Health Canada",
+        "Federal department responsible for health policy, regulation, and public health",
+        "https://www.canada.ca/en/health-canada.html",
+        "en"
+    ),
+    (
+        "FSANZ",
+        "Food Standards Australia New Zealand",
+        "Bi-national government agency responsible for food safety standards",
+        "https://www.foodstandards.gov.au/",
+        "en"
+    ),
+    (
+        "GM",
+        "Genetically Modified",
+        "Foods that have been altered using genetic engineering techniques",
+        "https://www.canada.ca/en/health-canada.html",
+        "en"
+    ),
+    (
+        "OECD",
+        "Organisation for Economic Co-operation and Development",
+        "International organization promoting economic development and trade",
+        "https://www.oecd.org/",
+        "en"
+    ),
+    (
+        "OCDE",
+        "Organisation de coopération et de développement économiques",
+        "Organisation internationale promouvant le développement économique et le commerce",
+        "https://www.oecd.org/fr/",
+        "fr"
+    ),
+    (
+        "CDSA",
+        "Controlled Drugs and Substances Act",
+        "Federal legislation controlling drugs and substances in Canada",
+        "https://laws-lois.justice.gc.ca/eng/acts/c-38.8/",
+        "en"
+    ),
+    (
+        "NCR",
+        "Narcotic Control Regulations",
+        "Federal regulations controlling narcotic substances",
+        "https://laws-lois.justice.gc.ca/eng/regulations/C.R.C.%2C_c._1041/",
+        "en"
+    ),
+    (
+        "FDR",
+        "Food and Drug Regulations",
+        "Federal regulations controlling food and drug safety in Canada",
+        "https://laws-lois.justice.gc.ca/eng/regulations/C.R.C.%2C_c._870/",
+        "en"
+    ),
+    (
+        "PDF",
+        "Portable Document Format",
+        "File format for presenting documents consistently across platforms",
+        "https://www.adobe.com/acrobat/about-adobe-pdf.html",
+        "en"
+    ),
+    (
+        "WHO",
+        "World Health Organization",
+        "United Nations agency for international health matters",
+        "https://www.who.int/",
+        "en"
+    ),
+    (
+        "OMS",
+        "Organisation mondiale de la santé",
+        "Agence des Nations Unies pour les questions de santé internationale",
+        "https://www.who.int/fr",
+        "fr"
+    ),
+    (
+        "FAQ",
+        "Frequently Asked Questions",
+        "Common questions and answers about a topic",
+        "",
+        "en"
+    ),
+    (
+        "FAO",
+        "Food and Agriculture Organization",
+        "United Nations agency for food and agriculture",
+        "https://www.fao.org/",
+        "en"
+    ),
+    (
+        "UNICEF",
+        "United Nations International Children's Emergency Fund",
+        "United Nations agency providing humanitarian aid to children worldwide",
+        "https://www.unicef.org/",
+        "en"
+    ),
+    (
+        "NATO",
+        "North Atlantic Treaty Organization",
+        "Intergovernmental military alliance between North American and European countries",
+        "https://www.nato.int/",
+        "en"
+    ),
+    (
+        "OTAN",
+        "Organisation du traité de l'Atlantique nord",
+        "Alliance militaire intergouvernementale entre les pays d'Amérique du Nord et d'Europe",
+        "https://www.nato.int/cps/fr/natohq/index.htm",
+        "fr"
+    ),
+    (
+        "UE",
+        "Union européenne",
+        "Union politique et économique de 27 États membres européens",
+        "https://europa.eu/",
+        "fr"
+    ),
+    (
+        "EU",
+        "European Union",
+        "Political and economic union of 27 European member states",
+        "https://europa.eu/",
+        "en"
+    ),
+    (
+        "IMF",
+        "International Monetary Fund",
+        "International organization promoting global monetary cooperation and financial stability",
+        "https://www.imf.org/",
+        "en"
+    ),
+    (
+        "FMI",
+        "Fonds monétaire international",
+        "Organisation internationale promouvant la coopération monétaire mondiale et la stabilité financière",  # pylint: disable=line-too-long
+        "https://www.imf.org/fr/Home",
+        "fr"
+    ),
+    (
+        "GDP",
+        "Gross Domestic Product",
+        "Monetary measure of the market value of all final goods and services produced in a country",  # pylint: disable=line-too-long
+        "https://www.imf.org/external/pubs/ft/fandd/basics/gdp.htm",
+        "en"
+    ),
+    (
+        "PIB",
+        "Produit intérieur brut",
+        "Mesure monétaire de la valeur marchande de tous les biens et services finaux produits dans un pays",  # pylint: disable=line-too-long
+        "https://www.imf.org/external/pubs/ft/fandd/basics/gdp.htm",
+        "fr"
+    ),
+    (
+        "OAS",
+        "Old Age Security",
+        "Government pension program for seniors in Canada",
+        "https://www.canada.ca/en/services/benefits/publicpensions/cpp/old-age-security.html",
+        "en"
+    ),
+    (
+        "OAS",
+        "Sécurité de la vieillesse",
+        "Programme de pension gouvernemental pour les personnes âgées au Canada",
+        "https://www.canada.ca/fr/services/prestations/pensions-publiques/rrq/securite-vieillesse.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "NSLSC",
+        "National Student Loans Service Centre",
+        "Canadian government service that manages student loans",
+        "https://www.canada.ca/en/services/benefits/education/student-loans.html",
+        "en"
+    ),
+    (
+        "CDCP",
+        "Canada Disability Savings Program",
+        "Federal program to help Canadians with disabilities save for the future",
+        "https://www.canada.ca/en/revenue-agency/services/tax/businesses/topics/payroll/employers-guide/benefits/registered-disability-savings-plan.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "CDB",
+        "Canada Disability Benefit",
+        "Proposed federal benefit to support Canadians with disabilities",
+        "https://www.canada.ca/en/employment-social-development/programs/disability-benefit.html",
+        "en"
+    ),
+    (
+        "PDC",
+        "Prestation canadienne pour les personnes handicapées",
+        "Prestation fédérale proposée pour soutenir les Canadiens handicapés",
+        "https://www.canada.ca/fr/emploi-developpement-social/programmes/prestation-handicapes.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "AIPD",
+        "Assurance-invalidité du Canada",
+        "Programme fédéral d'assurance pour les travailleurs canadiens incapables de travailler en raison d'une invalidité",  # pylint: disable=line-too-long
+        "https://www.canada.ca/fr/services/prestations/ae/assurance-invalidite.html",
+        "fr"
+    ),
+    (
+        "CID",
+        "Canada Disability Insurance",
+        "Federal insurance program for Canadian workers unable to work due to disability",
+        "https://www.canada.ca/en/services/benefits/ei/ei-regular-benefit/ei-disability-benefit.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "CBC",
+        "Canadian Broadcasting Corporation",
+        "Canada's national public broadcaster",
+        "https://www.cbc.ca/",
+        "en"
+    ),
+    (
+        "SRC",
+        "Société Radio-Canada",
+        "Radiodiffuseur public national du Canada",
+        "https://www.radio-canada.ca/",
+        "fr"
+    ),
+    (
+        "RCMP",
+        "Royal Canadian Mounted Police",
+        "Canada's federal and national law enforcement agency",
+        "https://www.rcmp-grc.gc.ca/",
+        "en"
+    ),
+    (
+        "GRC",
+        "Gendarmerie royale du Canada",
+        "Agence fédérale et nationale d'application de la loi du Canada",
+        "https://www.rcmp-grc.gc.ca/fr",
+        "fr"
+    ),
+    (
+        "CPC",
+        "Conservative Party of Canada",
+        "Major political party in Canada",
+        "https://www.conservative.ca/",
+        "en"
+    ),
+    (
+        "PCC",
+        "Parti conservateur du Canada",
+        "Parti politique majeur au Canada",
+        "https://www.conservative.ca/fr",
+        "fr"
+    ),
+    (
+        "LPC",
+        "Liberal Party of Canada",
+        "Major political party in Canada",
+        "https://www.liberal.ca/",
+        "en"
+    ),
+    (
+        "PLC",
+        "Parti libéral du Canada",
+        "Parti politique majeur au Canada",
+        "https://www.liberal.ca/",
+        "fr"
+    ),
+    (
+        "NDP",
+        "New Democratic Party",
+        "Major political party in Canada",
+        "https://www.ndp.ca/",
+        "en"
+    ),
+    (
+        "NPD",
+        "Nouveau Parti démocratique",
+        "Parti politique majeur au Canada",
+        "https://www.ndp.ca/fr",
+        "fr"
+    ),
+    (
+        "CERB",
+        "Canada Emergency Response Benefit",
+        "Temporary income support program for workers affected by COVID-19",
+        "https://www.canada.ca/en/services/benefits/ei/cerb-application.html",
+        "en"
+    ),
+    (
+        "PCU",
+        "Prestation canadienne d'urgence",
+        "Programme temporaire de soutien du revenu pour les travailleurs touchés par la COVID-19",
+        "https://www.canada.ca/fr/services/prestations/ae/pcusc-application.html",
+        "fr"
+    ),
+    (
+        "CCB",
+        "Canada Child Benefit",
+        "Tax-free monthly payment to help with the cost of raising children",
+        "https://www.canada.ca/en/revenue-agency/services/child-family-benefits/canada-child-benefit-overview.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "ACE",
+        "Allocation canadienne pour enfants",
+        "Paiement mensuel libre d'impôt pour aider avec les coûts d'élever des enfants",
+        "https://www.canada.ca/fr/agence-revenu/services/prestations-enfants-familles/allocation-canadienne-enfants-apercu.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "GIS",
+        "Guaranteed Income Supplement",
+        "Monthly benefit for low-income Old Age Security recipients",
+        "https://www.canada.ca/en/services/benefits/publicpensions/cpp/old-age-security/guaranteed-income-supplement.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "SRG",
+        "Supplément de revenu garanti",
+        "Prestation mensuelle pour les bénéficiaires de la Sécurité de la vieillesse à faible revenu",  # pylint: disable=line-too-long
+        "https://www.canada.ca/fr/services/prestations/pensionspubliques/rrq/securite-vieillesse/supplement-revenu-garanti.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "TFSA",
+        "Tax-Free Savings Account",
+        "Registered account that allows tax-free growth of investments",
+        "https://www.canada.ca/en/revenue-agency/services/tax/individuals/topics/tax-free-savings-account.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "CELI",
+        "Compte d'épargne libre d'impôt",
+        "Compte enregistré qui permet la croissance libre d'impôt des placements",
+        "https://www.canada.ca/fr/agence-revenu/services/impot/particuliers/sujets/compte-epargne-libre-impot.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "RRSP",
+        "Registered Retirement Savings Plan",
+        "Tax-sheltered retirement savings account",
+        "https://www.canada.ca/en/revenue-agency/services/tax/individuals/topics/rrsps-related-plans.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "REER",
+        "Régime enregistré d'épargne-retraite",
+        "Compte d'épargne-retraite à l'abri de l'impôt",
+        "https://www.canada.ca/fr/agence-revenu/services/impot/particuliers/sujets/reer-regimes-connexes.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "RESP",
+        "Registered Education Savings Plan",
+        "Education savings account with government grants",
+        "https://www.canada.ca/en/revenue-agency/services/tax/individuals/topics/registered-education-savings-plans-resps.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "REEE",
+        "Régime enregistré d'épargne-études",
+        "Compte d'épargne-études avec subventions gouvernementales",
+        "https://www.canada.ca/fr/agence-revenu/services/impot/particuliers/sujets/regimes-enregistres-epargne-etudes-reee.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "CESG",
+        "Canada Education Savings Grant",
+        "Government contribution to Registered Education Savings Plans",
+        "https://www.canada.ca/en/employment-social-development/services/learning-bond/education-savings.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "SCEE",
+        "Subvention canadienne pour l'épargne-études",
+        "Contribution gouvernementale aux Régimes enregistrés d'épargne-études",
+        "https://www.canada.ca/fr/emploi-developpement-social/services/bon-etudes/epargne-etudes.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "WITB",
+        "Working Income Tax Benefit",
+        "Refundable tax credit for low-income working individuals and families",
+        "https://www.canada.ca/en/revenue-agency/programs/about-canada-revenue-agency-cra/federal-government-budgets/budget-2018-equality-growth-strong-middle-class/canada-workers-benefit.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "PFRT",
+        "Prestation fiscale pour le revenu de travail",
+        "Crédit d'impôt remboursable pour les particuliers et familles à faible revenu qui travaillent",  # pylint: disable=line-too-long
+        "https://www.canada.ca/fr/agence-revenu/programmes/a-propos-agence-revenu-canada-arc/budgets-gouvernement-federal/budget-2018-egalite-croissance-classe-moyenne-forte/allocation-canadienne-travailleurs.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "CWB",
+        "Canada Workers Benefit",
+        "Refundable tax credit for low and modest-income working individuals and families",
+        "https://www.canada.ca/en/revenue-agency/programs/about-canada-revenue-agency-cra/federal-government-budgets/budget-2018-equality-growth-strong-middle-class/canada-workers-benefit.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "ACT",
+        "Allocation canadienne pour les travailleurs",
+        "Crédit d'impôt remboursable pour les particuliers et familles à revenu faible et modeste qui travaillent",  # pylint: disable=line-too-long
+        "https://www.canada.ca/fr/agence-revenu/programmes/a-propos-agence-revenu-canada-arc/budgets-gouvernement-federal/budget-2018-egalite-croissance-classe-moyenne-forte/allocation-canadienne-travailleurs.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "RDSP",
+        "Registered Disability Savings Plan",
+        "Long-term savings plan to help Canadians with disabilities save for the future",
+        "https://www.canada.ca/en/revenue-agency/services/tax/individuals/topics/registered-disability-savings-plan-rdsp.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "REEI",
+        "Régime enregistré d'épargne-invalidité",
+        "Plan d'épargne à long terme pour aider les Canadiens handicapés à épargner pour l'avenir",
+        "https://www.canada.ca/fr/agence-revenu/services/impot/particuliers/sujets/regime-enregistre-epargne-invalidite-reei.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "CDSG",
+        "Canada Disability Savings Grant",
+        "Government grant for Registered Disability Savings Plans",
+        "https://www.canada.ca/en/employment-social-development/programs/disability/savings/grant.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "SCEI",
+        "Subvention canadienne pour l'épargne-invalidité",
+        "Subvention gouvernementale pour les Régimes enregistrés d'épargne-invalidité",
+        "https://www.canada.ca/fr/emploi-developpement-social/programmes/invalidite/epargne/subvention.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "CDSB",
+        "Canada Disability Savings Bond",
+        "Government bond for Registered Disability Savings Plans",
+        "https://www.canada.ca/en/employment-social-development/programs/disability/savings/bond.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "BCEI",
+        "Bon canadien pour l'épargne-invalidité",
+        "Bon gouvernemental pour les Régimes enregistrés d'épargne-invalidité",
+        "https://www.canada.ca/fr/emploi-developpement-social/programmes/invalidite/epargne/bon.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "CLC",
+        "Canada Labour Code",
+        "Federal legislation governing employment standards and labor relations",
+        "https://www.canada.ca/en/employment-social-development/programs/laws-regulations/labour/interpretations-policies/canada-labour-code.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "CTC",
+        "Code du travail du Canada",
+        "Législation fédérale régissant les normes d'emploi et les relations de travail",
+        "https://www.canada.ca/fr/emploi-developpement-social/programmes/lois-reglements/travail/interpretations-politiques/code-travail-canada.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "PIPEDA",
+        "Personal Information Protection and Electronic Documents Act",
+        "Federal privacy law for private sector organizations",
+        "https://www.priv.gc.ca/en/privacy-topics/privacy-laws-in-canada/the-personal-information-protection-and-electronic-documents-act-pipeda/",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "LPRPDE",
+        "Loi sur la protection des renseignements personnels et les documents électroniques",
+        "Loi fédérale sur la vie privée pour les organisations du secteur privé",
+        "https://www.priv.gc.ca/fr/sujets-lies-a-la-vie-privee/lois-sur-la-vie-privee-au-canada/la-loi-sur-la-protection-des-renseignements-personnels-et-les-documents-electroniques-lprpde/",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "ATIA",
+        "Access to Information Act",
+        "Federal law providing right of access to information in government institutions",
+        "https://www.canada.ca/en/treasury-board-secretariat/services/access-information-privacy/access-information.html",  # pylint: disable=line-too-long
+        "en"
+    ),
+    (
+        "LAI",
+        "Loi sur l'accès à l'information",
+        "Loi fédérale accordant le droit d'accès à l'information dans les institutions gouvernementales",  # pylint: disable=line-too-long
+        "https://www.canada.ca/fr/secretariat-conseil-tresor/services/acces-information-protection-renseignements-personnels/acces-information.html",  # pylint: disable=line-too-long
+        "fr"
+    ),
+    (
+        "COVID",
+        "Coronavirus Disease 2019",
+        "Infectious disease caused by the SARS-CoV-2 virus",
+        "https://www.who.int/health-topics/coronavirus#tab=tab_1",
+        "en"
+    ),
+    (
+        "MSCA",
+        "My Service Canada Account",
+        "Online portal for accessing government services and benefits",
+        "https://www.canada.ca/en/employment-social-development/services/my-service-canada-account.html",  # pylint: disable=line-too-long
+        "en"
+    )
+)
 
-# Common Canadian government acronyms
-GOVERNMENT_ACRONYMS = [
-    {
-        "acronym": "CRA",
-        "expansion": "Canada Revenue Agency",
-        "definition": "Federal agency responsible for tax collection and benefits administration",
-        "source_url": "https://www.canada.ca/en/revenue-agency.html",
-        "language": "en"
-    },
-    {
-        "acronym": "ARC",
-        "expansion": "Agence du revenu du Canada",
-        "definition": "Agence fédérale responsable de la perception des impôts et de l'administration des prestations",  # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/agence-revenu.html",
-        "language": "fr"
-    },
-    {
-        "acronym": "EI",
-        "expansion": "Employment Insurance",
-        "definition": "Government program providing temporary income support for unemployed workers",  # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/en/services/benefits/ei.html",
-        "language": "en"
-    },
-    {
-        "acronym": "AE",
-        "expansion": "Assurance-emploi",
-        "definition": "Programme gouvernemental offrant un soutien temporaire du revenu aux travailleurs sans emploi",  # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/services/prestations/ae.html",
-        "language": "fr"
-    },
-    {
-        "acronym": "CPP",
-        "expansion": "Canada Pension Plan",
-        "definition": "Government pension program for Canadian workers",
-        "source_url": "https://www.canada.ca/en/services/benefits/publicpensions/cpp.html",
-        "language": "en"
-    },
-    {
-        "acronym": "RPC",
-        "expansion": "Régime de pensions du Canada",
-        "definition": "Programme de pension gouvernemental pour les travailleurs canadiens",
-        "source_url": "https://www.canada.ca/fr/services/prestations/pensionspubliques/rpc.html",
-        "language": "fr"
-    },
-    {
-        "acronym": "GST",
-        "expansion": "Goods and Services Tax",
-        "definition": "Federal value-added tax on most goods and services",
-        "source_url": "https://www.canada.ca/en/revenue-agency/services/tax/businesses/topics/gst-hst-businesses.html",  # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "TPS",
-        "expansion": "Taxe sur les produits et services",
-        "definition": "Taxe fédérale sur la valeur ajoutée sur la plupart des biens et services",
-        "source_url": "https://www.canada.ca/fr/agence-revenu/services/impot/entreprises/sujets/tps-tvh-entreprises.html",  # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "HST",
-        "expansion": "Harmonized Sales Tax",
-        "definition": "Combined federal and provincial sales tax in participating provinces",
-        "source_url": "https://www.canada.ca/en/revenue-agency/services/tax/businesses/topics/gst-hst-businesses.html",  # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "SIN",
-        "expansion": "Social Insurance Number",
-        "definition": "Nine-digit number needed to work in Canada or access government programs",
-        "source_url": "https://www.canada.ca/en/employment-social-development/services/sin.html",
-        "language": "en"
-    },
-    {
-        "acronym": "NAS",
-        "expansion": "Numéro d'assurance sociale",
-        "definition": "Numéro à neuf chiffres nécessaire pour travailler au Canada ou accéder aux programmes gouvernementaux",  # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/emploi-developpement-social/services/nas.html",
-        "language": "fr"
-    },
-    {
-        "acronym": "IRCC",
-        "expansion": "Immigration, Refugees and Citizenship Canada",
-        "definition": "Federal department responsible for immigration and citizenship services",
-        "source_url": "https://www.canada.ca/en/immigration-refugees-citizenship.html",
-        "language": "en"
-    },
-    {
-        "acronym": "ESDC",
-        "expansion": "Employment and Social Development Canada",
-        "definition": "Federal department responsible for employment and social programs",
-        "source_url": "https://www.canada.ca/en/employment-social-development.html",
-        "language": "en"
-    },
-    {
-        "acronym": "PHAC",
-        "expansion": "Public Health Agency of Canada",
-        "definition": "Federal agency responsible for public health protection and promotion",
-        "source_url": "https://www.canada.ca/en/public-health.html",
-        "language": "en"
-    },
-    {
-        "acronym": "ASPC",
-        "expansion": "Agence de la santé publique du Canada",
-        "definition": "Agence fédérale responsable de la protection et de la promotion de la santé publique",  # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/sante-publique.html",
-        "language": "fr"
-    },
-    {
-        "acronym": "HC",
-        "expansion": "Health Canada",
-        "definition": "Federal department responsible for health policy, regulation, and public health",  # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/en/health-canada.html",
-        "language": "en"
-    },
-    {
-        "acronym": "FSANZ",
-        "expansion": "Food Standards Australia New Zealand",
-        "definition": "Bi-national government agency responsible for food safety standards",
-        "source_url": "https://www.foodstandards.gov.au/",
-        "language": "en"
-    },
-    {
-        "acronym": "GM",
-        "expansion": "Genetically Modified",
-        "definition": "Foods that have been altered using genetic engineering techniques",
-        "source_url": "https://www.canada.ca/en/health-canada.html",
-        "language": "en"
-    },
-    {
-        "acronym": "OECD",
-        "expansion": "Organisation for Economic Co-operation and Development",
-        "definition": "International organization promoting economic development and trade",
-        "source_url": "https://www.oecd.org/",
-        "language": "en"
-    },
-    {
-        "acronym": "OCDE",
-        "expansion": "Organisation de coopération et de développement économiques",
-        "definition": "Organisation internationale promouvant le développement économique et le commerce",  # pylint: disable=line-too-long
-        "source_url": "https://www.oecd.org/fr/",
-        "language": "fr"
-    },
-    {
-        "acronym": "CDSA",
-        "expansion": "Controlled Drugs and Substances Act",
-        "definition": "Federal legislation controlling drugs and substances in Canada",
-        "source_url": "https://laws-lois.justice.gc.ca/eng/acts/c-38.8/",
-        "language": "en"
-    },
-    {
-        "acronym": "NCR",
-        "expansion": "Narcotic Control Regulations",
-        "definition": "Federal regulations controlling narcotic substances",
-        "source_url": "https://laws-lois.justice.gc.ca/eng/regulations/C.R.C.%2C_c._1041/",
-        "language": "en"
-    },
-    {
-        "acronym": "FDR",
-        "expansion": "Food and Drug Regulations",
-        "definition": "Federal regulations controlling food and drug safety in Canada",
-        "source_url": "https://laws-lois.justice.gc.ca/eng/regulations/C.R.C.%2C_c._870/",
-        "language": "en"
-    },
-    {
-        "acronym": "PDF",
-        "expansion": "Portable Document Format",
-        "definition": "File format for presenting documents consistently across platforms",
-        "source_url": "https://www.adobe.com/acrobat/about-adobe-pdf.html",
-        "language": "en"
-    },
-    {
-        "acronym": "WHO",
-        "expansion": "World Health Organization",
-        "definition": "United Nations agency for international health matters",
-        "source_url": "https://www.who.int/",
-        "language": "en"
-    },
-    {
-        "acronym": "OMS",
-        "expansion": "Organisation mondiale de la santé",
-        "definition": "Agence des Nations Unies pour les questions de santé internationale",
-        "source_url": "https://www.who.int/fr",
-        "language": "fr"
-    },
-    {
-        "acronym": "FAQ",
-        "expansion": "Frequently Asked Questions",
-        "definition": "Common questions and answers about a topic",
-        "source_url": "",
-        "language": "en"
-    },
-    {
-        "acronym": "FAO",
-        "expansion": "Food and Agriculture Organization",
-        "definition": "United Nations agency for food and agriculture",
-        "source_url": "https://www.fao.org/",
-        "language": "en"
-    },
-    {
-        "acronym": "UNICEF",
-        "expansion": "United Nations International Children's Emergency Fund",
-        "definition": "United Nations agency providing humanitarian aid to children worldwide",  # pylint: disable=line-too-long
-        "source_url": "https://www.unicef.org/",
-        "language": "en"
-    },
-    {
-        "acronym": "NATO",
-        "expansion": "North Atlantic Treaty Organization",
-        "definition": "Intergovernmental military alliance between North American and European countries",  # pylint: disable=line-too-long
-        "source_url": "https://www.nato.int/",
-        "language": "en"
-    },
-    {
-        "acronym": "OTAN",
-        "expansion": "Organisation du traité de l'Atlantique nord",
-        "definition": "Alliance militaire intergouvernementale entre les pays d'Amérique du Nord et d'Europe",  # pylint: disable=line-too-long
-        "source_url": "https://www.nato.int/cps/fr/natohq/index.htm",
-        "language": "fr"
-    },
-    {
-        "acronym": "UE",
-        "expansion": "Union européenne",
-        "definition": "Union politique et économique de 27 États membres européens",
-        "source_url": "https://europa.eu/",
-        "language": "fr"
-    },
-    {
-        "acronym": "EU",
-        "expansion": "European Union",
-        "definition": "Political and economic union of 27 European member states",
-        "source_url": "https://europa.eu/",
-        "language": "en"
-    },
-    {
-        "acronym": "IMF",
-        "expansion": "International Monetary Fund",
-        "definition": "International organization promoting global monetary cooperation and financial stability",  # pylint: disable=line-too-long
-        "source_url": "https://www.imf.org/",
-        "language": "en"
-    },
-    {
-        "acronym": "FMI",
-        "expansion": "Fonds monétaire international",
-        "definition": "Organisation internationale promouvant la coopération monétaire mondiale et la stabilité financière",  # pylint: disable=line-too-long
-        "source_url": "https://www.imf.org/fr/Home",
-        "language": "fr"
-    },
-    {
-        "acronym": "GDP",
-        "expansion": "Gross Domestic Product",
-        "definition": "Monetary measure of the market value of all final goods and services produced in a country",  # pylint: disable=line-too-long
-        "source_url": "https://www.imf.org/external/pubs/ft/fandd/basics/gdp.htm",
-        "language": "en"
-    },
-    {
-        "acronym": "PIB",
-        "expansion": "Produit intérieur brut",
-        "definition": "Mesure monétaire de la valeur marchande de tous les biens et services finaux produits dans un pays",  # pylint: disable=line-too-long
-        "source_url": "https://www.imf.org/external/pubs/ft/fandd/basics/gdp.htm",
-        "language": "fr"
-    },
-    {
-        "acronym": "OAS",
-        "expansion": "Old Age Security",
-        "definition": "Government pension program for seniors in Canada",
-        "source_url": "https://www.canada.ca/en/services/benefits/publicpensions/cpp/old-age-security.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "OAS",
-        "expansion": "Sécurité de la vieillesse",
-        "definition": "Programme de pension gouvernemental pour les personnes âgées au Canada",
-        "source_url": "https://www.canada.ca/fr/services/prestations/pensions-publiques/rrq/securite-vieillesse.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "NSLSC",
-        "expansion": "National Student Loans Service Centre",
-        "definition": "Canadian government service that manages student loans",
-        "source_url": "https://www.canada.ca/en/services/benefits/education/student-loans.html",
-        "language": "en"
-    },
-    {
-        "acronym": "CDCP",
-        "expansion": "Canada Disability Savings Program",
-        "definition": "Federal program to help Canadians with disabilities save for the future",
-        "source_url": "https://www.canada.ca/en/revenue-agency/services/tax/businesses/topics/payroll/employers-guide/benefits/registered-disability-savings-plan.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "CDB",
-        "expansion": "Canada Disability Benefit",
-        "definition": "Proposed federal benefit to support Canadians with disabilities",
-        "source_url": "https://www.canada.ca/en/employment-social-development/programs/disability-benefit.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "PDC",
-        "expansion": "Prestation canadienne pour les personnes handicapées",
-        "definition": "Prestation fédérale proposée pour soutenir les Canadiens handicapés",
-        "source_url": "https://www.canada.ca/fr/emploi-developpement-social/programmes/prestation-handicapes.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "AIPD",
-        "expansion": "Assurance-invalidité du Canada",
-        "definition": "Programme fédéral d'assurance pour les travailleurs canadiens incapables de travailler en raison d'une invalidité",  # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/services/prestations/ae/assurance-invalidite.html",
-        "language": "fr"
-    },
-    {
-        "acronym": "CID",
-        "expansion": "Canada Disability Insurance",
-        "definition": "Federal insurance program for Canadian workers unable to work due to disability",  # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/en/services/benefits/ei/ei-regular-benefit/ei-disability-benefit.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "CBC",
-        "expansion": "Canadian Broadcasting Corporation",
-        "definition": "Canada's national public broadcaster",
-        "source_url": "https://www.cbc.ca/",
-        "language": "en"
-    },
-    {
-        "acronym": "SRC",
-        "expansion": "Société Radio-Canada",
-        "definition": "Radiodiffuseur public national du Canada",
-        "source_url": "https://www.radio-canada.ca/",
-        "language": "fr"
-    },
-    {
-        "acronym": "RCMP",
-        "expansion": "Royal Canadian Mounted Police",
-        "definition": "Canada's federal and national law enforcement agency",
-        "source_url": "https://www.rcmp-grc.gc.ca/",
-        "language": "en"
-    },
-    {
-        "acronym": "GRC",
-        "expansion": "Gendarmerie royale du Canada",
-        "definition": "Agence fédérale et nationale d'application de la loi du Canada",
-        "source_url": "https://www.rcmp-grc.gc.ca/fr",
-        "language": "fr"
-    },
-    {
-        "acronym": "CPC",
-        "expansion": "Conservative Party of Canada",
-        "definition": "Major political party in Canada",
-        "source_url": "https://www.conservative.ca/",
-        "language": "en"
-    },
-    {
-        "acronym": "PCC",
-        "expansion": "Parti conservateur du Canada",
-        "definition": "Parti politique majeur au Canada",
-        "source_url": "https://www.conservative.ca/fr",
-        "language": "fr"
-    },
-    {
-        "acronym": "LPC",
-        "expansion": "Liberal Party of Canada",
-        "definition": "Major political party in Canada",
-        "source_url": "https://www.liberal.ca/",
-        "language": "en"
-    },
-    {
-        "acronym": "PLC",
-        "expansion": "Parti libéral du Canada",
-        "definition": "Parti politique majeur au Canada",
-        "source_url": "https://www.liberal.ca/",
-        "language": "fr"
-    },
-    {
-        "acronym": "NDP",
-        "expansion": "New Democratic Party",
-        "definition": "Major political party in Canada",
-        "source_url": "https://www.ndp.ca/",
-        "language": "en"
-    },
-    {
-        "acronym": "NPD",
-        "expansion": "Nouveau Parti démocratique",
-        "definition": "Parti politique majeur au Canada",
-        "source_url": "https://www.ndp.ca/fr",
-        "language": "fr"
-    },
-    {
-        "acronym": "CERB",
-        "expansion": "Canada Emergency Response Benefit",
-        "definition": "Temporary income support program for workers affected by COVID-19",
-        "source_url": "https://www.canada.ca/en/services/benefits/ei/cerb-application.html",
-        "language": "en"
-    },
-    {
-        "acronym": "PCU",
-        "expansion": "Prestation canadienne d'urgence",
-        "definition": "Programme temporaire de soutien du revenu pour les travailleurs touchés par la COVID-19", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/services/prestations/ae/pcusc-application.html",
-        "language": "fr"
-    },
-    {
-        "acronym": "CCB",
-        "expansion": "Canada Child Benefit",
-        "definition": "Tax-free monthly payment to help with the cost of raising children",
-        "source_url": "https://www.canada.ca/en/revenue-agency/services/child-family-benefits/canada-child-benefit-overview.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "ACE",
-        "expansion": "Allocation canadienne pour enfants",
-        "definition": "Paiement mensuel libre d'impôt pour aider avec les coûts d'élever des enfants", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/agence-revenu/services/prestations-enfants-familles/allocation-canadienne-enfants-apercu.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "GIS",
-        "expansion": "Guaranteed Income Supplement",
-        "definition": "Monthly benefit for low-income Old Age Security recipients",
-        "source_url": "https://www.canada.ca/en/services/benefits/publicpensions/cpp/old-age-security/guaranteed-income-supplement.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "SRG",
-        "expansion": "Supplément de revenu garanti",
-        "definition": "Prestation mensuelle pour les bénéficiaires de la Sécurité de la vieillesse à faible revenu", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/services/prestations/pensionspubliques/rrq/securite-vieillesse/supplement-revenu-garanti.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "TFSA",
-        "expansion": "Tax-Free Savings Account",
-        "definition": "Registered account that allows tax-free growth of investments",
-        "source_url": "https://www.canada.ca/en/revenue-agency/services/tax/individuals/topics/tax-free-savings-account.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "CELI",
-        "expansion": "Compte d'épargne libre d'impôt",
-        "definition": "Compte enregistré qui permet la croissance libre d'impôt des placements",
-        "source_url": "https://www.canada.ca/fr/agence-revenu/services/impot/particuliers/sujets/compte-epargne-libre-impot.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "RRSP",
-        "expansion": "Registered Retirement Savings Plan",
-        "definition": "Tax-sheltered retirement savings account",
-        "source_url": "https://www.canada.ca/en/revenue-agency/services/tax/individuals/topics/rrsps-related-plans.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "REER",
-        "expansion": "Régime enregistré d'épargne-retraite",
-        "definition": "Compte d'épargne-retraite à l'abri de l'impôt",
-        "source_url": "https://www.canada.ca/fr/agence-revenu/services/impot/particuliers/sujets/reer-regimes-connexes.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "RESP",
-        "expansion": "Registered Education Savings Plan",
-        "definition": "Education savings account with government grants",
-        "source_url": "https://www.canada.ca/en/revenue-agency/services/tax/individuals/topics/registered-education-savings-plans-resps.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "REEE",
-        "expansion": "Régime enregistré d'épargne-études",
-        "definition": "Compte d'épargne-études avec subventions gouvernementales",
-        "source_url": "https://www.canada.ca/fr/agence-revenu/services/impot/particuliers/sujets/regimes-enregistres-epargne-etudes-reee.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "CESG",
-        "expansion": "Canada Education Savings Grant",
-        "definition": "Government contribution to Registered Education Savings Plans",
-        "source_url": "https://www.canada.ca/en/employment-social-development/services/learning-bond/education-savings.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "SCEE",
-        "expansion": "Subvention canadienne pour l'épargne-études",
-        "definition": "Contribution gouvernementale aux Régimes enregistrés d'épargne-études",
-        "source_url": "https://www.canada.ca/fr/emploi-developpement-social/services/bon-etudes/epargne-etudes.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "WITB",
-        "expansion": "Working Income Tax Benefit",
-        "definition": "Refundable tax credit for low-income working individuals and families",
-        "source_url": "https://www.canada.ca/en/revenue-agency/programs/about-canada-revenue-agency-cra/federal-government-budgets/budget-2018-equality-growth-strong-middle-class/canada-workers-benefit.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "PFRT",
-        "expansion": "Prestation fiscale pour le revenu de travail",
-        "definition": "Crédit d'impôt remboursable pour les particuliers et familles à faible revenu qui travaillent", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/agence-revenu/programmes/a-propos-agence-revenu-canada-arc/budgets-gouvernement-federal/budget-2018-egalite-croissance-classe-moyenne-forte/allocation-canadienne-travailleurs.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "CWB",
-        "expansion": "Canada Workers Benefit",
-        "definition": "Refundable tax credit for low and modest-income working individuals and families", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/en/revenue-agency/programs/about-canada-revenue-agency-cra/federal-government-budgets/budget-2018-equality-growth-strong-middle-class/canada-workers-benefit.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "ACT",
-        "expansion": "Allocation canadienne pour les travailleurs",
-        "definition": "Crédit d'impôt remboursable pour les particuliers et familles à revenu faible et modeste qui travaillent", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/agence-revenu/programmes/a-propos-agence-revenu-canada-arc/budgets-gouvernement-federal/budget-2018-egalite-croissance-classe-moyenne-forte/allocation-canadienne-travailleurs.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "RDSP",
-        "expansion": "Registered Disability Savings Plan",
-        "definition": "Long-term savings plan to help Canadians with disabilities save for the future", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/en/revenue-agency/services/tax/individuals/topics/registered-disability-savings-plan-rdsp.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "REEI",
-        "expansion": "Régime enregistré d'épargne-invalidité",
-        "definition": "Plan d'épargne à long terme pour aider les Canadiens handicapés à épargner pour l'avenir", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/agence-revenu/services/impot/particuliers/sujets/regime-enregistre-epargne-invalidite-reei.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "CDSG",
-        "expansion": "Canada Disability Savings Grant",
-        "definition": "Government grant for Registered Disability Savings Plans",
-        "source_url": "https://www.canada.ca/en/employment-social-development/programs/disability/savings/grant.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "SCEI",
-        "expansion": "Subvention canadienne pour l'épargne-invalidité",
-        "definition": "Subvention gouvernementale pour les Régimes enregistrés d'épargne-invalidité", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/emploi-developpement-social/programmes/invalidite/epargne/subvention.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "CDSB",
-        "expansion": "Canada Disability Savings Bond",
-        "definition": "Government bond for Registered Disability Savings Plans",
-        "source_url": "https://www.canada.ca/en/employment-social-development/programs/disability/savings/bond.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "BCEI",
-        "expansion": "Bon canadien pour l'épargne-invalidité",
-        "definition": "Bon gouvernemental pour les Régimes enregistrés d'épargne-invalidité",
-        "source_url": "https://www.canada.ca/fr/emploi-developpement-social/programmes/invalidite/epargne/bon.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "CLC",
-        "expansion": "Canada Labour Code",
-        "definition": "Federal legislation governing employment standards and labor relations",
-        "source_url": "https://www.canada.ca/en/employment-social-development/programs/laws-regulations/labour/interpretations-policies/canada-labour-code.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "CTC",
-        "expansion": "Code du travail du Canada",
-        "definition": "Législation fédérale régissant les normes d'emploi et les relations de travail", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/emploi-developpement-social/programmes/lois-reglements/travail/interpretations-politiques/code-travail-canada.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "PIPEDA",
-        "expansion": "Personal Information Protection and Electronic Documents Act",
-        "definition": "Federal privacy law for private sector organizations",
-        "source_url": "https://www.priv.gc.ca/en/privacy-topics/privacy-laws-in-canada/the-personal-information-protection-and-electronic-documents-act-pipeda/", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "LPRPDE",
-        "expansion": "Loi sur la protection des renseignements personnels et les documents électroniques", # pylint: disable=line-too-long
-        "definition": "Loi fédérale sur la vie privée pour les organisations du secteur privé",
-        "source_url": "https://www.priv.gc.ca/fr/sujets-lies-a-la-vie-privee/lois-sur-la-vie-privee-au-canada/la-loi-sur-la-protection-des-renseignements-personnels-et-les-documents-electroniques-lprpde/", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "ATIA",
-        "expansion": "Access to Information Act",
-        "definition": "Federal law providing right of access to information in government institutions", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/en/treasury-board-secretariat/services/access-information-privacy/access-information.html", # pylint: disable=line-too-long
-        "language": "en"
-    },
-    {
-        "acronym": "LAI",
-        "expansion": "Loi sur l'accès à l'information",
-        "definition": "Loi fédérale accordant le droit d'accès à l'information dans les institutions gouvernementales", # pylint: disable=line-too-long
-        "source_url": "https://www.canada.ca/fr/secretariat-conseil-tresor/services/acces-information-protection-renseignements-personnels/acces-information.html", # pylint: disable=line-too-long
-        "language": "fr"
-    },
-    {
-        "acronym": "COVID",
-        "expansion": "Coronavirus Disease 2019",
-        "definition": "Infectious disease caused by the SARS-CoV-2 virus",
-        "source_url": "https://www.who.int/health-topics/coronavirus#tab=tab_1",
-        "language": "en"
-    },
-    {
-        "acronym": "MSCA",
-        "expansion": "My Service Canada Account",
-        "definition": "Online portal for accessing government services and benefits",
-        "source_url": "https://www.canada.ca/en/employment-social-development/services/my-service-canada-account.html", # pylint: disable=line-too-long
-        "language": "en"
-    }
-]
+# Common government terms for translation consistency, one row per TERM_COLUMNS entry
+TERM_COLUMNS = ("term_en", "term_fr", "definition_en", "definition_fr", "category", "official")
+GOVERNMENT_TERMS: tuple[tuple[str, str, str, str, str, bool], ...] = (
+    (
+        "Canada Revenue Agency",
+        "Agence du revenu du Canada",
+        "Federal agency responsible for tax collection",
+        "Agence fédérale responsable de la perception des impôts",
+        "organization",
+        True
+    ),
+    (
+        "Employment Insurance",
+        "Assurance-emploi",
+        "Temporary income support for unemployed workers",
+        "Soutien temporaire du revenu pour les travailleurs sans emploi",
+        "program",
+        True
+    ),
+    (
+        "Canada Pension Plan",
+        "Régime de pensions du Canada",
+        "Government pension program",
+        "Programme de pension gouvernemental",
+        "program",
+        True
+    ),
+    (
+        "Social Insurance Number",
+        "Numéro d'assurance sociale",
+        "Nine-digit identification number",
+        "Numéro d'identification à neuf chiffres",
+        "document",
+        True
+    ),
+    (
+        "Goods and Services Tax",
+        "Taxe sur les produits et services",
+        "Federal value-added tax",
+        "Taxe fédérale sur la valeur ajoutée",
+        "tax",
+        True
+    ),
+    (
+        "Harmonized Sales Tax",
+        "Taxe de vente harmonisée",
+        "Combined federal and provincial sales tax",
+        "Taxe de vente fédérale et provinciale combinée",
+        "tax",
+        True
+    ),
+    (
+        "Public Health Agency of Canada",
+        "Agence de la santé publique du Canada",
+        "Federal agency for public health",
+        "Agence fédérale de la santé publique",
+        "organization",
+        True
+    ),
+    (
+        "Health Canada",
+        "Santé Canada",
+        "Federal department for health policy",
+        "Ministère fédéral de la politique de santé",
+        "organization",
+        True
+    ),
+    (
+        "benefit",
+        "prestation",
+        "Government financial assistance payment",
+        "Paiement d'aide financière gouvernementale",
+        "general",
+        True
+    ),
+    (
+        "application",
+        "demande",
+        "Request for government services or benefits",
+        "Demande de services ou prestations gouvernementaux",
+        "process",
+        True
+    ),
+    (
+        "eligibility",
+        "admissibilité",
+        "Meeting the requirements for a program or service",
+        "Satisfaire aux exigences d'un programme ou service",
+        "process",
+        True
+    ),
+    (
+        "tax return",
+        "déclaration de revenus",
+        "Annual report of income and taxes",
+        "Rapport annuel des revenus et impôts",
+        "document",
+        True
+    ),
+    (
+        "refund",
+        "remboursement",
+        "Money returned by the government",
+        "Argent retourné par le gouvernement",
+        "financial",
+        True
+    ),
+    (
+        "assessment",
+        "cotisation",
+        "Government evaluation of taxes owed or benefits",
+        "Évaluation gouvernementale des impôts dus ou prestations",
+        "process",
+        True
+    ),
+    (
+        "notice",
+        "avis",
+        "Official government communication",
+        "Communication officielle du gouvernement",
+        "document",
+        True
+    ),
+    (
+        "direct deposit",
+        "dépôt direct",
+        "Electronic transfer of payments to bank account",
+        "Transfert électronique de paiements au compte bancaire",
+        "process",
+        True
+    ),
+    (
+        "service",
+        "service",
+        "Government assistance or program offered to citizens",
+        "Aide ou programme gouvernemental offert aux citoyens",
+        "general",
+        True
+    ),
+    (
+        "immigration",
+        "immigration",
+        "Process of moving to Canada to live permanently",
+        "Processus de déménagement au Canada pour y vivre en permanence",
+        "process",
+        True
+    ),
+    (
+        "citizenship",
+        "citoyenneté",
+        "Legal status as a member of Canada",
+        "Statut légal de membre du Canada",
+        "status",
+        True
+    ),
+    (
+        "passport",
+        "passeport",
+        "Official travel document issued by the government",
+        "Document de voyage officiel émis par le gouvernement",
+        "document",
+        True
+    ),
+    (
+        "permit",
+        "permis",
+        "Official authorization for specific activities",
+        "Autorisation officielle pour des activités spécifiques",
+        "document",
+        True
+    ),
+    (
+        "registration",
+        "inscription",
+        "Process of signing up for government services",
+        "Processus d'inscription aux services gouvernementaux",
+        "process",
+        True
+    ),
+    (
+        "deadline",
+        "date limite",
+        "Final date for completing a requirement",
+        "Date finale pour compléter une exigence",
+        "time",
+        True
+    ),
+)
 
-# Common government terms for translation consistency
-GOVERNMENT_TERMS = [
-    {
-        "term_en": "Canada Revenue Agency",
-        "term_fr": "Agence du revenu du Canada",
-        "definition_en": "Federal agency responsible for tax collection",
-        "definition_fr": "Agence fédérale responsable de la perception des impôts",
-        "category": "organization",
-        "official": True
-    },
-    {
-        "term_en": "Employment Insurance",
-        "term_fr": "Assurance-emploi",
-        "definition_en": "Temporary income support for unemployed workers",
-        "definition_fr": "Soutien temporaire du revenu pour les travailleurs sans emploi",
-        "category": "program",
-        "official": True
-    },
-    {
-        "term_en": "Canada Pension Plan",
-        "term_fr": "Régime de pensions du Canada",
-        "definition_en": "Government pension program",
-        "definition_fr": "Programme de pension gouvernemental",
-        "category": "program",
-        "official": True
-    },
-    {
-        "term_en": "Social Insurance Number",
-        "term_fr": "Numéro d'assurance sociale",
-        "definition_en": "Nine-digit identification number",
-        "definition_fr": "Numéro d'identification à neuf chiffres",
-        "category": "document",
-        "official": True
-    },
-    {
-        "term_en": "Goods and Services Tax",
-        "term_fr": "Taxe sur les produits et services",
-        "definition_en": "Federal value-added tax",
-        "definition_fr": "Taxe fédérale sur la valeur ajoutée",
-        "category": "tax",
-        "official": True
-    },
-    {
-        "term_en": "Harmonized Sales Tax",
-        "term_fr": "Taxe de vente harmonisée",
-        "definition_en": "Combined federal and provincial sales tax",
-        "definition_fr": "Taxe de vente fédérale et provinciale combinée",
-        "category": "tax",
-        "official": True
-    },
-    {
-        "term_en": "Public Health Agency of Canada",
-        "term_fr": "Agence de la santé publique du Canada",
-        "definition_en": "Federal agency for public health",
-        "definition_fr": "Agence fédérale de la santé publique",
-        "category": "organization",
-        "official": True
-    },
-    {
-        "term_en": "Health Canada",
-        "term_fr": "Santé Canada",
-        "definition_en": "Federal department for health policy",
-        "definition_fr": "Ministère fédéral de la politique de santé",
-        "category": "organization",
-        "official": True
-    },
-    {
-        "term_en": "benefit",
-        "term_fr": "prestation",
-        "definition_en": "Government financial assistance payment",
-        "definition_fr": "Paiement d'aide financière gouvernementale",
-        "category": "general",
-        "official": True
-    },
-    {
-        "term_en": "application",
-        "term_fr": "demande",
-        "definition_en": "Request for government services or benefits",
-        "definition_fr": "Demande de services ou prestations gouvernementaux",
-        "category": "process",
-        "official": True
-    },
-    {
-        "term_en": "eligibility",
-        "term_fr": "admissibilité",
-        "definition_en": "Meeting the requirements for a program or service",
-        "definition_fr": "Satisfaire aux exigences d'un programme ou service",
-        "category": "process",
-        "official": True
-    },
-    {
-        "term_en": "tax return",
-        "term_fr": "déclaration de revenus",
-        "definition_en": "Annual report of income and taxes",
-        "definition_fr": "Rapport annuel des revenus et impôts",
-        "category": "document",
-        "official": True
-    },
-    {
-        "term_en": "refund",
-        "term_fr": "remboursement",
-        "definition_en": "Money returned by the government",
-        "definition_fr": "Argent retourné par le gouvernement",
-        "category": "financial",
-        "official": True
-    },
-    {
-        "term_en": "assessment",
-        "term_fr": "cotisation",
-        "definition_en": "Government evaluation of taxes owed or benefits",
-        "definition_fr": "Évaluation gouvernementale des impôts dus ou prestations",
-        "category": "process",
-        "official": True
-    },
-    {
-        "term_en": "notice",
-        "term_fr": "avis",
-        "definition_en": "Official government communication",
-        "definition_fr": "Communication officielle du gouvernement",
-        "category": "document",
-        "official": True
-    },
-    {
-        "term_en": "direct deposit",
-        "term_fr": "dépôt direct",
-        "definition_en": "Electronic transfer of payments to bank account",
-        "definition_fr": "Transfert électronique de paiements au compte bancaire",
-        "category": "process",
-        "official": True
-    },
-    {
-        "term_en": "service",
-        "term_fr": "service",
-        "definition_en": "Government assistance or program offered to citizens",
-        "definition_fr": "Aide ou programme gouvernemental offert aux citoyens",
-        "category": "general",
-        "official": True
-    },
-    {
-        "term_en": "immigration",
-        "term_fr": "immigration",
-        "definition_en": "Process of moving to Canada to live permanently",
-        "definition_fr": "Processus de déménagement au Canada pour y vivre en permanence",
-        "category": "process",
-        "official": True
-    },
-    {
-        "term_en": "citizenship",
-        "term_fr": "citoyenneté",
-        "definition_en": "Legal status as a member of Canada",
-        "definition_fr": "Statut légal de membre du Canada",
-        "category": "status",
-        "official": True
-    },
-    {
-        "term_en": "passport",
-        "term_fr": "passeport",
-        "definition_en": "Official travel document issued by the government",
-        "definition_fr": "Document de voyage officiel émis par le gouvernement",
-        "category": "document",
-        "official": True
-    },
-    {
-        "term_en": "permit",
-        "term_fr": "permis",
-        "definition_en": "Official authorization for specific activities",
-        "definition_fr": "Autorisation officielle pour des activités spécifiques",
-        "category": "document",
-        "official": True
-    },
-    {
-        "term_en": "registration",
-        "term_fr": "inscription",
-        "definition_en": "Process of signing up for government services",
-        "definition_fr": "Processus d'inscription aux services gouvernementaux",
-        "category": "process",
-        "official": True
-    },
-    {
-        "term_en": "deadline",
-        "term_fr": "date limite",
-        "definition_en": "Final date for completing a requirement",
-        "definition_fr": "Date finale pour compléter une exigence",
-        "category": "time",
-        "official": True
-    },
-]
+
+# The seeder can simply be re-run, so trade crash safety for write speed.
+# These settings last only for the connection, except WAL, which the server uses too.
+# No exclusive locking mode: a running server keeps reader connections open,
+# and under WAL those readers can coexist with the seeding write transaction.
+SEED_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+"""
+
+
+@contextmanager
+def _fast_connect(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Open a connection tuned for bulk seeding; commits on success and always closes.
+
+    The connection runs in autocommit mode so the sqlite3 module never
+    inspects statements to open implicit transactions; everything done
+    through it runs in one explicit BEGIN IMMEDIATE transaction instead.
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.executescript(SEED_PRAGMAS)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+    finally:
+        conn.close()
 
 
-def create_database(db_path: Path) -> None:
-    """Create the terminology database with initial schema."""
+@contextmanager
+def _use_connection(
+    db_path: Path, conn: sqlite3.Connection | None = None
+) -> Iterator[sqlite3.Connection]:
+    """Yield the caller's connection, or open a fast one for this step alone."""
+    if conn is not None:
+        yield conn
+    else:
+        with _fast_connect(db_path) as own_conn:
+            yield own_conn
+
+
+def _insert_rows(conn: sqlite3.Connection, sql: str, rows: Sequence[tuple[Any, ...]],
+                 label: str) -> None:
+    """Insert rows with one executemany, falling back to per-row inserts on error."""
+    # A savepoint lets a failed batch be undone without discarding the rest
+    # of a shared transaction
+    conn.execute("SAVEPOINT seed_rows")
+    try:
+        conn.executemany(sql, rows)
+    except sqlite3.Error:
+        # Redo row by row so the offending rows can be reported
+        conn.execute("ROLLBACK TO seed_rows")
+        for row in rows:
+            try:
+                conn.execute(sql, row)
+            except sqlite3.Error as e:
+                print(f"❌ Failed to insert {label} {row[0]}: {e}")
+    conn.execute("RELEASE seed_rows")
+
+
+def create_schema(db_path: Path, conn: sqlite3.Connection | None = None) -> None:
+    """Create the terminology tables (without secondary indexes).
+
+    Indexes are built by create_indexes() once the bulk seed is in, so the
+    inserts don't pay per-row B-tree maintenance. Callers seeding the same
+    database repeatedly in small increments should call create_indexes() once
+    up front instead.
+    """
     print(f"Creating database at {db_path}")
 
     # Ensure directory exists
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
+    with _use_connection(db_path, conn) as db:
+        cursor = db.cursor()
 
-        # Drop acronyms tables created with the old single-column UNIQUE
-        # constraint, which collapsed bilingual rows; CREATE TABLE IF NOT
-        # EXISTS alone would silently keep the stale schema.
-        cursor.execute(
-            "SELECT sql FROM sqlite_master WHERE type='table' AND name='acronyms'")
-        existing = cursor.fetchone()
-        if existing and existing[0] and "UNIQUE(acronym, language)" not in existing[0]:
-            cursor.execute("DROP TABLE acronyms")
+        # Drop tables created before their current UNIQUE constraint: old
+        # acronyms tables collapsed bilingual rows, and old terms tables had
+        # none, so each run appended duplicates. CREATE TABLE IF NOT EXISTS
+        # alone would silently keep the stale schema.
+        for table, constraint in (("acronyms", "UNIQUE(acronym, language)"),
+                                  ("terms", "UNIQUE(term_en, term_fr)")):
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,))
+            existing = cursor.fetchone()
+            if existing and existing[0] and constraint not in existing[0]:
+                cursor.execute(f"DROP TABLE {table}")
 
         # Create acronyms table
         cursor.execute("""
@@ -861,90 +944,85 @@ def create_database(db_path: Path) -> None:
                 definition_fr TEXT,
                 category TEXT,
                 official BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(term_en, term_fr)
             )
         """)
 
-        # Create indexes for faster lookups
+        print("✅ Database schema created")
+
+
+def create_indexes(db_path: Path, conn: sqlite3.Connection | None = None) -> None:
+    """Create lookup indexes and refresh planner statistics."""
+    with _use_connection(db_path, conn) as db:
+        cursor = db.cursor()
+
+        # Create indexes for faster lookups; term_en lookups use the
+        # UNIQUE(term_en, term_fr) index
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_acronym ON acronyms(acronym)")
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_term_en ON terms(term_en)")
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_term_fr ON terms(term_fr)")
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_language ON acronyms(language)")
+        cursor.execute("ANALYZE")
 
-        conn.commit()
-        print("✅ Database schema created")
-
+        print("✅ Indexes created")
 
-def seed_acronyms(db_path: Path, acronyms: List[Dict[str, Any]]) -> None:
-    """Seed the database with acronym data."""
-    print(f"Seeding {len(acronyms)} acronyms...")
 
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
+def seed_acronyms(db_path: Path, rows: Sequence[tuple[Any, ...]],
+                  conn: sqlite3.Connection | None = None) -> None:
+    """Seed the database with acronym rows in ACRONYM_COLUMNS order."""
+    print(f"Seeding {len(rows)} acronyms...")
 
-        for acronym_data in acronyms:
-            try:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO acronyms 
-                    (acronym, expansion, definition, source_url, language)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    acronym_data["acronym"],
-                    acronym_data["expansion"],
-                    acronym_data["definition"],
-                    acronym_data["source_url"],
-                    acronym_data["language"]
-                ))
-            except sqlite3.Error as e:
-                print(
-                    f"❌ Failed to insert acronym {acronym_data['acronym']}: {e}")
+    sql = """
+        INSERT OR REPLACE INTO acronyms
+        (acronym, expansion, definition, source_url, language)
+        VALUES (?, ?, ?, ?, ?)
+    """
 
-        conn.commit()
+    with _use_connection(db_path, conn) as db:
+        _insert_rows(db, sql, rows, "acronym")
         print("✅ Acronyms seeded")
 
 
-def seed_terms(db_path: Path, terms: List[Dict[str, Any]]) -> None:
-    """Seed the database with translation term data."""
-    print(f"Seeding {len(terms)} terms...")
-
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
+def seed_terms(db_path: Path, rows: Sequence[tuple[Any, ...]],
+               conn: sqlite3.Connection | None = None) -> None:
+    """Seed the database with translation term rows in TERM_COLUMNS order."""
+    print(f"Seeding {len(rows)} terms...")
 
-        for term_data in terms:
-            try:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO terms 
-                    (term_en, term_fr, definition_en, definition_fr, category, official)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    term_data["term_en"],
-                    term_data["term_fr"],
-                    term_data["definition_en"],
-                    term_data["definition_fr"],
-                    term_data["category"],
-                    term_data["official"]
-                ))
-            except sqlite3.Error as e:
-                print(f"❌ Failed to insert term {term_data['term_en']}: {e}")
+    sql = """
+        INSERT INTO terms
+        (term_en, term_fr, definition_en, definition_fr, category, official)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(term_en, term_fr) DO UPDATE SET
+            definition_en = excluded.definition_en,
+            definition_fr = excluded.definition_fr,
+            category = excluded.category,
+            official = excluded.official
+    """
 
-        conn.commit()
+    with _use_connection(db_path, conn) as db:
+        _insert_rows(db, sql, rows, "term")
         print("✅ Terms seeded")
 
 
-def load_custom_data(file_path: Path) -> List[Dict[str, Any]]:
+def as_rows(records: list[dict[str, Any]], columns: tuple[str, ...]) -> list[tuple[Any, ...]]:
+    """Convert JSON objects (e.g. from load_custom_data) into seed rows."""
+    return [tuple(record[column] for column in columns) for record in records]
+
+
+def load_custom_data(file_path: Path) -> list[dict[str, Any]]:
     """Load custom acronym/term data from JSON file."""
     if not file_path.exists():
         return []
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            print(f"📄 Loaded {len(data)} items from {file_path}")
-            return data
+        raw = file_path.read_bytes()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        print(f"📄 Loaded {len(data)} items from {file_path}")
+        return data
     except (json.JSONDecodeError, FileNotFoundError) as e:
         print(f"❌ Failed to load {file_path}: {e}")
         return []
@@ -952,20 +1030,16 @@ def load_custom_data(file_path: Path) -> List[Dict[str, Any]]:
 
 def print_stats(db_path: Path) -> None:
     """Print database statistics."""
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM acronyms")
-        acronym_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM terms")
-        term_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM acronyms WHERE language = 'en'")
-        en_acronym_count = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM acronyms WHERE language = 'fr'")
-        fr_acronym_count = cursor.fetchone()[0]
+    # Read-only: a plain connection, with no write transaction to contend for
+    with closing(sqlite3.connect(db_path)) as conn:
+        # One pass over idx_language yields every per-language count
+        language_counts = dict(conn.execute(
+            "SELECT language, COUNT(*) FROM acronyms GROUP BY language").fetchall())
+        acronym_count = sum(language_counts.values())
+        en_acronym_count = language_counts.get("en", 0)
+        fr_acronym_count = language_counts.get("fr", 0)
+        term_count = conn.execute(
+            "SELECT COUNT(*) FROM terms").fetchone()[0]
 
         print("\n📊 Database Statistics:")
         print(f"   Total acronyms: {acronym_count}")
@@ -974,6 +1048,13 @@ def print_stats(db_path: Path) -> None:
         print(f"   Translation terms: {term_count}")
 
 
+def _exit_db_busy(db_path: Path, error: sqlite3.OperationalError) -> None:
+    """Report a database another process holds locked, then exit."""
+    print(f"❌ Could not use {db_path}: {error}")
+    print("Stop the MapleClear server (or any other process using the database) and retry.")
+    sys.exit(1)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -1004,7 +1085,10 @@ def main():
 
     if args.stats_only:
         if args.out.exists():
-            print_stats(args.out)
+            try:
+                print_stats(args.out)
+            except sqlite3.OperationalError as e:
+                _exit_db_busy(args.out, e)
         else:
             print(f"❌ Database not found: {args.out}")
         return
@@ -1012,23 +1096,30 @@ def main():
     print("🍁 MapleClear Terminology Database Seeder")
     print("=" * 50)
 
-    create_database(args.out)
-
-    all_acronyms = GOVERNMENT_ACRONYMS.copy()
-    all_terms = GOVERNMENT_TERMS.copy()
+    all_acronyms = list(GOVERNMENT_ACRONYMS)
+    all_terms = list(GOVERNMENT_TERMS)
 
     if args.custom_acronyms:
         custom_acronyms = load_custom_data(args.custom_acronyms)
-        all_acronyms.extend(custom_acronyms)
+        all_acronyms.extend(as_rows(custom_acronyms, ACRONYM_COLUMNS))
 
     if args.custom_terms:
         custom_terms = load_custom_data(args.custom_terms)
-        all_terms.extend(custom_terms)
+        all_terms.extend(as_rows(custom_terms, TERM_COLUMNS))
 
-    seed_acronyms(args.out, all_acronyms)
-    seed_terms(args.out, all_terms)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        # Build the whole database in one connection and one transaction
+        with _fast_connect(args.out) as conn:
+            create_schema(args.out, conn)
+            seed_acronyms(args.out, all_acronyms, conn)
+            seed_terms(args.out, all_terms, conn)
+            create_indexes(args.out, conn)
 
-    print_stats(args.out)
+        print_stats(args.out)
+    except sqlite3.OperationalError as e:
+        _exit_db_busy(args.out, e)
 
     print(f"\n✅ Database seeded successfully: {args.out}")
     print("Use --stats-only to view statistics anytime")